@@ -0,0 +1,130 @@
+from array import array
+from collections import deque
+from typing import List, Optional, Tuple
+
+from labyrinthe import Labyrinthe, TypeCellule
+
+
+class IndexArbre:
+    """Index d'un labyrinthe parfait pour les requêtes point à point
+
+    Un labyrinthe parfait (celui du backtracker) est un arbre couvrant : il
+    existe un unique chemin entre deux cellules. L'index enracine chaque
+    composante par un parcours en largeur (parents, profondeurs) puis
+    construit les tables de binary lifting : ancetres[k][v] est l'ancêtre
+    de v situé 2^k niveaux plus haut. Le plus proche ancêtre commun, et donc
+    la longueur du chemin, s'obtient en O(log n) ; le chemin lui-même en
+    O(longueur du chemin). Lève ValueError si le labyrinthe contient un cycle.
+    """
+    def __init__(self, labyrinthe: Labyrinthe, racine: Optional[Tuple[int, int]] = None):
+        self.labyrinthe = labyrinthe
+        masques = labyrinthe.masques
+        decalages_par_masque = labyrinthe.decalages_par_masque
+        nombre_cellules = len(masques)
+
+        # Les murs restent leur propre parent, en profondeur -1 et hors de toute composante
+        self.parents = array('i', range(nombre_cellules))
+        self.profondeurs = array('i', [-1]) * nombre_cellules
+        self.composantes = array('i', [-1]) * nombre_cellules
+
+        mur = int(TypeCellule.MUR)
+        grille = labyrinthe.grille
+        racines = [labyrinthe.index(*(racine or labyrinthe.depart))]
+        racines.extend(index for index in range(nombre_cellules) if grille[index] != mur)
+        nombre_composantes = 0
+        profondeur_max = 0
+        for depart in racines:
+            if self.composantes[depart] != -1 or grille[depart] == mur:
+                continue
+
+            self.composantes[depart] = nombre_composantes
+            self.profondeurs[depart] = 0
+            file = deque([depart])
+            while file:
+                courant = file.popleft()
+                profondeur = self.profondeurs[courant] + 1
+                for decalage in decalages_par_masque[masques[courant]]:
+                    voisin = courant + decalage
+                    if voisin == self.parents[courant]:
+                        continue
+                    if self.composantes[voisin] != -1:
+                        raise ValueError("Le labyrinthe contient un cycle : il n'est pas parfait")
+                    self.composantes[voisin] = nombre_composantes
+                    self.parents[voisin] = courant
+                    self.profondeurs[voisin] = profondeur
+                    file.append(voisin)
+                profondeur_max = max(profondeur_max, profondeur - 1)
+            nombre_composantes += 1
+
+        # Tables de binary lifting (la racine est son propre ancêtre)
+        self.ancetres = [self.parents]
+        for _ in range(max(1, profondeur_max.bit_length()) - 1):
+            precedent = self.ancetres[-1]
+            self.ancetres.append(array('i', [precedent[ancetre] for ancetre in precedent]))
+
+    def ancetre_commun(self, a: int, b: int) -> int:
+        """Plus proche ancêtre commun de deux cellules (indices), -1 si elles ne sont pas reliées"""
+        composantes = self.composantes
+        if composantes[a] == -1 or composantes[a] != composantes[b]:
+            return -1
+
+        profondeurs = self.profondeurs
+        if profondeurs[a] < profondeurs[b]:
+            a, b = b, a
+
+        # Remonter a à la profondeur de b
+        ecart = profondeurs[a] - profondeurs[b]
+        niveau = 0
+        while ecart:
+            if ecart & 1:
+                a = self.ancetres[niveau][a]
+            ecart >>= 1
+            niveau += 1
+        if a == b:
+            return a
+
+        for ancetres in reversed(self.ancetres):
+            if ancetres[a] != ancetres[b]:
+                a, b = ancetres[a], ancetres[b]
+        return self.parents[a]
+
+    def longueur_chemin(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> int:
+        """Nombre de pas du chemin unique entre deux cellules, -1 si elles ne sont pas reliées"""
+        a = self.labyrinthe.index(*depart)
+        b = self.labyrinthe.index(*arrivee)
+        ancetre = self.ancetre_commun(a, b)
+        if ancetre == -1:
+            return -1
+        profondeurs = self.profondeurs
+        return profondeurs[a] + profondeurs[b] - 2 * profondeurs[ancetre]
+
+    def chemin(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Chemin unique de `depart` à `arrivee` (vide si elles ne sont pas reliées)"""
+        a = self.labyrinthe.index(*depart)
+        b = self.labyrinthe.index(*arrivee)
+        ancetre = self.ancetre_commun(a, b)
+        if ancetre == -1:
+            return []
+
+        parents = self.parents
+        montee = []
+        while a != ancetre:
+            montee.append(a)
+            a = parents[a]
+        descente = []
+        while b != ancetre:
+            descente.append(b)
+            b = parents[b]
+
+        montee.append(ancetre)
+        montee.extend(reversed(descente))
+        position = self.labyrinthe.position
+        return [position(index) for index in montee]
+
+def index_arbre(labyrinthe: Labyrinthe) -> IndexArbre:
+    """Index arborescent mis en cache sur le labyrinthe (reconstruit si la grille change)"""
+    index = labyrinthe.cache_pretraitements.get('arbre')
+    if index is None:
+        index = IndexArbre(labyrinthe)
+        labyrinthe.cache_pretraitements['arbre'] = index
+    return index
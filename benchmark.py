@@ -0,0 +1,547 @@
+"""Bancs d'essai du cœur algorithmique (sans pygame)
+
+Usage : python benchmark.py [nom_du_banc ...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from arbre import IndexArbre
+from cache_labyrinthes import CacheLabyrinthes
+from export_donnees import MANIFESTE, exporter
+from fichier_labyrinthe import charger, enregistrer, ouvrir
+from foule import Foule, champ_flux
+from generation_lignes import lignes_eller
+from generation_tuiles import generer_tuiles
+from hierarchique import GrapheHierarchique, RechercheHierarchique, graphe_hierarchique
+from heuristiques import HEURISTIQUES, STRATEGIES_REPERES, Reperes
+from jonctions import graphe_jonctions
+from labyrinthe import TAILLES_DIFFICULTE, Labyrinthe, TypeCellule
+from replanification import RechercheIncrementale
+from resolution_lots import mesurer_debit, resoudre_lot
+from solveur import DEPARTAGES, GLOUTON, RechercheAStar, resoudre_a_star
+
+NOMBRE_LABYRINTHES = 20
+GRAINE = 42
+# Grilles carrées du banc hiérarchique (5000 fonctionne aussi, mais la génération prend plusieurs minutes)
+TAILLES_GRANDES = (250, 500, 1000)
+
+
+def generer_labyrinthes(largeur: int, hauteur: int, nombre: int = NOMBRE_LABYRINTHES):
+    random.seed(GRAINE)
+    return [Labyrinthe(largeur, hauteur) for _ in range(nombre)]
+
+def ouvrir_labyrinthe(labyrinthe: Labyrinthe, proportion: float):
+    """Retire au hasard une proportion des murs intérieurs (labyrinthe tressé, ou salle ouverte à 1.0)"""
+    largeur, hauteur = labyrinthe.largeur, labyrinthe.hauteur
+    murs = [labyrinthe.index(x, y) for y in range(1, hauteur - 1) for x in range(1, largeur - 1)
+            if labyrinthe.grille[labyrinthe.index(x, y)] == TypeCellule.MUR]
+    for index in random.sample(murs, int(len(murs) * proportion)):
+        labyrinthe.grille[index] = TypeCellule.VIDE
+    labyrinthe.calculer_masques()
+    return labyrinthe
+
+def bench_expansions():
+    """Débit de A* en nœuds développés par seconde, pour chaque difficulté"""
+    print(f"{'Difficulté':<12}{'Taille':>10}{'Nœuds':>10}{'Temps (ms)':>12}{'Nœuds/s':>14}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        labyrinthes = generer_labyrinthes(largeur, hauteur)
+
+        noeuds = 0
+        debut = time.perf_counter()
+        for labyrinthe in labyrinthes:
+            _, statistiques = resoudre_a_star(labyrinthe)
+            noeuds += statistiques['noeuds_explores']
+        duree = time.perf_counter() - debut
+
+        print(f"{nom:<12}{f'{largeur}x{hauteur}':>10}{noeuds:>10}{duree * 1000:>12.1f}{noeuds / duree:>14.0f}")
+
+def bench_bidirectionnel():
+    """Nœuds développés : A* classique contre A* bidirectionnel"""
+    print(f"{'Difficulté':<12}{'A*':>10}{'Bidir.':>10}{'Ratio':>8}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        noeuds = {'a_star': 0, 'bidirectionnel': 0}
+        for labyrinthe in generer_labyrinthes(largeur, hauteur):
+            for algorithme in noeuds:
+                _, statistiques = resoudre_a_star(labyrinthe, algorithme=algorithme)
+                noeuds[algorithme] += statistiques['noeuds_explores']
+
+        ratio = noeuds['bidirectionnel'] / max(1, noeuds['a_star'])
+        print(f"{nom:<12}{noeuds['a_star']:>10}{noeuds['bidirectionnel']:>10}{ratio:>8.2f}")
+
+def bench_jonctions():
+    """A* sur la grille contre A* sur le graphe des jonctions (construction du graphe à part)"""
+    print(f"{'Difficulté':<12}{'Nœuds A*':>10}{'Jonctions':>11}{'Graphe':>8}"
+          f"{'A* (ms)':>10}{'Constr. (ms)':>14}{'Requête (ms)':>14}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        noeuds_grille = noeuds_jonctions = taille_graphe = 0
+        duree_grille = duree_construction = duree_requete = 0.0
+        for labyrinthe in generer_labyrinthes(largeur, hauteur):
+            chemin_grille, statistiques = resoudre_a_star(labyrinthe)
+            noeuds_grille += statistiques['noeuds_explores']
+            duree_grille += statistiques['temps_execution']
+
+            debut = time.perf_counter()
+            taille_graphe += graphe_jonctions(labyrinthe, labyrinthe.depart, labyrinthe.arrivee).nombre_noeuds
+            duree_construction += time.perf_counter() - debut
+
+            chemin, statistiques = resoudre_a_star(labyrinthe, algorithme='jonctions')
+            assert chemin == chemin_grille
+            noeuds_jonctions += statistiques['noeuds_explores']
+            duree_requete += statistiques['temps_execution']
+
+        print(f"{nom:<12}{noeuds_grille:>10}{noeuds_jonctions:>11}{taille_graphe:>8}"
+              f"{duree_grille * 1000:>10.1f}{duree_construction * 1000:>14.1f}{duree_requete * 1000:>14.1f}")
+
+def bench_arbre():
+    """Requêtes point à point aléatoires : A* contre l'index arborescent (LCA)"""
+    requetes_par_labyrinthe = 200
+    print(f"{'Difficulté':<12}{'Index (ms)':>12}{'A* req/s':>12}{'Longueur req/s':>16}{'Chemin req/s':>14}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        duree_index = duree_a_star = duree_longueur = duree_chemin = 0.0
+        requetes = requetes_a_star = 0
+        for labyrinthe in generer_labyrinthes(largeur, hauteur, 5):
+            debut = time.perf_counter()
+            index = IndexArbre(labyrinthe)
+            duree_index += time.perf_counter() - debut
+
+            libres = [labyrinthe.position(i) for i in range(len(labyrinthe.masques)) if labyrinthe.masques[i]]
+            paires = [(random.choice(libres), random.choice(libres)) for _ in range(requetes_par_labyrinthe)]
+            requetes += len(paires)
+
+            debut = time.perf_counter()
+            for depart, arrivee in paires:
+                index.longueur_chemin(depart, arrivee)
+            duree_longueur += time.perf_counter() - debut
+
+            debut = time.perf_counter()
+            for depart, arrivee in paires:
+                index.chemin(depart, arrivee)
+            duree_chemin += time.perf_counter() - debut
+
+            # A* est bien plus lent : un échantillon suffit
+            debut = time.perf_counter()
+            for depart, arrivee in paires[:20]:
+                resoudre_a_star(labyrinthe, depart, arrivee)
+            duree_a_star += time.perf_counter() - debut
+            requetes_a_star += 20
+
+        print(f"{nom:<12}{duree_index * 1000 / 5:>12.1f}{requetes_a_star / duree_a_star:>12.0f}"
+              f"{requetes / duree_longueur:>16.0f}{requetes / duree_chemin:>14.0f}")
+
+def bench_heuristiques():
+    """Nœuds développés par A* selon l'heuristique, pour chaque difficulté"""
+    print(f"{'Difficulté':<12}" + "".join(f"{nom:>14}" for nom in HEURISTIQUES))
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        noeuds = dict.fromkeys(HEURISTIQUES, 0)
+        for labyrinthe in generer_labyrinthes(largeur, hauteur):
+            for heuristique in HEURISTIQUES:
+                _, statistiques = resoudre_a_star(labyrinthe, heuristique=heuristique)
+                noeuds[heuristique] += statistiques['noeuds_explores']
+        print(f"{nom:<12}" + "".join(f"{noeuds[heuristique]:>14}" for heuristique in HEURISTIQUES))
+
+def bench_reperes():
+    """Requêtes aléatoires : nœuds développés par A* avec Manhattan contre ALT selon la stratégie de repères"""
+    paires_par_labyrinthe = 20
+    colonnes = ('manhattan',) + STRATEGIES_REPERES
+    print(f"{'Difficulté':<12}" + "".join(f"{nom:>12}" for nom in colonnes) + f"{'Précalc. (ms)':>15}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        noeuds = dict.fromkeys(colonnes, 0)
+        duree_precalcul = 0.0
+        for labyrinthe in generer_labyrinthes(largeur, hauteur, 5):
+            libres = [labyrinthe.position(i) for i in range(len(labyrinthe.masques)) if labyrinthe.masques[i]]
+            paires = [(random.choice(libres), random.choice(libres)) for _ in range(paires_par_labyrinthe)]
+
+            for depart, arrivee in paires:
+                _, statistiques = resoudre_a_star(labyrinthe, depart, arrivee)
+                noeuds['manhattan'] += statistiques['noeuds_explores']
+
+            for strategie in STRATEGIES_REPERES:
+                debut = time.perf_counter()
+                reperes = Reperes(labyrinthe, strategie=strategie, graine=0)
+                duree_precalcul += time.perf_counter() - debut
+
+                for depart, arrivee in paires:
+                    recherche = RechercheAStar(labyrinthe, depart, arrivee)
+                    recherche.heuristique = reperes.fonction_vers(arrivee)
+                    recherche.executer()
+                    noeuds[strategie] += recherche.noeuds_explores
+
+        print(f"{nom:<12}" + "".join(f"{noeuds[colonne]:>12}" for colonne in colonnes)
+              + f"{duree_precalcul * 1000 / (5 * len(STRATEGIES_REPERES)):>15.1f}")
+
+def bench_incremental():
+    """Murs basculés un par un : réparation D* Lite contre A* relancé de zéro après chaque modification"""
+    modifications_par_labyrinthe = 50
+    print(f"{'Difficulté':<12}{'Nœuds A*':>10}{'Nœuds D*':>10}{'A* (ms)':>10}{'D* (ms)':>10}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        noeuds_a_star = noeuds_incremental = 0
+        duree_a_star = duree_incremental = 0.0
+        for labyrinthe in generer_labyrinthes(largeur, hauteur, 5):
+            recherche = RechercheIncrementale(labyrinthe)
+            recherche.executer()
+            modifications = 0
+            while modifications < modifications_par_labyrinthe:
+                x, y = random.randrange(1, largeur - 1), random.randrange(1, hauteur - 1)
+                if (x, y) in (labyrinthe.depart, labyrinthe.arrivee):
+                    continue
+                modifications += 1
+
+                debut = time.perf_counter()
+                recherche.signaler_modifications(labyrinthe.basculer_mur(x, y))
+                recherche.executer()
+                duree_incremental += time.perf_counter() - debut
+                noeuds_incremental += recherche.noeuds_explores
+
+                chemin, statistiques = resoudre_a_star(labyrinthe)
+                noeuds_a_star += statistiques['noeuds_explores']
+                duree_a_star += statistiques['temps_execution']
+                # La réparation doit retrouver un plus court chemin (ou aucun, comme A*)
+                assert len(recherche.chemin) == len(chemin)
+
+        print(f"{nom:<12}{noeuds_a_star:>10}{noeuds_incremental:>10}"
+              f"{duree_a_star * 1000:>10.1f}{duree_incremental * 1000:>10.1f}")
+
+def bench_jps():
+    """Nœuds développés et temps : A* contre Jump Point Search, du labyrinthe parfait à la salle ouverte"""
+    print(f"{'Difficulté':<12}{'Ouverture':>10}{'Nœuds A*':>10}{'Nœuds JPS':>11}{'A* (ms)':>10}{'JPS (ms)':>10}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        for proportion in (0.0, 0.3, 1.0):
+            noeuds = {'a_star': 0, 'jps': 0}
+            durees = {'a_star': 0.0, 'jps': 0.0}
+            for labyrinthe in generer_labyrinthes(largeur, hauteur, 10):
+                ouvrir_labyrinthe(labyrinthe, proportion)
+                chemins = {}
+                for algorithme in noeuds:
+                    chemins[algorithme], statistiques = resoudre_a_star(labyrinthe, algorithme=algorithme)
+                    noeuds[algorithme] += statistiques['noeuds_explores']
+                    durees[algorithme] += statistiques['temps_execution']
+                assert len(chemins['jps']) == len(chemins['a_star'])
+
+            print(f"{nom:<12}{proportion:>10.0%}{noeuds['a_star']:>10}{noeuds['jps']:>11}"
+                  f"{durees['a_star'] * 1000:>10.1f}{durees['jps'] * 1000:>10.1f}")
+
+def bench_hierarchique():
+    """Grandes grilles : latence des requêtes A* contre HPA*, construction et reconstruction incrémentale"""
+    requetes = 10
+    print(f"{'Taille':>10}{'Constr. (s)':>13}{'Recons. (ms)':>14}{'A* (ms)':>10}{'HPA* (ms)':>11}{'Surcoût':>9}")
+    for cote in TAILLES_GRANDES:
+        labyrinthe = generer_labyrinthes(cote, cote, 1)[0]
+        ouvrir_labyrinthe(labyrinthe, 0.1)
+
+        debut = time.perf_counter()
+        graphe = graphe_hierarchique(labyrinthe)
+        duree_construction = time.perf_counter() - debut
+
+        # Murs basculés un par un : seuls les clusters touchés sont reconstruits
+        debut = time.perf_counter()
+        for _ in range(requetes):
+            x, y = random.randrange(1, cote - 1), random.randrange(1, cote - 1)
+            if (x, y) not in (labyrinthe.depart, labyrinthe.arrivee):
+                graphe.signaler_modifications(labyrinthe.basculer_mur(x, y))
+        duree_reconstruction = (time.perf_counter() - debut) / requetes
+        # Le graphe reconstruit par morceaux doit être celui d'une construction complète
+        assert ({noeud: sorted(arcs) for noeud, arcs in graphe.adjacence.items()} ==
+                {noeud: sorted(arcs) for noeud, arcs in GrapheHierarchique(labyrinthe).adjacence.items()})
+
+        libres = [labyrinthe.position(i) for i in range(len(labyrinthe.masques)) if labyrinthe.masques[i]]
+        paires = [(random.choice(libres), random.choice(libres)) for _ in range(requetes)]
+        duree_a_star = duree_hierarchique = 0.0
+        longueur_a_star = longueur_hierarchique = 0
+        for depart, arrivee in paires:
+            chemin, statistiques = resoudre_a_star(labyrinthe, depart, arrivee)
+            duree_a_star += statistiques['temps_execution']
+            longueur_a_star += len(chemin)
+
+            debut = time.perf_counter()
+            chemin = RechercheHierarchique(labyrinthe, depart, arrivee).executer()
+            duree_hierarchique += time.perf_counter() - debut
+            longueur_hierarchique += len(chemin)
+
+        print(f"{f'{cote}x{cote}':>10}{duree_construction:>13.1f}{duree_reconstruction * 1000:>14.1f}"
+              f"{duree_a_star * 1000 / requetes:>10.1f}{duree_hierarchique * 1000 / requetes:>11.1f}"
+              f"{longueur_hierarchique / max(1, longueur_a_star) - 1:>9.2%}")
+
+def bench_memoire():
+    """Grandes grilles, requêtes locales : pic mémoire (tracemalloc) de A* contre IDA* à mémoire bornée
+
+    A* alloue ses tableaux à la taille de la grille ; IDA* ne mémorise que
+    sa pile, son chemin et une table de transposition plafonnée, et paie en
+    redéveloppements.
+    """
+    requetes = 5
+    print(f"{'Taille':>10}{'Pic A* (Ko)':>13}{'Pic IDA* (Ko)':>15}"
+          f"{'Nœuds A*':>10}{'Nœuds IDA*':>12}{'A* (ms)':>10}{'IDA* (ms)':>11}")
+    for cote in TAILLES_GRANDES:
+        labyrinthe = generer_labyrinthes(cote, cote, 1)[0]
+        ouvrir_labyrinthe(labyrinthe, 0.1)
+        libres = [labyrinthe.position(i) for i in range(len(labyrinthe.masques)) if labyrinthe.masques[i]]
+
+        pics = {'a_star': 0, 'ida_star': 0}
+        noeuds = {'a_star': 0, 'ida_star': 0}
+        durees = {'a_star': 0.0, 'ida_star': 0.0}
+        for _ in range(requetes):
+            # Arrivée tirée à au plus 20 cellules du départ sur chaque axe
+            depart = random.choice(libres)
+            while True:
+                arrivee = (depart[0] + random.randint(-20, 20), depart[1] + random.randint(-20, 20))
+                if labyrinthe.est_valide(*arrivee):
+                    break
+
+            for algorithme in pics:
+                _, statistiques = resoudre_a_star(labyrinthe, depart, arrivee, algorithme=algorithme)
+                noeuds[algorithme] += statistiques['noeuds_explores']
+                durees[algorithme] += statistiques['temps_execution']
+
+                # Deuxième passe sous tracemalloc, qui ralentit l'exécution
+                tracemalloc.start()
+                resoudre_a_star(labyrinthe, depart, arrivee, algorithme=algorithme)
+                pics[algorithme] = max(pics[algorithme], tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+
+        print(f"{f'{cote}x{cote}':>10}{pics['a_star'] / 1024:>13.1f}{pics['ida_star'] / 1024:>15.1f}"
+              f"{noeuds['a_star']:>10}{noeuds['ida_star']:>12}"
+              f"{durees['a_star'] * 1000 / requetes:>10.1f}{durees['ida_star'] * 1000 / requetes:>11.1f}")
+
+def bench_seaux():
+    """Liste ouverte : tas heapq contre file à seaux de Dial, au même départage (plus grand g à f égal)"""
+    print(f"{'Difficulté':<12}{'Ouverture':>10}{'Nœuds tas':>11}{'Nœuds seaux':>13}{'Tas (ms)':>10}{'Seaux (ms)':>12}")
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        for proportion in (0.0, 0.3):
+            noeuds = {'a_star': 0, 'a_star_seaux': 0}
+            durees = {'a_star': 0.0, 'a_star_seaux': 0.0}
+            for labyrinthe in generer_labyrinthes(largeur, hauteur):
+                ouvrir_labyrinthe(labyrinthe, proportion)
+                chemins = {}
+                for algorithme in noeuds:
+                    chemins[algorithme], statistiques = resoudre_a_star(labyrinthe, algorithme=algorithme,
+                                                                        departage='g_max')
+                    noeuds[algorithme] += statistiques['noeuds_explores']
+                    durees[algorithme] += statistiques['temps_execution']
+                assert len(chemins['a_star_seaux']) == len(chemins['a_star'])
+
+            print(f"{nom:<12}{proportion:>10.0%}{noeuds['a_star']:>11}{noeuds['a_star_seaux']:>13}"
+                  f"{durees['a_star'] * 1000:>10.1f}{durees['a_star_seaux'] * 1000:>12.1f}")
+
+def bench_departage():
+    """Départage des f égaux et A* pondéré : nœuds développés, efficacité et surcoût du chemin"""
+    reglages = [(departage, 1) for departage in DEPARTAGES] + \
+        [('g_max', poids) for poids in (1.5, 2, 5, GLOUTON)]
+    for nom, (largeur, hauteur) in TAILLES_DIFFICULTE.items():
+        for proportion in (0.0, 0.3):
+            labyrinthes = list(generer_labyrinthes(largeur, hauteur))
+            for labyrinthe in labyrinthes:
+                ouvrir_labyrinthe(labyrinthe, proportion)
+            optimaux = [len(resoudre_a_star(labyrinthe)[0]) for labyrinthe in labyrinthes]
+
+            print(f"{nom} ({largeur}x{hauteur}), {proportion:.0%} de murs ouverts")
+            print(f"  {'Départage':<10}{'Poids':>7}{'Nœuds':>9}{'Efficacité':>12}{'Surcoût':>10}{'Temps (ms)':>12}")
+            for departage, poids in reglages:
+                noeuds, efficacite, duree, longueur = 0, 0.0, 0.0, 0
+                for labyrinthe in labyrinthes:
+                    chemin, statistiques = resoudre_a_star(labyrinthe, departage=departage, poids=poids)
+                    noeuds += statistiques['noeuds_explores']
+                    efficacite += statistiques['efficacite']
+                    duree += statistiques['temps_execution']
+                    longueur += len(chemin)
+                print(f"  {departage:<10}{poids:>7}{noeuds:>9}{efficacite / len(labyrinthes):>11.1f}%"
+                      f"{longueur / sum(optimaux) - 1:>10.1%}{duree * 1000:>12.1f}")
+
+def bench_foule():
+    """Mode foule : champ de flux partagé et pas de simulation de toute la foule (budget 60 FPS : 16,7 ms)"""
+    largeur, hauteur = TAILLES_DIFFICULTE['EXTREME']
+    print(f"{'Grille':<12}{'Agents':>9}{'Champ (ms)':>12}{'Pas':>7}{'ms / pas':>10}{'Occupation (ms)':>17}")
+    for taille, nombre in (((largeur, hauteur), 10000), ((largeur, hauteur), 100000), ((500, 500), 100000)):
+        labyrinthe = Labyrinthe(*taille)
+        debut = time.perf_counter()
+        champ_flux(labyrinthe, labyrinthe.arrivee)
+        duree_champ = time.perf_counter() - debut
+
+        foule = Foule(labyrinthe, nombre, graine=0)
+        pas, duree_pas, duree_occupation = 0, 0.0, 0.0
+        # Quelques centaines de pas suffisent à la mesure (les grandes grilles en demandent des dizaines de milliers)
+        while not foule.termine and pas < 200:
+            debut = time.perf_counter()
+            foule.avancer()
+            duree_pas += time.perf_counter() - debut
+            debut = time.perf_counter()
+            foule.occupation()
+            duree_occupation += time.perf_counter() - debut
+            pas += 1
+
+        print(f"{taille[0]}x{taille[1]:<8}{nombre:>9}{duree_champ * 1000:>12.1f}{pas:>7}"
+              f"{duree_pas * 1000 / max(1, pas):>10.2f}{duree_occupation * 1000 / max(1, pas):>17.2f}")
+
+def bench_lignes():
+    """Génération de très grands labyrinthes : backtracker en mémoire contre Eller ligne par ligne (pic tracemalloc)"""
+    print(f"{'Taille':>12}{'Cellules':>14}{'Backtr. (s)':>13}{'Pic backtr. (Mo)':>18}{'Eller (s)':>11}{'Pic Eller (Ko)':>16}")
+    for cote in (1000, 2000):
+        tracemalloc.start()
+        debut = time.perf_counter()
+        Labyrinthe(cote, cote)
+        duree_backtracker = time.perf_counter() - debut
+        pic_backtracker = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        debut = time.perf_counter()
+        for _ in lignes_eller(cote, cote, GRAINE):
+            pass
+        duree_eller = time.perf_counter() - debut
+        pic_eller = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"{f'{cote}x{cote}':>12}{cote * cote:>14}{duree_backtracker:>13.1f}{pic_backtracker / 1e6:>18.1f}"
+              f"{duree_eller:>11.1f}{pic_eller / 1e3:>16.0f}")
+
+def bench_cache():
+    """Labyrinthes avec graine : génération (cache vide) contre relecture du cache disque"""
+    with tempfile.TemporaryDirectory() as dossier:
+        cache = CacheLabyrinthes(dossier)
+        print(f"{'Taille':>12}{'Algorithme':>13}{'Génération (ms)':>17}{'Cache (ms)':>12}{'Gain':>8}")
+        for cote in (201, 1001):
+            for algorithme in ('backtracker', 'eller'):
+                debut = time.perf_counter()
+                genere = cache.labyrinthe(cote, cote, GRAINE, algorithme)
+                duree_generation = time.perf_counter() - debut
+                debut = time.perf_counter()
+                relu = cache.labyrinthe(cote, cote, GRAINE, algorithme)
+                duree_cache = time.perf_counter() - debut
+                assert relu.grille == genere.grille == Labyrinthe(cote, cote, GRAINE, algorithme).grille
+                print(f"{f'{cote}x{cote}':>12}{algorithme:>13}{duree_generation * 1000:>17.1f}"
+                      f"{duree_cache * 1000:>12.1f}{duree_generation / duree_cache:>7.1f}x")
+
+        # Éviction LRU : sous la taille maximale, la grille la plus récemment relue reste
+        cache.taille_max = 3 * 201 * 201
+        cache.labyrinthe(201, 201, GRAINE)
+        for graine in range(3):
+            cache.labyrinthe(201, 201, GRAINE + 1 + graine)
+        assert cache.lire('backtracker', 201, 201, GRAINE) is None
+        assert cache.lire('backtracker', 201, 201, GRAINE + 3) is not None
+
+def bench_fichier():
+    """Format binaire : taille, écriture, ouverture projetée (mmap) contre copie en mémoire, relecture vérifiée"""
+    print(f"{'Taille':>12}{'Mémoire (Mo)':>14}{'Fichier (Mo)':>14}{'Écriture (s)':>14}"
+          f"{'Ouvrir (ms)':>13}{'Charger (s)':>13}{'Requête (ms)':>14}")
+    with tempfile.TemporaryDirectory() as dossier:
+        for cote in (1001, 2001):
+            labyrinthe = Labyrinthe(cote, cote, GRAINE, 'eller')
+            chemin_fichier = os.path.join(dossier, f"{cote}.mzb")
+            debut = time.perf_counter()
+            with open(chemin_fichier, 'wb') as fichier:
+                enregistrer(labyrinthe, fichier, distances=True)
+            duree_ecriture = time.perf_counter() - debut
+
+            debut = time.perf_counter()
+            projete = ouvrir(chemin_fichier)
+            duree_ouverture = time.perf_counter() - debut
+            debut = time.perf_counter()
+            copie = charger(chemin_fichier)
+            duree_chargement = time.perf_counter() - debut
+            assert bytes(projete.grille) == copie.grille == labyrinthe.grille
+            assert projete.masques == copie.masques == labyrinthe.masques
+
+            # Requête locale : seules quelques pages du fichier sont lues
+            depart = (cote // 2 | 1, cote // 2 | 1)
+            arrivee = (depart[0] + 20, depart[1] + 20)
+            chemin_projete, statistiques = resoudre_a_star(projete, depart, arrivee, algorithme='ida_star')
+            assert chemin_projete == resoudre_a_star(labyrinthe, depart, arrivee, algorithme='ida_star')[0]
+
+            memoire = len(labyrinthe.grille) + len(labyrinthe.masques) + 4 * len(labyrinthe.grille)
+            print(f"{f'{cote}x{cote}':>12}{memoire / 1e6:>14.1f}{os.path.getsize(chemin_fichier) / 1e6:>14.1f}"
+                  f"{duree_ecriture:>14.2f}{duree_ouverture * 1000:>13.2f}{duree_chargement:>13.2f}"
+                  f"{statistiques['temps_execution'] * 1000:>14.1f}")
+
+def bench_tuiles():
+    """Génération par tuiles : durée et efficacité du passage à l'échelle de 1 à os.cpu_count() processus"""
+    coeurs = os.cpu_count() or 1
+    nombres = sorted({2 ** puissance for puissance in range(coeurs.bit_length())} | {coeurs})
+    print(f"{'Taille':>12}{'Processus':>11}{'Durée (s)':>11}{'Accélération':>14}{'Efficacité':>12}")
+    for cote in (2001, 4001):
+        reference = duree_reference = None
+        for processus in nombres:
+            debut = time.perf_counter()
+            grille = generer_tuiles(cote, cote, GRAINE, processus=processus)
+            duree = time.perf_counter() - debut
+            if reference is None:
+                reference, duree_reference = grille, duree
+            # Même grille quel que soit le nombre de processus
+            assert grille == reference
+            acceleration = duree_reference / duree
+            print(f"{f'{cote}x{cote}':>12}{processus:>11}{duree:>11.2f}{acceleration:>13.2f}x"
+                  f"{acceleration / processus * 100:>11.0f}%")
+
+def bench_lots():
+    """Lots de labyrinthes (spécifications et fichiers projetés) : débit et efficacité de 1 à os.cpu_count() processus"""
+    coeurs = os.cpu_count() or 1
+    nombres = sorted({2 ** puissance for puissance in range(coeurs.bit_length())} | {coeurs})
+    with tempfile.TemporaryDirectory() as dossier:
+        fichiers = []
+        for graine in range(16):
+            fichiers.append(os.path.join(dossier, f"{graine}.mzb"))
+            with open(fichiers[-1], 'wb') as fichier:
+                enregistrer(Labyrinthe(301, 301, graine), fichier)
+        lots = {
+            'specifications': [(*TAILLES_DIFFICULTE['EXTREME'], graine) for graine in range(64)],
+            'fichiers': fichiers
+        }
+
+        print(f"{'Lot':<16}{'Processus':>11}{'Lab./s':>10}{'Durée (s)':>11}{'Efficacité':>12}")
+        for nom, travaux in lots.items():
+            # Mêmes chemins quel que soit le nombre de processus
+            longueurs = {resultat['travail']: resultat['longueur_chemin']
+                         for resultat in resoudre_lot(travaux, processus=1)}
+            assert longueurs == {resultat['travail']: resultat['longueur_chemin']
+                                 for resultat in resoudre_lot(travaux, processus=max(nombres))}
+            debit_reference = None
+            for processus in nombres:
+                debit, duree = mesurer_debit(travaux, processus)
+                debit_reference = debit_reference or debit
+                print(f"{nom:<16}{processus:>11}{debit:>10.1f}{duree:>11.2f}"
+                      f"{debit / (debit_reference * processus) * 100:>11.0f}%")
+
+def bench_export():
+    """Export de paires labyrinthe / solution : échantillons par seconde et taille sur disque (format brut)"""
+    largeur, hauteur = TAILLES_DIFFICULTE['EXTREME']
+    nombre = 256
+    with tempfile.TemporaryDirectory() as dossier:
+        debut = time.perf_counter()
+        assert exporter(dossier, largeur, hauteur, nombre, GRAINE, taille_fragment=64, format='brut') == nombre
+        duree = time.perf_counter() - debut
+        taille = sum(os.path.getsize(os.path.join(dossier, nom)) for nom in os.listdir(dossier) if nom != MANIFESTE)
+        # Reprise : rien à refaire quand tout est déjà exporté
+        assert exporter(dossier, largeur, hauteur, nombre, GRAINE, taille_fragment=64, format='brut') == nombre
+    print(f"{nombre} échantillons {largeur}x{hauteur} : {nombre / duree:.1f} échantillons/s, "
+          f"{taille / nombre / 1e3:.1f} Ko par échantillon")
+
+BANCS = {
+    'expansions': bench_expansions,
+    'bidirectionnel': bench_bidirectionnel,
+    'jonctions': bench_jonctions,
+    'arbre': bench_arbre,
+    'heuristiques': bench_heuristiques,
+    'reperes': bench_reperes,
+    'incremental': bench_incremental,
+    'jps': bench_jps,
+    'hierarchique': bench_hierarchique,
+    'memoire': bench_memoire,
+    'seaux': bench_seaux,
+    'departage': bench_departage,
+    'foule': bench_foule,
+    'lignes': bench_lignes,
+    'cache': bench_cache,
+    'fichier': bench_fichier,
+    'tuiles': bench_tuiles,
+    'lots': bench_lots,
+    'export': bench_export
+}
+
+if __name__ == "__main__":
+    noms = sys.argv[1:] or list(BANCS)
+    for nom in noms:
+        print(f"== {nom} ==")
+        BANCS[nom]()
+        print()
@@ -0,0 +1,80 @@
+import os
+from typing import Optional
+
+from labyrinthe import ALGORITHMES_GENERATION, Labyrinthe
+
+# Dossier et taille maximale (en octets) du cache de labyrinthes générés
+DOSSIER_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'maze_ai')
+TAILLE_MAX_CACHE = 512 * 1024 * 1024
+EXTENSION = '.lab'
+
+
+class CacheLabyrinthes:
+    """Cache disque des grilles générées, clé (algorithme, largeur, hauteur, graine)
+
+    Un fichier par grille, qui contient les octets TypeCellule bruts. La date
+    de modification d'un fichier sert de date de dernier accès : elle est
+    rafraîchie à chaque lecture, et quand la taille totale dépasse
+    `taille_max`, les fichiers les moins récemment utilisés sont supprimés
+    (LRU). Les écritures passent par un fichier temporaire renommé, pour
+    qu'un autre processus ne lise jamais de grille incomplète.
+    """
+    def __init__(self, dossier: str = DOSSIER_CACHE, taille_max: int = TAILLE_MAX_CACHE):
+        self.dossier = dossier
+        self.taille_max = taille_max
+        os.makedirs(dossier, exist_ok=True)
+
+    def chemin(self, algorithme: str, largeur: int, hauteur: int, graine: int) -> str:
+        if algorithme not in ALGORITHMES_GENERATION:
+            raise ValueError(f"Algorithme de génération inconnu : {algorithme}")
+        return os.path.join(self.dossier, f"{algorithme}_{largeur}x{hauteur}_{graine}{EXTENSION}")
+
+    def lire(self, algorithme: str, largeur: int, hauteur: int, graine: int) -> Optional[bytes]:
+        """Grille en cache (None si absente ou de taille inattendue)"""
+        chemin = self.chemin(algorithme, largeur, hauteur, graine)
+        try:
+            with open(chemin, 'rb') as fichier:
+                grille = fichier.read()
+            os.utime(chemin)
+        except FileNotFoundError:
+            return None
+        return grille if len(grille) == largeur * hauteur else None
+
+    def ecrire(self, algorithme: str, largeur: int, hauteur: int, graine: int, grille: bytes):
+        chemin = self.chemin(algorithme, largeur, hauteur, graine)
+        temporaire = f"{chemin}.{os.getpid()}.tmp"
+        with open(temporaire, 'wb') as fichier:
+            fichier.write(grille)
+        os.replace(temporaire, chemin)
+        self.evincer()
+
+    def evincer(self):
+        """Supprime les grilles les moins récemment utilisées jusqu'à repasser sous `taille_max`"""
+        entrees = []
+        with os.scandir(self.dossier) as iterateur:
+            for entree in iterateur:
+                if entree.name.endswith(EXTENSION):
+                    statistiques = entree.stat()
+                    entrees.append((statistiques.st_mtime, statistiques.st_size, entree.path))
+        taille = sum(taille for _, taille, _ in entrees)
+        for _, taille_fichier, chemin in sorted(entrees):
+            if taille <= self.taille_max:
+                break
+            try:
+                os.remove(chemin)
+            except FileNotFoundError:
+                pass  # Déjà évincé par un autre processus
+            taille -= taille_fichier
+
+    def labyrinthe(self, largeur: int, hauteur: int, graine: int, algorithme: str = 'backtracker',
+                   classe=Labyrinthe, **arguments) -> Labyrinthe:
+        """Labyrinthe (algorithme, largeur, hauteur, graine), relu du cache ou généré puis mis en cache
+
+        `classe` et ses `arguments` nommés permettent de construire une
+        sous-classe (LabyrintheAAA de l'interface, avec effets=...).
+        """
+        grille = self.lire(algorithme, largeur, hauteur, graine)
+        labyrinthe = classe(largeur, hauteur, graine=graine, algorithme=algorithme, grille=grille, **arguments)
+        if grille is None:
+            self.ecrire(algorithme, largeur, hauteur, graine, bytes(labyrinthe.grille))
+        return labyrinthe
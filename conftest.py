@@ -0,0 +1 @@
+"""Configuration pytest : les modules du dépôt s'importent depuis la racine (python -m pytest tests)"""
@@ -0,0 +1,199 @@
+"""Export en masse de paires labyrinthe / solution pour l'apprentissage de planificateurs
+
+Les labyrinthes sont générés et résolus (A*) sur une réserve de processus,
+puis écrits par fragments de `taille_fragment` échantillons : un fichier
+.npz (numpy) ou brut (.bin, tableaux à la suite) par fragment, plus une
+ligne par fragment dans le manifeste `manifeste.jsonl`. Un seul fragment est
+en mémoire à la fois, et un export interrompu reprend après le dernier
+fragment du manifeste.
+
+Tableaux de chaque fragment (k échantillons de hauteur x largeur cellules) :
+graines (k), murs (k, hauteur, largeur ; 1 = mur), depart et arrivee
+(k, 2 ; x, y), chemin (k, hauteur, largeur ; 1 = cellule du chemin optimal),
+distances (k, hauteur, largeur ; distance BFS à l'arrivée, -1 si
+inaccessible), ordre (indices des cellules dans l'ordre de développement
+d'A*, tous échantillons à la suite) et ordre_debuts (k + 1 ; l'ordre de
+l'échantillon i est ordre[ordre_debuts[i]:ordre_debuts[i + 1]]).
+"""
+import json
+import os
+from array import array
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from heuristiques import champ_distances
+from labyrinthe import Labyrinthe, TypeCellule
+from solveur import RechercheAStar
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+FORMATS_EXPORT = ('npz', 'brut')
+TAILLE_FRAGMENT = 1024
+MANIFESTE = 'manifeste.jsonl'
+
+# Tableaux d'un échantillon et leur type (codes du module array)
+CHAMPS = (('graines', 'q'), ('murs', 'B'), ('depart', 'i'), ('arrivee', 'i'),
+          ('chemin', 'B'), ('distances', 'i'), ('ordre', 'i'))
+TYPES_NUMPY = {'B': 'uint8', 'i': 'int32', 'q': 'int64'}
+
+_VERS_MURS = bytes(int(octet == TypeCellule.MUR) for octet in range(256))
+
+
+def echantillon(specification: Tuple[int, int, int, str], heuristique: str = 'manhattan') -> Dict[str, bytes]:
+    """Tableaux (octets bruts, voir CHAMPS) du labyrinthe (largeur, hauteur, graine, algorithme) résolu par A*"""
+    largeur, hauteur, graine, algorithme = specification
+    labyrinthe = Labyrinthe(largeur, hauteur, graine, algorithme)
+    recherche = RechercheAStar(labyrinthe, heuristique=heuristique)
+    ordre = array('i')
+    etape = recherche.etape
+    while not recherche.termine:
+        index = etape()
+        if index == -1:
+            break
+        ordre.append(index)
+
+    chemin = bytearray(largeur * hauteur)
+    for x, y in recherche.chemin:
+        chemin[y * largeur + x] = 1
+    return {
+        'graines': array('q', [graine]).tobytes(),
+        'murs': bytes(labyrinthe.grille).translate(_VERS_MURS),
+        'depart': array('i', labyrinthe.depart).tobytes(),
+        'arrivee': array('i', labyrinthe.arrivee).tobytes(),
+        'chemin': bytes(chemin),
+        'distances': champ_distances(labyrinthe, labyrinthe.arrivee).tobytes(),
+        'ordre': ordre.tobytes()
+    }
+
+
+class ExportFragments:
+    """Fragments d'un export dans `dossier` : échantillons en attente et manifeste
+
+    Une reprise n'est acceptée que si les fragments déjà écrits ont les
+    mêmes paramètres (dimensions, première graine, algorithme de
+    génération, format) : sinon ValueError.
+    """
+    def __init__(self, dossier: str, largeur: int, hauteur: int, graine: int = 0, algorithme: str = 'backtracker',
+                 taille_fragment: int = TAILLE_FRAGMENT, format: Optional[str] = None):
+        format = format or ('npz' if numpy is not None else 'brut')
+        if format not in FORMATS_EXPORT:
+            raise ValueError(f"Format d'export inconnu : {format}")
+        if format == 'npz' and numpy is None:
+            raise ValueError("Le format npz demande numpy (format 'brut' sinon)")
+
+        self.dossier = dossier
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.graine = graine
+        self.algorithme = algorithme
+        self.taille_fragment = taille_fragment
+        self.format = format
+        os.makedirs(dossier, exist_ok=True)
+
+        # Reprise : fragments déjà décrits par le manifeste
+        self.fragments = []
+        chemin_manifeste = os.path.join(dossier, MANIFESTE)
+        if os.path.exists(chemin_manifeste):
+            with open(chemin_manifeste) as manifeste:
+                self.fragments = [json.loads(ligne) for ligne in manifeste if ligne.strip()]
+        parametres = self.parametres()
+        for fragment in self.fragments:
+            differents = [nom for nom, valeur in parametres.items() if fragment.get(nom) != valeur]
+            if differents:
+                raise ValueError(f"Le dossier {dossier} contient déjà un export différent ({', '.join(differents)})")
+        self.exportes = sum(fragment['echantillons'] for fragment in self.fragments)
+        self.nouveau_fragment()
+
+    def parametres(self) -> Dict:
+        """Paramètres de l'export, répétés dans chaque ligne du manifeste"""
+        return {'largeur': self.largeur, 'hauteur': self.hauteur, 'graine': self.graine,
+                'algorithme': self.algorithme, 'format': self.format}
+
+    def nouveau_fragment(self):
+        """Vide les tampons d'échantillons en attente"""
+        self.en_attente = {nom: bytearray() for nom, _ in CHAMPS}
+        self.debuts_ordre = array('q', [0])
+
+    def ajouter(self, tableaux: Dict[str, bytes]):
+        for nom, _ in CHAMPS:
+            self.en_attente[nom] += tableaux[nom]
+        self.debuts_ordre.append(len(self.en_attente['ordre']) // 4)
+        if len(self.debuts_ordre) - 1 == self.taille_fragment:
+            self.ecrire_fragment()
+
+    def tableaux_fragment(self, nombre: int) -> List[Tuple[str, str, Tuple[int, ...], memoryview]]:
+        """(nom, type array, forme, octets) de chaque tableau du fragment en attente, sans copie"""
+        cellules = (self.hauteur, self.largeur)
+        formes = {'graines': (nombre,), 'murs': (nombre, *cellules), 'depart': (nombre, 2),
+                  'arrivee': (nombre, 2), 'chemin': (nombre, *cellules), 'distances': (nombre, *cellules),
+                  'ordre': (len(self.en_attente['ordre']) // 4,)}
+        tableaux = [(nom, code, formes[nom], memoryview(self.en_attente[nom])) for nom, code in CHAMPS]
+        tableaux.append(('ordre_debuts', 'q', (nombre + 1,), memoryview(self.debuts_ordre).cast('B')))
+        return tableaux
+
+    def ecrire_fragment(self):
+        """Écrit les échantillons en attente dans un nouveau fragment, puis l'ajoute au manifeste"""
+        nombre = len(self.debuts_ordre) - 1
+        if not nombre:
+            return
+        nom_fichier = f"fragment_{len(self.fragments):05d}.{'npz' if self.format == 'npz' else 'bin'}"
+        chemin = os.path.join(self.dossier, nom_fichier)
+        temporaire = f"{chemin}.tmp"
+        entree = {'fichier': nom_fichier, 'premier': self.exportes, 'echantillons': nombre, **self.parametres()}
+
+        with open(temporaire, 'wb') as fichier:
+            if self.format == 'npz':
+                numpy.savez_compressed(fichier, **{
+                    nom: numpy.frombuffer(octets, dtype=TYPES_NUMPY[code]).reshape(forme)
+                    for nom, code, forme, octets in self.tableaux_fragment(nombre)})
+            else:
+                # Tableaux à la suite, alignés sur 8 octets et décrits dans le manifeste
+                entree['tableaux'] = {}
+                position = 0
+                for nom, code, forme, octets in self.tableaux_fragment(nombre):
+                    entree['tableaux'][nom] = {'type': TYPES_NUMPY[code], 'forme': list(forme),
+                                               'decalage': position}
+                    remplissage = -len(octets) % 8
+                    fichier.write(octets)
+                    fichier.write(bytes(remplissage))
+                    position += len(octets) + remplissage
+        os.replace(temporaire, chemin)
+
+        with open(os.path.join(self.dossier, MANIFESTE), 'a') as manifeste:
+            manifeste.write(json.dumps(entree) + '\n')
+        self.fragments.append(entree)
+        self.exportes += nombre
+        self.nouveau_fragment()
+
+
+def specifications(largeur: int, hauteur: int, premier: int, nombre: int, graine: int,
+                   algorithme: str) -> Iterator[Tuple[int, int, int, str]]:
+    for rang in range(premier, nombre):
+        yield largeur, hauteur, graine + rang, algorithme
+
+def exporter(dossier: str, largeur: int, hauteur: int, nombre: int, graine: int = 0,
+             algorithme: str = 'backtracker', taille_fragment: int = TAILLE_FRAGMENT,
+             format: Optional[str] = None, processus: Optional[int] = None) -> int:
+    """Exporte `nombre` échantillons (graines `graine`, `graine` + 1...) dans `dossier`
+
+    Reprend après les échantillons déjà présents dans le manifeste (même
+    export : ValueError si les paramètres diffèrent) et renvoie le nombre
+    d'échantillons exportés au total. `processus` vaut
+    os.cpu_count() par défaut, 1 pour tout faire dans le processus courant.
+    """
+    export = ExportFragments(dossier, largeur, hauteur, graine, algorithme, taille_fragment, format)
+    travaux = specifications(largeur, hauteur, export.exportes, nombre, graine, algorithme)
+    processus = processus or os.cpu_count() or 1
+    if processus == 1:
+        for tableaux in map(echantillon, travaux):
+            export.ajouter(tableaux)
+    else:
+        # imap garde l'ordre des graines : les fragments ne dépendent pas du nombre de processus
+        with Pool(processus) as reserve:
+            for tableaux in reserve.imap(echantillon, travaux, chunksize=16):
+                export.ajouter(tableaux)
+    export.ecrire_fragment()
+    return export.exportes
@@ -0,0 +1,248 @@
+"""Format binaire compact des labyrinthes (.mzb), ouvert par projection mémoire (mmap)
+
+Disposition du fichier (entiers little-endian, sections alignées sur 8 octets) :
+- en-tête ENTETE : signature, version, drapeaux, dimensions, départ,
+  arrivée et graine ;
+- murs : un bit par cellule (1 = mur), bit de poids faible d'abord ;
+- si DRAPEAU_MASQUES : un octet par cellule, le masque de directions
+  ouvertes de Labyrinthe.masques ;
+- si DRAPEAU_DISTANCES : un entier 32 bits signé par cellule, la distance à
+  l'arrivée (-1 si inaccessible), comme heuristiques.champ_distances.
+"""
+import mmap
+import struct
+import sys
+from typing import BinaryIO, Iterator, Union
+
+from heuristiques import champ_distances
+from labyrinthe import Labyrinthe, TypeCellule, table_decalages
+
+SIGNATURE = b'MZAI'
+VERSION = 1
+# signature, version, drapeaux, largeur, hauteur, départ (x, y), arrivée (x, y), graine (-1 si aucune)
+ENTETE = struct.Struct('<4sHHIIIIIIq')
+DRAPEAU_MASQUES = 1
+DRAPEAU_DISTANCES = 2
+
+# Octets de grille traités à la fois (multiple de 8) pour garder une mémoire bornée
+TAILLE_BLOC = 1 << 20
+
+# Octet TypeCellule -> bit de mur (1 pour MUR, 0 sinon)
+_VERS_BITS = bytes(int(octet == TypeCellule.MUR) for octet in range(256))
+
+
+def _aligner(position: int) -> int:
+    return (position + 7) & ~7
+
+def empaqueter_murs(grille: bytes) -> bytes:
+    """Un bit par cellule (1 = mur) ; `grille` a une longueur multiple de 8 sauf pour le dernier bloc
+
+    Les huit tranches grille[k::8] (des octets 0 ou 1) sont lues comme de
+    grands entiers et décalées de k bits : aucune retenue ne passe d'un
+    octet à l'autre, un OU suffit et tout se fait sans boucle Python par
+    cellule.
+    """
+    bits = grille.translate(_VERS_BITS)
+    taille = (len(bits) + 7) // 8
+    paquet = 0
+    for k in range(8):
+        paquet |= int.from_bytes(bits[k::8], 'little') << k
+    return paquet.to_bytes(taille, 'little')
+
+def deballer_murs(paquet: bytes, nombre: int) -> bytearray:
+    """Grille TypeCellule (MUR ou VIDE) de `nombre` cellules à partir des bits de murs"""
+    grille = bytearray(len(paquet) * 8)
+    valeur = int.from_bytes(paquet, 'little')
+    uns = int.from_bytes(b'\x01' * len(paquet), 'little')
+    for k in range(8):
+        grille[k::8] = ((valeur >> k) & uns).to_bytes(len(paquet), 'little')
+    del grille[nombre:]
+    return grille
+
+def enregistrer(labyrinthe: Labyrinthe, fichier: BinaryIO, masques: bool = True, distances: bool = False) -> int:
+    """Écrit `labyrinthe` dans `fichier` (ouvert en binaire) et renvoie le nombre d'octets écrits
+
+    `masques` et `distances` ajoutent les prétraitements correspondants,
+    relus ensuite sans calcul ni copie par `ouvrir`.
+    """
+    nombre = labyrinthe.largeur * labyrinthe.hauteur
+    drapeaux = (DRAPEAU_MASQUES if masques else 0) | (DRAPEAU_DISTANCES if distances else 0)
+    graine = -1 if getattr(labyrinthe, 'graine', None) is None else labyrinthe.graine
+    position = 0
+
+    def ecrire(donnees) -> None:
+        nonlocal position
+        fichier.write(donnees)
+        position += len(donnees)
+
+    def completer() -> None:
+        ecrire(bytes(_aligner(position) - position))
+
+    ecrire(ENTETE.pack(SIGNATURE, VERSION, drapeaux, labyrinthe.largeur, labyrinthe.hauteur,
+                       *labyrinthe.depart, *labyrinthe.arrivee, graine))
+    completer()
+    grille = memoryview(labyrinthe.grille)
+    for debut in range(0, nombre, TAILLE_BLOC):
+        ecrire(empaqueter_murs(bytes(grille[debut:debut + TAILLE_BLOC])))
+    completer()
+    if masques:
+        ecrire(memoryview(labyrinthe.masques))
+        completer()
+    if distances:
+        champ = champ_distances(labyrinthe, labyrinthe.arrivee)
+        if sys.byteorder == 'big':
+            champ = champ[:]
+            champ.byteswap()
+        ecrire(memoryview(champ).cast('B'))
+        completer()
+    return position
+
+
+class GrilleMurs:
+    """Vue en lecture seule de la section des murs : se lit comme Labyrinthe.grille
+
+    Chaque accès décode un bit de la projection mémoire ; le départ et
+    l'arrivée sont rendus comme dans une grille générée.
+    """
+    def __init__(self, murs: memoryview, nombre: int, i_depart: int, i_arrivee: int):
+        self.murs = murs
+        self.nombre = nombre
+        self.i_depart = i_depart
+        self.i_arrivee = i_arrivee
+
+    def __len__(self) -> int:
+        return self.nombre
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.nombre:
+            raise IndexError(index)
+        if (self.murs[index >> 3] >> (index & 7)) & 1:
+            return TypeCellule.MUR
+        if index == self.i_depart:
+            return TypeCellule.DEPART
+        if index == self.i_arrivee:
+            return TypeCellule.ARRIVEE
+        return TypeCellule.VIDE
+
+    def __iter__(self) -> Iterator[int]:
+        for debut in range(0, self.nombre, TAILLE_BLOC):
+            yield from self.bloc(debut, min(debut + TAILLE_BLOC, self.nombre))
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.bloc(0, self.nombre))
+
+    def bloc(self, debut: int, fin: int) -> bytearray:
+        """Cellules [debut, fin[ décodées en octets TypeCellule (`debut` multiple de 8)"""
+        grille = deballer_murs(self.murs[debut >> 3:(fin + 7) >> 3], fin - debut)
+        for index in (self.i_depart, self.i_arrivee):
+            if debut <= index < fin and grille[index - debut] != TypeCellule.MUR:
+                grille[index - debut] = self[index]
+        return grille
+
+
+class LabyrintheProjete(Labyrinthe):
+    """Labyrinthe lu par `ouvrir` : grille, masques et distances restent dans le fichier projeté
+
+    Seules les pages visitées par une recherche sont lues depuis le disque
+    (`lire_flux` passe de même un enregistrement déjà lu, sans le recopier).
+    Sans section de masques, ils sont recalculés en mémoire à l'ouverture.
+    Le labyrinthe est en lecture seule : basculer_mur lève ValueError
+    (`charger` en fait une copie modifiable). `fermer`, ou la sortie d'un
+    bloc with, libère la projection.
+    """
+    def __init__(self, projection: Union[mmap.mmap, bytes]):
+        (signature, version, drapeaux, largeur, hauteur,
+         depart_x, depart_y, arrivee_x, arrivee_y, graine) = ENTETE.unpack_from(projection)
+        if signature != SIGNATURE:
+            raise ValueError("Ce fichier n'est pas un labyrinthe binaire")
+        if version != VERSION:
+            raise ValueError(f"Version de fichier non prise en charge : {version}")
+
+        nombre = largeur * hauteur
+        self.projection = projection
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.graine = None if graine == -1 else graine
+        self.algorithme = None
+        self.depart = (depart_x, depart_y)
+        self.arrivee = (arrivee_x, arrivee_y)
+        self.cache_pretraitements = {}
+        self.decalages_par_masque = table_decalages(largeur)
+
+        vue = memoryview(projection)
+        position = _aligner(ENTETE.size)
+        taille_murs = (nombre + 7) // 8
+        self.grille = GrilleMurs(vue[position:position + taille_murs], nombre,
+                                 self.index(*self.depart), self.index(*self.arrivee))
+        position = _aligner(position + taille_murs)
+        if drapeaux & DRAPEAU_MASQUES:
+            self.masques = vue[position:position + nombre]
+            position = _aligner(position + nombre)
+        else:
+            self.masques = bytearray(nombre)
+            self.calculer_masques()
+        if drapeaux & DRAPEAU_DISTANCES and sys.byteorder == 'little':
+            self.cache_pretraitements[('distances', self.arrivee)] = vue[position:position + 4 * nombre].cast('i')
+
+    def basculer_mur(self, x: int, y: int):
+        raise ValueError("Labyrinthe projeté en lecture seule : le charger avec charger() pour le modifier")
+
+    def fermer(self):
+        """Libère les vues sur la projection et ferme le fichier projeté (le labyrinthe est ensuite inutilisable)"""
+        distances = self.cache_pretraitements.pop(('distances', self.arrivee), None)
+        for vue in (distances, self.masques, self.grille.murs):
+            if isinstance(vue, memoryview):
+                vue.release()
+        if isinstance(self.projection, mmap.mmap):
+            self.projection.close()
+
+    def __enter__(self) -> 'LabyrintheProjete':
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+
+def taille_enregistrement(drapeaux: int, nombre: int) -> int:
+    """Taille en octets d'un enregistrement de `nombre` cellules, en-tête compris"""
+    taille = _aligner(ENTETE.size) + _aligner((nombre + 7) // 8)
+    if drapeaux & DRAPEAU_MASQUES:
+        taille += _aligner(nombre)
+    if drapeaux & DRAPEAU_DISTANCES:
+        taille += _aligner(4 * nombre)
+    return taille
+
+def lire_flux(fichier: BinaryIO) -> Iterator[LabyrintheProjete]:
+    """Labyrinthes d'enregistrements écrits à la suite par `enregistrer` (un flux, sans projection)
+
+    Un seul enregistrement est en mémoire à la fois.
+    """
+    taille_entete = _aligner(ENTETE.size)
+    while True:
+        entete = fichier.read(taille_entete)
+        if not entete:
+            return
+        if len(entete) < taille_entete:
+            raise ValueError("Enregistrement de labyrinthe tronqué")
+        signature, _, drapeaux, largeur, hauteur, *_ = ENTETE.unpack_from(entete)
+        if signature != SIGNATURE:
+            raise ValueError("Ce flux ne contient pas de labyrinthes binaires")
+        reste = taille_enregistrement(drapeaux, largeur * hauteur) - taille_entete
+        corps = fichier.read(reste)
+        if len(corps) < reste:
+            raise ValueError("Enregistrement de labyrinthe tronqué")
+        yield LabyrintheProjete(entete + corps)
+
+def ouvrir(chemin: str) -> LabyrintheProjete:
+    """Projette le fichier `chemin` en mémoire, sans le lire ni le copier (à fermer après usage)"""
+    with open(chemin, 'rb') as fichier:
+        projection = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+    return LabyrintheProjete(projection)
+
+def charger(chemin: str, classe=Labyrinthe, **arguments) -> Labyrinthe:
+    """Copie modifiable en mémoire du labyrinthe `chemin` (par exemple classe=LabyrintheAAA, effets=...)"""
+    with ouvrir(chemin) as projete:
+        labyrinthe = classe(projete.largeur, projete.hauteur, graine=projete.graine,
+                            grille=bytes(projete.grille), **arguments)
+        labyrinthe.depart, labyrinthe.arrivee = projete.depart, projete.arrivee
+    return labyrinthe
@@ -0,0 +1,80 @@
+import random
+from array import array
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from heuristiques import champ_distances
+from labyrinthe import Labyrinthe
+
+# Taille de la foule du mode foule de l'interface
+NOMBRE_AGENTS_FOULE = 10000
+
+
+def champ_flux(labyrinthe: Labyrinthe, cible: Tuple[int, int]) -> array:
+    """Cellule suivante de chaque cellule vers `cible`, calculée une fois puis mise en cache
+
+    Le pas suit le champ de distances BFS inversé (depuis la cible) : chaque
+    cellule pointe vers un voisin plus proche d'un pas. La cible, les murs et
+    les cellules inaccessibles pointent vers eux-mêmes.
+    """
+    cle = ('flux', cible)
+    suivants = labyrinthe.cache_pretraitements.get(cle)
+    if suivants is None:
+        distances = champ_distances(labyrinthe, cible)
+        masques = labyrinthe.masques
+        decalages_par_masque = labyrinthe.decalages_par_masque
+        suivants = array('i', range(len(distances)))
+        for index, distance in enumerate(distances):
+            if distance <= 0:
+                continue
+            for decalage in decalages_par_masque[masques[index]]:
+                if distances[index + decalage] == distance - 1:
+                    suivants[index] = index + decalage
+                    break
+        labyrinthe.cache_pretraitements[cle] = suivants
+    return suivants
+
+class Foule:
+    """Foule d'agents partageant un seul champ de flux vers la cible
+
+    Aucune recherche par agent : les positions sont une liste d'indices de
+    cellules et un pas de simulation les remplace toutes d'un coup par leur
+    cellule suivante dans le champ de flux (un `map` sur la liste, sans
+    boucle Python par agent ; listes plutôt que tableaux, dont la lecture
+    crée un entier à chaque accès). Les agents arrivés restent sur la cible.
+    """
+    def __init__(self, labyrinthe: Labyrinthe, nombre: int = NOMBRE_AGENTS_FOULE,
+                 cible: Optional[Tuple[int, int]] = None, graine: Optional[int] = None):
+        self.labyrinthe = labyrinthe
+        self.cible = cible or labyrinthe.arrivee
+        self.i_cible = labyrinthe.index(*self.cible)
+        self.suivants = champ_flux(labyrinthe, self.cible).tolist()
+
+        # Agents placés au hasard sur les cellules d'où la cible est accessible
+        distances = champ_distances(labyrinthe, self.cible)
+        accessibles = [index for index, distance in enumerate(distances) if distance >= 0]
+        self.positions = random.Random(graine).choices(accessibles, k=nombre)
+        self.pas = 0
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def avancer(self):
+        """Fait avancer tous les agents d'une cellule le long du champ de flux"""
+        self.positions = list(map(self.suivants.__getitem__, self.positions))
+        self.pas += 1
+
+    def actualiser_champ(self):
+        """Reprend le champ de flux après une modification de la grille (voir Labyrinthe.basculer_mur)"""
+        self.suivants = champ_flux(self.labyrinthe, self.cible).tolist()
+
+    def arrives(self) -> int:
+        return self.positions.count(self.i_cible)
+
+    @property
+    def termine(self) -> bool:
+        return self.arrives() == len(self.positions)
+
+    def occupation(self) -> Dict[int, int]:
+        """Nombre d'agents par cellule occupée"""
+        return Counter(self.positions)
@@ -0,0 +1,119 @@
+"""Génération de labyrinthes parfaits ligne par ligne, en mémoire proportionnelle à la largeur
+
+Usage : python generation_lignes.py LARGEUR HAUTEUR [GRAINE] > labyrinthe.bin
+(un octet TypeCellule par cellule, ligne après ligne)
+"""
+import random
+import sys
+from typing import BinaryIO, Iterator, Optional
+
+from labyrinthe import TypeCellule
+
+# Probabilité de relier deux cellules voisines d'une rangée, puis de faire descendre une cellule
+PROBABILITE_FUSION = 0.5
+PROBABILITE_DESCENTE = 0.4
+
+
+def lignes_eller(largeur: int, hauteur: int, graine: Optional[int] = None) -> Iterator[bytearray]:
+    """Lignes (octets TypeCellule) d'un labyrinthe parfait généré par l'algorithme d'Eller
+
+    Même convention que Labyrinthe.generer_labyrinthe : cellules aux
+    coordonnées impaires, bordure murée, départ en (1, 1) et arrivée en
+    (largeur - 2, hauteur - 2), reliée à la cellule impaire voisine. Seule
+    la rangée courante est gardée : l'étiquette d'ensemble de chaque
+    cellule, et une union-find sur ces étiquettes pour les fusions
+    horizontales. Chaque ensemble envoie au moins une cellule vers la
+    rangée suivante et la dernière rangée fusionne tout ce qui reste
+    séparé : le labyrinthe est un arbre couvrant, quelle que soit la
+    hauteur. La mémoire est en O(largeur) et chaque ligne produite peut
+    être écrite puis oubliée par le consommateur.
+    """
+    generateur = random.Random(graine)
+    aleatoire = generateur.random
+    mur, vide = int(TypeCellule.MUR), int(TypeCellule.VIDE)
+    colonnes = (largeur - 1) // 2
+    rangees = (hauteur - 1) // 2
+    arrivee_x, arrivee_y = largeur - 2, hauteur - 2
+    cellule_x = arrivee_x - (1 - arrivee_x % 2)
+
+    ligne_murs = bytearray([mur]) * largeur
+    ligne_cellules = bytearray(ligne_murs)
+    ligne_cellules[1:2 * colonnes:2] = bytearray(colonnes)
+
+    def marquer(y: int, ligne: bytearray) -> bytearray:
+        if y == 1:
+            ligne[1] = TypeCellule.DEPART
+        if y == arrivee_y:
+            ligne[cellule_x] = vide
+            ligne[arrivee_x] = TypeCellule.ARRIVEE
+        return ligne
+
+    yield marquer(0, bytearray(ligne_murs))
+    y = 1
+    ensembles = list(range(colonnes))
+    nouvelle_etiquette = colonnes
+    # Union-find des étiquettes de la rangée courante (vidée à chaque rangée)
+    parents = {}
+
+    def racine(etiquette: int) -> int:
+        while etiquette in parents:
+            etiquette = parents[etiquette]
+        return etiquette
+
+    for rangee in range(rangees):
+        derniere = rangee == rangees - 1
+        parents.clear()
+
+        # Fusions horizontales (toutes celles qui restent possibles sur la dernière rangée)
+        ligne = bytearray(ligne_cellules)
+        for colonne in range(colonnes - 1):
+            gauche, droite = racine(ensembles[colonne]), racine(ensembles[colonne + 1])
+            if gauche != droite and (derniere or aleatoire() < PROBABILITE_FUSION):
+                parents[droite] = gauche
+                ligne[2 * colonne + 2] = vide
+        ensembles = [racine(etiquette) for etiquette in ensembles]
+        yield marquer(y, ligne)
+        y += 1
+        if derniere:
+            break
+
+        # Descentes : au moins une cellule par ensemble, les autres au hasard
+        membres = {}
+        for colonne, etiquette in enumerate(ensembles):
+            membres.setdefault(etiquette, []).append(colonne)
+        suivants = [-1] * colonnes
+        dessous = bytearray(ligne_murs)
+        for etiquette, colonnes_ensemble in membres.items():
+            descentes = [colonne for colonne in colonnes_ensemble if aleatoire() < PROBABILITE_DESCENTE]
+            if not descentes:
+                descentes.append(generateur.choice(colonnes_ensemble))
+            for colonne in descentes:
+                suivants[colonne] = etiquette
+                dessous[2 * colonne + 1] = vide
+        for colonne in range(colonnes):
+            if suivants[colonne] == -1:
+                suivants[colonne] = nouvelle_etiquette
+                nouvelle_etiquette += 1
+        ensembles = suivants
+        yield marquer(y, dessous)
+        y += 1
+
+    # Lignes restantes jusqu'à la bordure basse
+    while y < hauteur:
+        yield marquer(y, bytearray(ligne_murs))
+        y += 1
+
+def ecrire_lignes(fichier: BinaryIO, largeur: int, hauteur: int, graine: Optional[int] = None) -> int:
+    """Écrit le labyrinthe ligne par ligne dans `fichier` et renvoie le nombre d'octets écrits"""
+    taille = 0
+    for ligne in lignes_eller(largeur, hauteur, graine):
+        fichier.write(ligne)
+        taille += len(ligne)
+    return taille
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        sys.exit(__doc__)
+    graine = int(sys.argv[3]) if len(sys.argv) == 4 else None
+    ecrire_lignes(sys.stdout.buffer, int(sys.argv[1]), int(sys.argv[2]), graine)
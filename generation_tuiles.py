@@ -0,0 +1,106 @@
+"""Génération parallèle de très grands labyrinthes parfaits, tuile par tuile
+
+Chaque processus creuse un labyrinthe parfait indépendant (backtracker) dans
+sa tuile, directement dans une grille en mémoire partagée ; une passe de
+couture ouvre ensuite un passage par arête d'un arbre couvrant aléatoire des
+tuiles, ce qui garde l'ensemble de la grille un arbre couvrant.
+"""
+import os
+import random
+from multiprocessing import Pool, RawArray
+from typing import List, Optional, Tuple
+
+from labyrinthe import TypeCellule, creuser_backtracker
+
+# Côté d'une tuile, en cellules (la grille d'une tuile fait 2 * TAILLE_TUILE - 1 de côté)
+TAILLE_TUILE = 256
+
+# Grille partagée d'un processus de la réserve (voir _initialiser)
+_partage = None
+
+
+def _initialiser(partage):
+    global _partage
+    _partage = partage
+
+def bornes_tuiles(cellules: int, taille_tuile: int) -> List[Tuple[int, int]]:
+    """Intervalles [début, fin[ de cellules couverts par chaque tuile sur un axe"""
+    return [(debut, min(debut + taille_tuile, cellules)) for debut in range(0, cellules, taille_tuile)]
+
+def creuser_tuile(tache: Tuple[int, int, int, int, int, int]):
+    """Creuse la tuile (largeur, x0, y0, colonnes, rangées, graine) dans la grille partagée
+
+    La tuile est creusée dans une petite grille locale bordée de murs, dont
+    les lignes intérieures sont ensuite recopiées à leur place : les tuiles
+    ne se recouvrent pas, aucun verrou n'est nécessaire.
+    """
+    largeur, x0, y0, colonnes, rangees, graine = tache
+    largeur_tuile, hauteur_tuile = 2 * colonnes + 1, 2 * rangees + 1
+    tuile = bytearray([TypeCellule.MUR]) * (largeur_tuile * hauteur_tuile)
+    creuser_backtracker(tuile, largeur_tuile, hauteur_tuile, random.Random(graine))
+
+    grille = memoryview(_partage).cast('B')
+    for y in range(1, hauteur_tuile - 1):
+        debut = (y0 + y) * largeur + x0 + 1
+        grille[debut:debut + largeur_tuile - 2] = tuile[y * largeur_tuile + 1:(y + 1) * largeur_tuile - 1]
+
+def generer_tuiles(largeur: int, hauteur: int, graine: Optional[int] = None,
+                   taille_tuile: int = TAILLE_TUILE, processus: Optional[int] = None) -> bytearray:
+    """Grille (octets MUR / VIDE) d'un labyrinthe parfait creusé par tuiles sur `processus` processus
+
+    Mêmes conventions que Labyrinthe.generer_labyrinthe (cellules aux
+    coordonnées impaires, bordure murée), sans le départ ni l'arrivée, que
+    Labyrinthe marque ensuite. Le résultat ne dépend que de `graine` et de
+    `taille_tuile`, pas du nombre de processus (par défaut os.cpu_count(),
+    1 pour tout creuser dans le processus courant).
+    """
+    if taille_tuile < 1:
+        raise ValueError(f"Taille de tuile invalide : {taille_tuile}")
+    generateur = random.Random(graine)
+    tuiles_x = bornes_tuiles((largeur - 1) // 2, taille_tuile)
+    tuiles_y = bornes_tuiles((hauteur - 1) // 2, taille_tuile)
+    taches = [(largeur, 2 * debut_x, 2 * debut_y, fin_x - debut_x, fin_y - debut_y, generateur.getrandbits(32))
+              for debut_y, fin_y in tuiles_y for debut_x, fin_x in tuiles_x]
+
+    partage = RawArray('B', largeur * hauteur)
+    grille = memoryview(partage).cast('B')
+    grille[:] = bytes([TypeCellule.MUR]) * len(grille)
+    processus = processus or os.cpu_count() or 1
+    if processus == 1 or len(taches) == 1:
+        _initialiser(partage)
+        for tache in taches:
+            creuser_tuile(tache)
+    else:
+        with Pool(min(processus, len(taches)), initializer=_initialiser, initargs=(partage,)) as reserve:
+            for _ in reserve.imap_unordered(creuser_tuile, taches):
+                pass
+
+    # Couture : arbre couvrant aléatoire des tuiles (parcours en profondeur),
+    # un passage dans le mur partagé par chaque arête de l'arbre
+    nombre_x = len(tuiles_x)
+    visitees = {0}
+    pile = [0]
+    while pile:
+        tuile = pile[-1]
+        ty, tx = divmod(tuile, nombre_x)
+        voisines = [(voisine_x, voisine_y)
+                    for voisine_x, voisine_y in ((tx + 1, ty), (tx, ty + 1), (tx - 1, ty), (tx, ty - 1))
+                    if 0 <= voisine_x < nombre_x and 0 <= voisine_y < len(tuiles_y)
+                    and voisine_y * nombre_x + voisine_x not in visitees]
+        if not voisines:
+            pile.pop()
+            continue
+        voisine_x, voisine_y = generateur.choice(voisines)
+        if voisine_x != tx:
+            # Mur vertical entre deux tuiles côte à côte, sur une rangée de cellules au hasard
+            x = 2 * tuiles_x[max(tx, voisine_x)][0]
+            y = 2 * generateur.randrange(*tuiles_y[ty]) + 1
+        else:
+            x = 2 * generateur.randrange(*tuiles_x[tx]) + 1
+            y = 2 * tuiles_y[max(ty, voisine_y)][0]
+        grille[y * largeur + x] = TypeCellule.VIDE
+        suivante = voisine_y * nombre_x + voisine_x
+        visitees.add(suivante)
+        pile.append(suivante)
+
+    return bytearray(grille)
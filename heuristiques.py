@@ -0,0 +1,167 @@
+import random
+from array import array
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+from labyrinthe import Labyrinthe, TypeCellule
+
+# Heuristiques acceptées par les recherches de solveur.ALGORITHMES
+HEURISTIQUES = ('manhattan', 'exacte', 'reperes')
+
+# Stratégies de choix des repères (landmarks) de l'heuristique ALT
+STRATEGIES_REPERES = ('eloignes', 'aleatoire', 'peripherie')
+NOMBRE_REPERES = 8
+
+
+def distances_bfs(labyrinthe: Labyrinthe, source: Tuple[int, int]) -> array:
+    """Distance en pas de chaque cellule à `source` (-1 si inaccessible)"""
+    masques = labyrinthe.masques
+    decalages_par_masque = labyrinthe.decalages_par_masque
+    distances = array('i', [-1]) * len(masques)
+
+    index_source = labyrinthe.index(*source)
+    distances[index_source] = 0
+    file = deque([index_source])
+    while file:
+        courant = file.popleft()
+        distance = distances[courant] + 1
+        for decalage in decalages_par_masque[masques[courant]]:
+            voisin = courant + decalage
+            if distances[voisin] == -1:
+                distances[voisin] = distance
+                file.append(voisin)
+
+    return distances
+
+def champ_distances(labyrinthe: Labyrinthe, cible: Tuple[int, int]) -> array:
+    """Champ de distances vers `cible`, calculé une fois puis mis en cache sur le labyrinthe"""
+    cle = ('distances', cible)
+    distances = labyrinthe.cache_pretraitements.get(cle)
+    if distances is None:
+        distances = distances_bfs(labyrinthe, cible)
+        labyrinthe.cache_pretraitements[cle] = distances
+    return distances
+
+class Reperes:
+    """Repères (landmarks) de l'heuristique ALT et leurs tables de distances
+
+    Pour tout repère L, l'inégalité triangulaire donne
+    d(v, t) >= |d(L, t) - d(L, v)| ; le maximum sur les repères est une
+    heuristique admissible et cohérente, valable pour n'importe quelle
+    paire départ / arrivée. Les distances sont entrelacées dans un seul
+    tableau compact (distances[cellule * nombre + j]), sur 16 bits tant
+    que le labyrinthe le permet ; `inaccessible` marque les cellules hors
+    de la composante d'un repère.
+
+    Stratégies : 'eloignes' (chaque repère maximise sa distance aux
+    précédents), 'aleatoire', 'peripherie' (cellules ouvertes les plus
+    proches des coins et des milieux des bords).
+    """
+    def __init__(self, labyrinthe: Labyrinthe, nombre: int = NOMBRE_REPERES,
+                 strategie: str = 'eloignes', graine: Optional[int] = None):
+        if strategie not in STRATEGIES_REPERES:
+            raise ValueError(f"Stratégie de repères inconnue : {strategie}")
+
+        self.labyrinthe = labyrinthe
+        mur = int(TypeCellule.MUR)
+        libres = [index for index, cellule in enumerate(labyrinthe.grille) if cellule != mur]
+        generateur = random.Random(graine)
+
+        tables = []
+        if strategie == 'eloignes':
+            self.cellules = []
+            if libres:
+                # Le premier repère est le point le plus éloigné d'une cellule tirée au hasard
+                distances_min = distances_bfs(labyrinthe, labyrinthe.position(generateur.choice(libres)))
+                while len(self.cellules) < min(nombre, len(libres)):
+                    suivant = max(libres, key=distances_min.__getitem__)
+                    if suivant in self.cellules:
+                        break
+                    self.cellules.append(suivant)
+                    table = distances_bfs(labyrinthe, labyrinthe.position(suivant))
+                    tables.append(table)
+                    # Les cellules d'une autre composante restent à -1 et ne sont jamais choisies
+                    distances_min = array('i', [min(d, t) for d, t in zip(distances_min, table)])
+        elif strategie == 'aleatoire':
+            self.cellules = generateur.sample(libres, min(nombre, len(libres)))
+        else:
+            largeur, hauteur = labyrinthe.largeur, labyrinthe.hauteur
+            points = [(0, 0), (largeur - 1, hauteur - 1), (largeur - 1, 0), (0, hauteur - 1),
+                      (largeur // 2, 0), (largeur // 2, hauteur - 1), (0, hauteur // 2), (largeur - 1, hauteur // 2)]
+            self.cellules = []
+            for px, py in points[:nombre]:
+                proche = min(libres, key=lambda i: abs(i % largeur - px) + abs(i // largeur - py), default=None)
+                if proche is not None and proche not in self.cellules:
+                    self.cellules.append(proche)
+
+        if len(tables) != len(self.cellules):
+            tables = [distances_bfs(labyrinthe, labyrinthe.position(cellule)) for cellule in self.cellules]
+
+        # Table compacte entrelacée
+        self.nombre = len(self.cellules)
+        self.typecode = 'H' if len(libres) < 0xFFFF else 'I'
+        self.inaccessible = 0xFFFF if self.typecode == 'H' else 0xFFFFFFFF
+        self.distances = array(self.typecode, bytes(array(self.typecode).itemsize * self.nombre * len(labyrinthe.grille)))
+        for j, table in enumerate(tables):
+            self.distances[j::self.nombre] = array(self.typecode,
+                                                   [self.inaccessible if d == -1 else d for d in table])
+
+    def vecteur(self, index: int) -> List[int]:
+        """Distances de la cellule `index` à chacun des repères"""
+        debut = index * self.nombre
+        return self.distances[debut:debut + self.nombre].tolist()
+
+    def fonction_vers(self, cible: Tuple[int, int]) -> Callable[[int], int]:
+        """h(indice) vers `cible` : maximum des bornes ALT et de la distance de Manhattan (-1 si inaccessible)"""
+        labyrinthe = self.labyrinthe
+        largeur = labyrinthe.largeur
+        cible_x, cible_y = cible
+        vecteur_cible = self.vecteur(labyrinthe.index(*cible))
+        distances = self.distances
+        nombre = self.nombre
+        inaccessible = self.inaccessible
+        paires = list(enumerate(vecteur_cible))
+
+        def heuristique(index: int) -> int:
+            y, x = divmod(index, largeur)
+            borne = abs(x - cible_x) + abs(y - cible_y)
+            debut = index * nombre
+            for j, distance_cible in paires:
+                distance = distances[debut + j]
+                if distance == inaccessible or distance_cible == inaccessible:
+                    # Un seul des deux hors de la composante du repère : la cible est inaccessible
+                    if distance != distance_cible:
+                        return -1
+                    continue
+                ecart = distance - distance_cible if distance > distance_cible else distance_cible - distance
+                if ecart > borne:
+                    borne = ecart
+            return borne
+
+        return heuristique
+
+def reperes(labyrinthe: Labyrinthe, nombre: int = NOMBRE_REPERES, strategie: str = 'eloignes') -> Reperes:
+    """Repères mis en cache sur le labyrinthe (tirage déterministe, graine 0)"""
+    cle = ('reperes', nombre, strategie)
+    resultat = labyrinthe.cache_pretraitements.get(cle)
+    if resultat is None:
+        resultat = Reperes(labyrinthe, nombre, strategie, graine=0)
+        labyrinthe.cache_pretraitements[cle] = resultat
+    return resultat
+
+def fonction_heuristique(labyrinthe: Labyrinthe, nom: str,
+                         cible: Tuple[int, int]) -> Optional[Callable[[int], int]]:
+    """Heuristique h(indice) vers `cible` pour une recherche
+
+    Renvoie None pour 'manhattan', que les recherches calculent en ligne ;
+    pour 'exacte', h est la vraie distance et pour 'reperes' la borne ALT
+    des repères par défaut (-1 : cible inaccessible depuis la cellule, qui
+    peut donc être élaguée).
+    """
+    if nom == 'manhattan':
+        return None
+    if nom == 'exacte':
+        return champ_distances(labyrinthe, cible).__getitem__
+    if nom == 'reperes':
+        return reperes(labyrinthe).fonction_vers(cible)
+    raise ValueError(f"Heuristique inconnue : {nom}")
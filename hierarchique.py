@@ -0,0 +1,338 @@
+import heapq
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from labyrinthe import BAS, DROITE, Labyrinthe
+from recherche import Recherche
+
+# Côté (en cellules) des clusters carrés du graphe abstrait
+TAILLE_CLUSTER = 16
+# Au-delà de cette longueur, une ouverture entre deux clusters donne deux transitions (une à chaque bout)
+LONGUEUR_OUVERTURE_DOUBLE = 6
+
+
+class GrapheHierarchique:
+    """Graphe abstrait HPA* : clusters, transitions et distances internes
+
+    La grille est découpée en clusters de TAILLE_CLUSTER x TAILLE_CLUSTER.
+    Sur chaque frontière entre deux clusters voisins, chaque ouverture
+    (suite de cellules qui communiquent d'un cluster à l'autre) donne une
+    transition, ou deux à ses extrémités si elle est longue ; les deux
+    cellules d'une transition deviennent des nœuds abstraits reliés par un
+    arc de coût 1 (`passages`). Dans chaque cluster, les nœuds sont reliés
+    par leur distance calculée en restant dans le cluster ; `adjacence`
+    réunit pour chaque nœud ces arcs internes et ses passages.
+    Une recherche dans ce graphe puis le raffinement des seuls clusters
+    traversés donnent un chemin quasi optimal, exact quand chaque ouverture
+    est un simple passage (labyrinthes parfaits). `signaler_modifications`
+    ne reconstruit que les clusters touchés et leurs frontières.
+    """
+    def __init__(self, labyrinthe: Labyrinthe, taille_cluster: int = TAILLE_CLUSTER):
+        self.labyrinthe = labyrinthe
+        self.taille_cluster = taille_cluster
+        self.colonnes = -(-labyrinthe.largeur // taille_cluster)
+        self.lignes = -(-labyrinthe.hauteur // taille_cluster)
+
+        # Frontière (cluster, cluster voisin à droite ou en bas, DROITE ou BAS) -> transitions (cellule, cellule voisine)
+        self.transitions: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
+        # Cellule -> cellules reliées par une transition (coût 1)
+        self.passages: Dict[int, Set[int]] = {}
+        # Cluster -> nœuds abstraits du cluster
+        self.noeuds_par_cluster: Dict[int, Set[int]] = {}
+        # Nœud -> arcs (nœud, coût) internes au cluster puis passages
+        self.adjacence: Dict[int, List[Tuple[int, int]]] = {}
+        self.reconstruire(range(self.colonnes * self.lignes))
+
+    @property
+    def nombre_noeuds(self) -> int:
+        return len(self.passages)
+
+    def cluster(self, index: int) -> int:
+        y, x = divmod(index, self.labyrinthe.largeur)
+        return (y // self.taille_cluster) * self.colonnes + x // self.taille_cluster
+
+    def bornes(self, cluster: int) -> Tuple[int, int, int, int]:
+        """(x_min, y_min, x_max, y_max) du cluster, bornes max exclues"""
+        taille = self.taille_cluster
+        cy, cx = divmod(cluster, self.colonnes)
+        return (cx * taille, cy * taille,
+                min((cx + 1) * taille, self.labyrinthe.largeur), min((cy + 1) * taille, self.labyrinthe.hauteur))
+
+    def frontieres(self, cluster: int) -> List[Tuple[int, int, int]]:
+        """Frontières du cluster avec ses voisins, sous la forme (cluster de gauche ou du haut, autre cluster, direction)
+
+        La direction (DROITE ou BAS) est explicite : avec une seule colonne
+        de clusters, le voisin du bas est aussi cluster + 1.
+        """
+        cy, cx = divmod(cluster, self.colonnes)
+        frontieres = []
+        if cx > 0:
+            frontieres.append((cluster - 1, cluster, DROITE))
+        if cx + 1 < self.colonnes:
+            frontieres.append((cluster, cluster + 1, DROITE))
+        if cy > 0:
+            frontieres.append((cluster - self.colonnes, cluster, BAS))
+        if cy + 1 < self.lignes:
+            frontieres.append((cluster, cluster + self.colonnes, BAS))
+        return frontieres
+
+    def calculer_transitions(self, cluster: int, voisin: int, bit: int) -> List[Tuple[int, int]]:
+        """Transitions de la frontière entre `cluster` et son voisin de droite (bit DROITE) ou du bas (bit BAS)"""
+        labyrinthe = self.labyrinthe
+        masques = labyrinthe.masques
+        x_min, y_min, x_max, y_max = self.bornes(cluster)
+        if bit == DROITE:
+            pas = 1
+            bord = [labyrinthe.index(x_max - 1, y) for y in range(y_min, y_max)]
+        else:
+            pas = labyrinthe.largeur
+            bord = [labyrinthe.index(x, y_max - 1) for x in range(x_min, x_max)]
+
+        transitions = []
+        ouverture = []
+        for cellule in bord + [-1]:
+            if cellule != -1 and masques[cellule] & bit:
+                ouverture.append(cellule)
+                continue
+            if ouverture:
+                if len(ouverture) >= LONGUEUR_OUVERTURE_DOUBLE:
+                    choisies = (ouverture[0], ouverture[-1])
+                else:
+                    choisies = (ouverture[len(ouverture) // 2],)
+                transitions.extend((choisie, choisie + pas) for choisie in choisies)
+                ouverture = []
+        return transitions
+
+    def parcourir_cluster(self, source: int, cluster: int, cibles: Set[int]) -> Dict[int, int]:
+        """Distances de `source` aux cellules `cibles` sans sortir du cluster"""
+        masques = self.labyrinthe.masques
+        decalages_par_masque = self.labyrinthe.decalages_par_masque
+        largeur = self.labyrinthe.largeur
+        x_min, y_min, x_max, y_max = self.bornes(cluster)
+
+        distances = {source: 0}
+        trouvees = {source: 0} if source in cibles else {}
+        file = deque([source])
+        while file and len(trouvees) < len(cibles):
+            courant = file.popleft()
+            distance = distances[courant] + 1
+            for decalage in decalages_par_masque[masques[courant]]:
+                voisin = courant + decalage
+                if voisin in distances:
+                    continue
+                y, x = divmod(voisin, largeur)
+                if x_min <= x < x_max and y_min <= y < y_max:
+                    distances[voisin] = distance
+                    if voisin in cibles:
+                        trouvees[voisin] = distance
+                    file.append(voisin)
+        return trouvees
+
+    def chemin_dans_cluster(self, source: int, cible: int, cluster: int) -> List[int]:
+        """Plus court chemin de `source` à `cible` sans sortir du cluster, source exclue"""
+        masques = self.labyrinthe.masques
+        decalages_par_masque = self.labyrinthe.decalages_par_masque
+        largeur = self.labyrinthe.largeur
+        x_min, y_min, x_max, y_max = self.bornes(cluster)
+
+        parents = {source: -1}
+        file = deque([source])
+        while file:
+            courant = file.popleft()
+            if courant == cible:
+                break
+            for decalage in decalages_par_masque[masques[courant]]:
+                voisin = courant + decalage
+                if voisin in parents:
+                    continue
+                y, x = divmod(voisin, largeur)
+                if x_min <= x < x_max and y_min <= y < y_max:
+                    parents[voisin] = courant
+                    file.append(voisin)
+
+        cellules = []
+        while cible != source:
+            cellules.append(cible)
+            cible = parents[cible]
+        cellules.reverse()
+        return cellules
+
+    def noeuds(self, cluster: int) -> Set[int]:
+        """Nœuds abstraits (cellules de transition) situés dans le cluster"""
+        noeuds = set()
+        for frontiere in self.frontieres(cluster):
+            for cellule, voisine in self.transitions.get(frontiere, ()):
+                noeuds.add(cellule if frontiere[0] == cluster else voisine)
+        return noeuds
+
+    def reconstruire(self, clusters: Iterable[int]):
+        """Recalcule les transitions autour des clusters donnés et les distances internes concernées"""
+        frontieres = {frontiere for cluster in clusters for frontiere in self.frontieres(cluster)}
+        passages = self.passages
+        for frontiere in frontieres:
+            for cellule, voisine in self.transitions.pop(frontiere, ()):
+                for a, b in ((cellule, voisine), (voisine, cellule)):
+                    passages[a].discard(b)
+                    if not passages[a]:
+                        del passages[a]
+
+            transitions = self.calculer_transitions(*frontiere)
+            self.transitions[frontiere] = transitions
+            for cellule, voisine in transitions:
+                passages.setdefault(cellule, set()).add(voisine)
+                passages.setdefault(voisine, set()).add(cellule)
+
+        # Les clusters des deux côtés d'une frontière recalculée ont pu gagner ou perdre des nœuds
+        adjacence = self.adjacence
+        for cluster in {cluster for frontiere in frontieres for cluster in frontiere[:2]}:
+            for noeud in self.noeuds_par_cluster.pop(cluster, ()):
+                del adjacence[noeud]
+
+            noeuds = self.noeuds(cluster)
+            self.noeuds_par_cluster[cluster] = noeuds
+            for noeud in noeuds:
+                arcs = [(autre, distance) for autre, distance in self.parcourir_cluster(noeud, cluster, noeuds).items()
+                        if autre != noeud]
+                arcs.extend((voisine, 1) for voisine in passages[noeud])
+                adjacence[noeud] = arcs
+
+    def signaler_modifications(self, cellules: Iterable[int]):
+        """Reconstruit les clusters des cellules modifiées (voir Labyrinthe.basculer_mur)
+
+        La mise à jour des masques vide le cache du labyrinthe : le graphe
+        s'y réinscrit pour rester partagé par les recherches suivantes.
+        """
+        self.reconstruire({self.cluster(cellule) for cellule in cellules})
+        self.labyrinthe.cache_pretraitements[('hierarchie', self.taille_cluster)] = self
+
+def graphe_hierarchique(labyrinthe: Labyrinthe, taille_cluster: int = TAILLE_CLUSTER) -> GrapheHierarchique:
+    """Graphe HPA* mis en cache sur le labyrinthe"""
+    cle = ('hierarchie', taille_cluster)
+    graphe = labyrinthe.cache_pretraitements.get(cle)
+    if graphe is None:
+        graphe = GrapheHierarchique(labyrinthe, taille_cluster)
+        labyrinthe.cache_pretraitements[cle] = graphe
+    return graphe
+
+class RechercheHierarchique(Recherche):
+    """HPA* : A* sur le graphe abstrait puis raffinement, même interface que solveur.RechercheAStar
+
+    Le départ et l'arrivée sont reliés aux nœuds de leur cluster le temps
+    de la requête. Les indices manipulés par `etape` et `voisins_ouverts`
+    sont ceux des nœuds abstraits ; le chemin en cellules n'est raffiné,
+    cluster par cluster, qu'une fois l'arrivée atteinte.
+    """
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan'):
+        super().__init__(labyrinthe, depart, arrivee, heuristique)
+        self.graphe = graphe = graphe_hierarchique(labyrinthe)
+
+        self.i_depart = labyrinthe.index(*self.depart)
+        self.i_arrivee = labyrinthe.index(*self.arrivee)
+        cluster_depart, cluster_arrivee = graphe.cluster(self.i_depart), graphe.cluster(self.i_arrivee)
+        noeuds_depart = set(graphe.noeuds_par_cluster.get(cluster_depart, ()))
+        noeuds_arrivee = set(graphe.noeuds_par_cluster.get(cluster_arrivee, ()))
+        if cluster_depart == cluster_arrivee:
+            noeuds_depart.add(self.i_arrivee)
+        # Arcs temporaires : départ -> nœuds de son cluster, nœuds du cluster d'arrivée -> arrivée
+        self.aretes_depart = list(graphe.parcourir_cluster(self.i_depart, cluster_depart, noeuds_depart).items())
+        self.aretes_arrivee = graphe.parcourir_cluster(self.i_arrivee, cluster_arrivee, noeuds_arrivee)
+
+        self.scores_g = {self.i_depart: 0}
+        self.parents = {self.i_depart: -1}
+        self.fermes = set()
+        self.compteur = 0
+        h_depart = self.h(self.i_depart)
+        self.liste_ouverte = [(h_depart, 0, self.i_depart)] if h_depart != -1 else []
+
+        self.noeuds_chemin = 0
+
+    def successeurs(self, noeud: int) -> List[Tuple[int, int]]:
+        """Arcs (nœud, coût) sortant d'un nœud abstrait, arcs temporaires compris"""
+        arcs = self.graphe.adjacence.get(noeud, [])
+        distance = self.aretes_arrivee.get(noeud)
+        if noeud == self.i_depart or distance is not None:
+            arcs = arcs + self.aretes_depart if noeud == self.i_depart else list(arcs)
+            if distance is not None:
+                arcs.append((self.i_arrivee, distance))
+        return arcs
+
+    def etape(self) -> int:
+        """Développe le meilleur nœud abstrait ouvert et renvoie sa cellule (-1 si la liste ouverte est vide)"""
+        liste_ouverte = self.liste_ouverte
+        fermes = self.fermes
+
+        while liste_ouverte:
+            courant = heapq.heappop(liste_ouverte)[2]
+            if courant not in fermes:
+                break
+        else:
+            return -1
+
+        fermes.add(courant)
+        self.noeuds_explores += 1
+
+        if courant == self.i_arrivee:
+            self.chemin = self.reconstruire_chemin(courant)
+            self.termine = True
+            return courant
+
+        largeur = self.labyrinthe.largeur
+        arrivee_x, arrivee_y = self.arrivee
+        heuristique = self.heuristique
+        scores_g = self.scores_g
+        g_courant = scores_g[courant]
+
+        for voisin, cout in self.successeurs(courant):
+            if voisin in fermes:
+                continue
+            g_nouveau = g_courant + cout
+            g_voisin = scores_g.get(voisin)
+            if g_voisin is None or g_nouveau < g_voisin:
+                if heuristique is None:
+                    voisin_y, voisin_x = divmod(voisin, largeur)
+                    h = abs(voisin_x - arrivee_x) + abs(voisin_y - arrivee_y)
+                else:
+                    h = heuristique(voisin)
+                    if h == -1:
+                        continue
+                scores_g[voisin] = g_nouveau
+                self.parents[voisin] = courant
+                self.compteur += 1
+                heapq.heappush(liste_ouverte, (g_nouveau + h, self.compteur, voisin))
+
+        return courant
+
+    def voisins_ouverts(self, courant: int) -> List[int]:
+        """Nœuds abstraits ouverts (ou améliorés) par le développement de `courant`"""
+        parents = self.parents
+        return [voisin for voisin, _ in self.successeurs(courant) if parents.get(voisin) == courant]
+
+    def reconstruire_chemin(self, noeud: int) -> List[Tuple[int, int]]:
+        """Raffine le chemin abstrait : passages entre clusters, plus courts chemins dans chaque cluster"""
+        graphe = self.graphe
+        noeuds = []
+        while noeud != -1:
+            noeuds.append(noeud)
+            noeud = self.parents[noeud]
+        noeuds.reverse()
+        self.noeuds_chemin = len(noeuds)
+
+        cellules = [noeuds[0]]
+        for source, cible in zip(noeuds, noeuds[1:]):
+            cluster = graphe.cluster(source)
+            if graphe.cluster(cible) != cluster:
+                cellules.append(cible)
+            else:
+                cellules.extend(graphe.chemin_dans_cluster(source, cible, cluster))
+        largeur = self.labyrinthe.largeur
+        return [(cellule % largeur, cellule // largeur) for cellule in cellules]
+
+    def remplir_statistiques(self, statistiques: Dict):
+        statistiques['noeuds_explores'] = self.noeuds_explores
+        statistiques['noeuds_en_attente'] = len(self.liste_ouverte)
+        statistiques['longueur_chemin'] = max(0, len(self.chemin) - 1)
+        # Part des nœuds abstraits développés qui appartiennent à la solution
+        statistiques['efficacite'] = (self.noeuds_chemin / max(1, self.noeuds_explores)) * 100
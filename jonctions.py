@@ -0,0 +1,201 @@
+import heapq
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from labyrinthe import Labyrinthe
+from recherche import Recherche
+
+
+class GrapheJonctions:
+    """Graphe pondéré des jonctions d'un labyrinthe
+
+    Les nœuds sont les cellules praticables qui ne sont pas de simples
+    couloirs (degré différent de 2 : carrefours et culs-de-sac), plus des
+    points imposés comme le départ et l'arrivée. Chaque couloir entre deux
+    nœuds devient une arête dont le poids est sa longueur en cellules.
+    L'adjacence est stockée au format CSR : les arêtes du nœud k occupent
+    les positions debuts[k] à debuts[k + 1] des tableaux `cibles`, `poids`
+    et `decalages`, ce dernier donnant le premier pas du couloir pour
+    pouvoir le redérouler cellule par cellule.
+    """
+    def __init__(self, labyrinthe: Labyrinthe, points_fixes: Tuple[Tuple[int, int], ...] = ()):
+        self.labyrinthe = labyrinthe
+        masques = labyrinthe.masques
+        decalages_par_masque = labyrinthe.decalages_par_masque
+
+        # Sélection des nœuds
+        self.noeud_de_cellule = array('i', [-1]) * len(masques)
+        self.cellules = array('i')
+        fixes = {labyrinthe.index(*point) for point in points_fixes}
+        for index, masque in enumerate(masques):
+            if masque and (len(decalages_par_masque[masque]) != 2 or index in fixes):
+                self.noeud_de_cellule[index] = len(self.cellules)
+                self.cellules.append(index)
+        for index in fixes:
+            if self.noeud_de_cellule[index] == -1:
+                self.noeud_de_cellule[index] = len(self.cellules)
+                self.cellules.append(index)
+
+        # Parcours de chaque couloir depuis chacune de ses extrémités
+        self.debuts = array('i', [0])
+        self.cibles = array('i')
+        self.poids = array('i')
+        self.decalages = array('i')
+        noeud_de_cellule = self.noeud_de_cellule
+        for cellule in self.cellules:
+            for decalage in decalages_par_masque[masques[cellule]]:
+                precedente, courante, longueur = cellule, cellule + decalage, 1
+                while noeud_de_cellule[courante] == -1:
+                    for pas in decalages_par_masque[masques[courante]]:
+                        if courante + pas != precedente:
+                            precedente, courante = courante, courante + pas
+                            break
+                    longueur += 1
+
+                self.cibles.append(noeud_de_cellule[courante])
+                self.poids.append(longueur)
+                self.decalages.append(decalage)
+            self.debuts.append(len(self.cibles))
+
+    @property
+    def nombre_noeuds(self) -> int:
+        return len(self.cellules)
+
+    def derouler_arete(self, arete: int, source: int) -> List[int]:
+        """Cellules du couloir `arete` parcouru depuis le nœud `source`, source exclue"""
+        labyrinthe = self.labyrinthe
+        masques = labyrinthe.masques
+        decalages_par_masque = labyrinthe.decalages_par_masque
+        cellule_cible = self.cellules[self.cibles[arete]]
+
+        precedente = self.cellules[source]
+        courante = precedente + self.decalages[arete]
+        cellules = [courante]
+        while courante != cellule_cible:
+            for pas in decalages_par_masque[masques[courante]]:
+                if courante + pas != precedente:
+                    precedente, courante = courante, courante + pas
+                    break
+            cellules.append(courante)
+        return cellules
+
+def graphe_jonctions(labyrinthe: Labyrinthe, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> GrapheJonctions:
+    """Graphe des jonctions mis en cache sur le labyrinthe pour ces extrémités"""
+    cle = ('jonctions', depart, arrivee)
+    graphe = labyrinthe.cache_pretraitements.get(cle)
+    if graphe is None:
+        graphe = GrapheJonctions(labyrinthe, (depart, arrivee))
+        labyrinthe.cache_pretraitements[cle] = graphe
+    return graphe
+
+class RechercheJonctions(Recherche):
+    """A* sur le graphe des jonctions, même interface que solveur.RechercheAStar
+
+    Les indices manipulés par `etape` et `voisins_ouverts` sont ceux des
+    cellules de jonction ; le chemin complet en cellules n'est reconstruit
+    qu'une fois l'arrivée atteinte.
+    """
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan'):
+        super().__init__(labyrinthe, depart, arrivee, heuristique)
+        self.graphe = graphe_jonctions(labyrinthe, self.depart, self.arrivee)
+
+        nombre_noeuds = self.graphe.nombre_noeuds
+        self.scores_g = array('i', [-1]) * nombre_noeuds
+        self.parents = array('i', [-1]) * nombre_noeuds
+        self.aretes_parents = array('i', [-1]) * nombre_noeuds
+        self.fermes = bytearray(nombre_noeuds)
+
+        noeud_de_cellule = self.graphe.noeud_de_cellule
+        self.n_depart = noeud_de_cellule[labyrinthe.index(*self.depart)]
+        self.n_arrivee = noeud_de_cellule[labyrinthe.index(*self.arrivee)]
+        self.scores_g[self.n_depart] = 0
+        self.compteur = 0
+        h_depart = self.h(self.graphe.cellules[self.n_depart])
+        self.liste_ouverte = [(h_depart, 0, self.n_depart)] if h_depart != -1 else []
+
+        self.noeuds_chemin = 0
+
+    def etape(self) -> int:
+        """Développe la meilleure jonction ouverte et renvoie sa cellule (-1 si la liste ouverte est vide)"""
+        liste_ouverte = self.liste_ouverte
+        fermes = self.fermes
+
+        while liste_ouverte:
+            courant = heapq.heappop(liste_ouverte)[2]
+            if not fermes[courant]:
+                break
+        else:
+            return -1
+
+        fermes[courant] = 1
+        self.noeuds_explores += 1
+        graphe = self.graphe
+        cellules = graphe.cellules
+
+        if courant == self.n_arrivee:
+            self.chemin = self.reconstruire_chemin(courant)
+            self.termine = True
+            return cellules[courant]
+
+        largeur = self.labyrinthe.largeur
+        arrivee_x, arrivee_y = self.arrivee
+        heuristique = self.heuristique
+        scores_g = self.scores_g
+        cibles, poids = graphe.cibles, graphe.poids
+        g_courant = scores_g[courant]
+
+        for arete in range(graphe.debuts[courant], graphe.debuts[courant + 1]):
+            voisin = cibles[arete]
+            if fermes[voisin]:
+                continue
+            g_nouveau = g_courant + poids[arete]
+            g_voisin = scores_g[voisin]
+            if g_voisin == -1 or g_nouveau < g_voisin:
+                if heuristique is None:
+                    voisin_y, voisin_x = divmod(cellules[voisin], largeur)
+                    h = abs(voisin_x - arrivee_x) + abs(voisin_y - arrivee_y)
+                else:
+                    h = heuristique(cellules[voisin])
+                    if h == -1:
+                        continue
+                scores_g[voisin] = g_nouveau
+                self.parents[voisin] = courant
+                self.aretes_parents[voisin] = arete
+                self.compteur += 1
+                heapq.heappush(liste_ouverte, (g_nouveau + h, self.compteur, voisin))
+
+        return cellules[courant]
+
+    def voisins_ouverts(self, courant: int) -> List[int]:
+        """Cellules des jonctions ouvertes (ou améliorées) par le développement de la cellule `courant`"""
+        graphe = self.graphe
+        noeud = graphe.noeud_de_cellule[courant]
+        return [graphe.cellules[graphe.cibles[arete]]
+                for arete in range(graphe.debuts[noeud], graphe.debuts[noeud + 1])
+                if self.aretes_parents[graphe.cibles[arete]] == arete]
+
+    def reconstruire_chemin(self, noeud: int) -> List[Tuple[int, int]]:
+        """Redéroule les couloirs des arêtes du chemin de jonctions"""
+        largeur = self.labyrinthe.largeur
+        troncons = []
+        self.noeuds_chemin = 1
+        while self.parents[noeud] != -1:
+            parent = self.parents[noeud]
+            troncons.append(self.graphe.derouler_arete(self.aretes_parents[noeud], parent))
+            noeud = parent
+            self.noeuds_chemin += 1
+
+        cellules = [self.graphe.cellules[noeud]]
+        for troncon in reversed(troncons):
+            cellules.extend(troncon)
+        return [(cellule % largeur, cellule // largeur) for cellule in cellules]
+
+    def remplir_statistiques(self, statistiques: Dict):
+        statistiques['noeuds_explores'] = self.noeuds_explores
+        statistiques['noeuds_en_attente'] = len(self.liste_ouverte)
+        statistiques['longueur_chemin'] = max(0, len(self.chemin) - 1)
+        # Part des jonctions développées qui appartiennent à la solution
+        statistiques['efficacite'] = (self.noeuds_chemin / max(1, self.noeuds_explores)) * 100
@@ -0,0 +1,224 @@
+import random
+from enum import IntEnum
+from typing import Iterable, List, Optional, Tuple
+
+
+class TypeCellule(IntEnum):
+    VIDE = 0
+    MUR = 1
+    DEPART = 2
+    ARRIVEE = 3
+    LISTE_OUVERTE = 4
+    LISTE_FERMEE = 5
+    CHEMIN_FINAL = 6
+
+# Tailles (largeur, hauteur) des niveaux de difficulté du jeu
+TAILLES_DIFFICULTE = {
+    'FACILE': (30, 20),
+    'MOYEN': (50, 35),
+    'DIFFICILE': (70, 50),
+    'EXTREME': (100, 70)
+}
+
+# Algorithmes de génération : backtracker récursif en mémoire, Eller ligne par ligne (generation_lignes.py),
+# backtracker par tuiles réparties sur plusieurs processus (generation_tuiles.py)
+ALGORITHMES_GENERATION = ('backtracker', 'eller', 'tuiles')
+
+# Bits du masque de directions ouvertes d'une cellule
+BAS = 1
+DROITE = 2
+HAUT = 4
+GAUCHE = 8
+
+def table_decalages(largeur: int) -> Tuple[Tuple[int, ...], ...]:
+    """Décalages d'indice des voisins ouverts pour chacun des 16 masques de directions"""
+    return tuple(
+        tuple(decalage for bit, decalage in ((BAS, largeur), (DROITE, 1), (HAUT, -largeur), (GAUCHE, -1))
+              if masque & bit)
+        for masque in range(16)
+    )
+
+def creuser_backtracker(grille: bytearray, largeur: int, hauteur: int, generateur=random):
+    """Creuse un labyrinthe parfait (backtracker récursif itératif) dans `grille`, remplie de murs
+
+    Les cellules sont aux coordonnées impaires, à partir de (1, 1) ; la
+    bordure reste murée. `generateur` fournit `choice` (module random ou
+    random.Random).
+    """
+    mur, vide = int(TypeCellule.MUR), int(TypeCellule.VIDE)
+    # Bornes des cellules creusables (la bordure reste toujours un mur)
+    x_max, y_max = largeur - 1, hauteur - 1
+    saut_y = 2 * largeur
+
+    stack = []
+    start = largeur + 1
+    grille[start] = vide
+    stack.append(start)
+
+    while stack:
+        courant = stack[-1]
+        current_y, current_x = divmod(courant, largeur)
+
+        # Même ordre de directions que la version 2D : (0, 2), (2, 0), (0, -2), (-2, 0)
+        voisins = []
+        if current_y + 2 < y_max and grille[courant + saut_y] == mur:
+            voisins.append(courant + saut_y)
+        if current_x + 2 < x_max and grille[courant + 2] == mur:
+            voisins.append(courant + 2)
+        if current_y - 2 > 0 and grille[courant - saut_y] == mur:
+            voisins.append(courant - saut_y)
+        if current_x - 2 > 0 and grille[courant - 2] == mur:
+            voisins.append(courant - 2)
+
+        if voisins:
+            suivant = generateur.choice(voisins)
+            grille[(courant + suivant) // 2] = vide
+            grille[suivant] = vide
+            stack.append(suivant)
+        else:
+            stack.pop()
+
+
+class Labyrinthe:
+    """Labyrinthe sans dépendance graphique : grille, génération et voisinage
+
+    La grille est un bytearray à plat (un octet TypeCellule par cellule),
+    la cellule (x, y) se trouvant à l'indice y * largeur + x.
+    `masques` contient pour chaque cellule ses directions ouvertes (bits BAS,
+    DROITE, HAUT, GAUCHE) et `decalages_par_masque` associe à chaque masque
+    le tuple des décalages d'indices voisins, ce qui permet de parcourir les
+    voisins sans aucune allocation. Toute modification de `grille` doit être
+    suivie d'un appel à `calculer_masques` (ou à `mettre_a_jour_masques` pour
+    les seules cellules touchées), qui invalide aussi les prétraitements mis
+    en cache dans `cache_pretraitements`.
+
+    Avec une `graine`, la génération est reproductible : (algorithme,
+    largeur, hauteur, graine) désigne toujours la même grille. Sans graine,
+    elle suit le module `random` global. `grille`, si elle est fournie
+    (octets TypeCellule, par exemple lus dans cache_labyrinthes), est
+    reprise telle quelle au lieu d'être générée.
+    """
+    def __init__(self, largeur: int, hauteur: int, graine: Optional[int] = None,
+                 algorithme: str = 'backtracker', grille: Optional[bytes] = None):
+        if algorithme not in ALGORITHMES_GENERATION:
+            raise ValueError(f"Algorithme de génération inconnu : {algorithme}")
+        if grille is not None and len(grille) != largeur * hauteur:
+            raise ValueError(f"Grille de {len(grille)} cellules pour un labyrinthe {largeur}x{hauteur}")
+
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.graine = graine
+        self.algorithme = algorithme
+        self.grille = bytearray([TypeCellule.MUR]) * (largeur * hauteur)
+        self.masques = bytearray(largeur * hauteur)
+        self.cache_pretraitements = {}
+        self.decalages_par_masque = table_decalages(largeur)
+        self.depart = (1, 1)
+        self.arrivee = (largeur - 2, hauteur - 2)
+        if grille is None:
+            self.generer_labyrinthe()
+        else:
+            self.grille[:] = grille
+            self.calculer_masques()
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.largeur + x
+
+    def position(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.largeur)
+        return (x, y)
+
+    def generer_labyrinthe(self):
+        largeur = self.largeur
+        grille = self.grille
+        generateur = random if self.graine is None else random.Random(self.graine)
+
+        if self.algorithme == 'eller':
+            # Import local : generation_lignes dépend de ce module
+            from generation_lignes import lignes_eller
+            graine = self.graine if self.graine is not None else random.getrandbits(32)
+            grille[:] = b''.join(lignes_eller(largeur, self.hauteur, graine))
+            self.calculer_masques()
+            return
+
+        mur, vide = int(TypeCellule.MUR), int(TypeCellule.VIDE)
+        if self.algorithme == 'tuiles':
+            # Import local : generation_tuiles dépend de ce module
+            from generation_tuiles import generer_tuiles
+            graine = self.graine if self.graine is not None else random.getrandbits(32)
+            grille[:] = generer_tuiles(largeur, self.hauteur, graine)
+        else:
+            grille[:] = bytearray([mur]) * len(grille)
+            creuser_backtracker(grille, largeur, self.hauteur, generateur)
+
+        # Seules les cellules impaires sont creusées : relier l'arrivée
+        # (coordonnées paires si la grille est de taille paire) à la cellule impaire voisine
+        cellule_x = self.arrivee[0] - (1 - self.arrivee[0] % 2)
+        cellule_y = self.arrivee[1] - (1 - self.arrivee[1] % 2)
+        grille[self.index(cellule_x, self.arrivee[1])] = vide
+        grille[self.index(cellule_x, cellule_y)] = vide
+
+        grille[self.index(*self.depart)] = TypeCellule.DEPART
+        grille[self.index(*self.arrivee)] = TypeCellule.ARRIVEE
+
+        self.calculer_masques()
+
+    def calculer_masques(self):
+        """Précalcule le masque de directions ouvertes de chaque cellule"""
+        self.mettre_a_jour_masques(range(self.largeur * self.hauteur))
+
+    def mettre_a_jour_masques(self, indices: Iterable[int]):
+        """Recalcule le masque des cellules `indices` et invalide les prétraitements"""
+        largeur, hauteur = self.largeur, self.hauteur
+        grille = self.grille
+        masques = self.masques
+        mur = int(TypeCellule.MUR)
+        self.cache_pretraitements.clear()
+
+        for index in indices:
+            if grille[index] == mur:
+                masques[index] = 0
+                continue
+
+            y, x = divmod(index, largeur)
+            masque = 0
+            if y + 1 < hauteur and grille[index + largeur] != mur:
+                masque |= BAS
+            if x + 1 < largeur and grille[index + 1] != mur:
+                masque |= DROITE
+            if y > 0 and grille[index - largeur] != mur:
+                masque |= HAUT
+            if x > 0 and grille[index - 1] != mur:
+                masque |= GAUCHE
+            masques[index] = masque
+
+    def basculer_mur(self, x: int, y: int) -> List[int]:
+        """Ajoute ou retire le mur en (x, y) et renvoie les indices dont le masque a pu changer
+
+        La bordure, le départ et l'arrivée ne sont pas modifiables (ValueError).
+        """
+        if not (0 < x < self.largeur - 1 and 0 < y < self.hauteur - 1):
+            raise ValueError(f"Cellule hors de la zone modifiable : {(x, y)}")
+        if (x, y) in (self.depart, self.arrivee):
+            raise ValueError("Le départ et l'arrivée ne peuvent pas devenir des murs")
+
+        index = self.index(x, y)
+        mur = int(TypeCellule.MUR)
+        self.grille[index] = TypeCellule.VIDE if self.grille[index] == mur else mur
+        cellules = [index, index + self.largeur, index + 1, index - self.largeur, index - 1]
+        self.mettre_a_jour_masques(cellules)
+        return cellules
+
+    def est_valide(self, x: int, y: int) -> bool:
+        return (0 <= x < self.largeur and
+                0 <= y < self.hauteur and
+                self.grille[y * self.largeur + x] != TypeCellule.MUR)
+
+    def obtenir_voisins_index(self, index: int) -> List[int]:
+        """Voisins praticables d'une cellule, en indices à plat"""
+        return [index + decalage for decalage in self.decalages_par_masque[self.masques[index]]]
+
+    def obtenir_voisins(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        largeur = self.largeur
+        return [(i % largeur, i // largeur)
+                for i in self.obtenir_voisins_index(position[1] * largeur + position[0])]
@@ -0,0 +1,172 @@
+"""Chaîne de traitement sans fenêtre : générer, résoudre, analyser
+
+Chaque sous-commande lit l'entrée standard et écrit la sortie standard, un
+labyrinthe ou un résultat à la fois, en mémoire constante quelle que soit la
+taille du corpus :
+
+    python ligne_commande.py generer 1001 1001 --nombre 1000 --graine 1 \\
+        | python ligne_commande.py resoudre --algorithme jps \\
+        | python ligne_commande.py analyser
+
+`exporter` écrit des paires labyrinthe / solution par fragments (export_donnees).
+
+Labyrinthes : une ligne JSON par labyrinthe (dimensions, graine, algorithme de
+génération, départ, arrivée et murs en bits de fichier_labyrinthe encodés en
+base64), ou avec --binaire des enregistrements fichier_labyrinthe écrits à la
+suite ; `resoudre` reconnaît les deux formats. Résultats : une ligne JSON par
+labyrinthe, avec les statistiques de solveur.resoudre_a_star.
+"""
+import argparse
+import base64
+import json
+import sys
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from export_donnees import FORMATS_EXPORT, TAILLE_FRAGMENT, exporter
+from fichier_labyrinthe import SIGNATURE, deballer_murs, empaqueter_murs, enregistrer, lire_flux
+from heuristiques import HEURISTIQUES
+from labyrinthe import ALGORITHMES_GENERATION, Labyrinthe, TypeCellule
+from solveur import ALGORITHMES, DEPARTAGES, resoudre_a_star
+
+# Statistiques résumées par `analyser` (moyenne, minimum, maximum)
+CHAMPS_ANALYSES = ('longueur_chemin', 'noeuds_explores', 'temps_execution', 'efficacite')
+
+
+def labyrinthe_vers_json(labyrinthe: Labyrinthe) -> Dict:
+    return {
+        'largeur': labyrinthe.largeur,
+        'hauteur': labyrinthe.hauteur,
+        'graine': labyrinthe.graine,
+        'algorithme': labyrinthe.algorithme,
+        'depart': list(labyrinthe.depart),
+        'arrivee': list(labyrinthe.arrivee),
+        'murs': base64.b64encode(empaqueter_murs(bytes(labyrinthe.grille))).decode('ascii')
+    }
+
+def labyrinthe_depuis_json(enregistrement: Dict) -> Labyrinthe:
+    largeur, hauteur = enregistrement['largeur'], enregistrement['hauteur']
+    grille = deballer_murs(base64.b64decode(enregistrement['murs']), largeur * hauteur)
+    depart, arrivee = tuple(enregistrement['depart']), tuple(enregistrement['arrivee'])
+    grille[depart[1] * largeur + depart[0]] = TypeCellule.DEPART
+    grille[arrivee[1] * largeur + arrivee[0]] = TypeCellule.ARRIVEE
+    labyrinthe = Labyrinthe(largeur, hauteur, enregistrement.get('graine'),
+                            enregistrement.get('algorithme') or 'backtracker', grille)
+    labyrinthe.depart, labyrinthe.arrivee = depart, arrivee
+    return labyrinthe
+
+def generer(largeur: int, hauteur: int, nombre: int, graine: int = 0,
+            algorithme: str = 'backtracker') -> Iterator[Labyrinthe]:
+    """`nombre` labyrinthes de graines successives à partir de `graine`"""
+    for decalage in range(nombre):
+        yield Labyrinthe(largeur, hauteur, graine + decalage, algorithme)
+
+def lire_labyrinthes(flux: BinaryIO) -> Iterator[Labyrinthe]:
+    """Labyrinthes d'un flux binaire (enregistrements fichier_labyrinthe) ou JSON (une ligne par labyrinthe)"""
+    if flux.peek(len(SIGNATURE))[:len(SIGNATURE)] == SIGNATURE:
+        yield from lire_flux(flux)
+        return
+    for ligne in flux:
+        if ligne.strip():
+            yield labyrinthe_depuis_json(json.loads(ligne))
+
+def resoudre(labyrinthes: Iterable[Labyrinthe], algorithme: str = 'a_star', heuristique: str = 'manhattan',
+             avec_chemin: bool = False, **options) -> Iterator[Dict]:
+    """Statistiques de résolution de chaque labyrinthe (et son chemin si `avec_chemin`)"""
+    for labyrinthe in labyrinthes:
+        chemin, statistiques = resoudre_a_star(labyrinthe, algorithme=algorithme, heuristique=heuristique,
+                                               **options)
+        resultat = {'largeur': labyrinthe.largeur, 'hauteur': labyrinthe.hauteur, 'graine': labyrinthe.graine}
+        resultat.update(statistiques)
+        if avec_chemin:
+            resultat['chemin'] = [list(position) for position in chemin]
+        yield resultat
+
+def analyser(resultats: Iterable[Dict]) -> Dict:
+    """Résumé d'un flux de résultats : nombre, labyrinthes résolus, moyenne / min / max de CHAMPS_ANALYSES"""
+    nombre = resolus = 0
+    sommes = dict.fromkeys(CHAMPS_ANALYSES, 0)
+    minimums = dict.fromkeys(CHAMPS_ANALYSES, float('inf'))
+    maximums = dict.fromkeys(CHAMPS_ANALYSES, float('-inf'))
+    for resultat in resultats:
+        nombre += 1
+        resolus += resultat['longueur_chemin'] > 0
+        for champ in CHAMPS_ANALYSES:
+            valeur = resultat[champ]
+            sommes[champ] += valeur
+            minimums[champ] = min(minimums[champ], valeur)
+            maximums[champ] = max(maximums[champ], valeur)
+
+    resume = {'labyrinthes': nombre, 'resolus': resolus}
+    if nombre:
+        for champ in CHAMPS_ANALYSES:
+            resume[champ] = {'moyenne': sommes[champ] / nombre, 'min': minimums[champ], 'max': maximums[champ]}
+    return resume
+
+def ecrire_json(resultats: Iterable[Dict], sortie: TextIO):
+    for resultat in resultats:
+        sortie.write(json.dumps(resultat, ensure_ascii=False) + '\n')
+
+def executer_commande(parametres: argparse.Namespace):
+    if parametres.commande in ('generer', 'generate'):
+        labyrinthes = generer(parametres.largeur, parametres.hauteur, parametres.nombre,
+                              parametres.graine, parametres.algorithme)
+        if parametres.binaire:
+            for labyrinthe in labyrinthes:
+                enregistrer(labyrinthe, sys.stdout.buffer)
+        else:
+            ecrire_json(map(labyrinthe_vers_json, labyrinthes), sys.stdout)
+    elif parametres.commande in ('resoudre', 'solve'):
+        options = {nom: getattr(parametres, nom) for nom in ('departage', 'poids')
+                   if getattr(parametres, nom) is not None}
+        ecrire_json(resoudre(lire_labyrinthes(sys.stdin.buffer), parametres.algorithme, parametres.heuristique,
+                             parametres.chemin, **options), sys.stdout)
+    elif parametres.commande in ('exporter', 'export'):
+        exportes = exporter(parametres.dossier, parametres.largeur, parametres.hauteur, parametres.nombre,
+                            parametres.graine, parametres.algorithme, parametres.taille_fragment,
+                            parametres.format, parametres.processus)
+        ecrire_json([{'dossier': parametres.dossier, 'echantillons': exportes}], sys.stdout)
+    else:
+        ecrire_json([analyser(map(json.loads, filter(str.strip, sys.stdin)))], sys.stdout)
+
+def main(arguments: Optional[List[str]] = None):
+    analyseur = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    sous_commandes = analyseur.add_subparsers(dest='commande', required=True)
+
+    commande = sous_commandes.add_parser('generer', aliases=['generate'], help="Génère des labyrinthes")
+    commande.add_argument('largeur', type=int)
+    commande.add_argument('hauteur', type=int)
+    commande.add_argument('--nombre', type=int, default=1)
+    commande.add_argument('--graine', type=int, default=0, help="Graine du premier labyrinthe (puis +1, +2...)")
+    commande.add_argument('--algorithme', choices=ALGORITHMES_GENERATION, default='backtracker')
+    commande.add_argument('--binaire', action='store_true', help="Enregistrements binaires au lieu de JSON")
+
+    commande = sous_commandes.add_parser('resoudre', aliases=['solve'], help="Résout des labyrinthes")
+    commande.add_argument('--algorithme', choices=list(ALGORITHMES), default='a_star')
+    commande.add_argument('--heuristique', choices=HEURISTIQUES, default='manhattan')
+    commande.add_argument('--departage', choices=DEPARTAGES)
+    commande.add_argument('--poids', type=float)
+    commande.add_argument('--chemin', action='store_true', help="Ajoute le chemin à chaque résultat")
+
+    sous_commandes.add_parser('analyser', aliases=['analyze'], help="Résume des résultats de résolution")
+
+    commande = sous_commandes.add_parser('exporter', aliases=['export'],
+                                         help="Exporte des paires labyrinthe / solution par fragments")
+    commande.add_argument('dossier')
+    commande.add_argument('largeur', type=int)
+    commande.add_argument('hauteur', type=int)
+    commande.add_argument('--nombre', type=int, default=1)
+    commande.add_argument('--graine', type=int, default=0, help="Graine du premier labyrinthe (puis +1, +2...)")
+    commande.add_argument('--algorithme', choices=ALGORITHMES_GENERATION, default='backtracker')
+    commande.add_argument('--taille-fragment', type=int, default=TAILLE_FRAGMENT)
+    commande.add_argument('--format', choices=FORMATS_EXPORT, help="npz si numpy est installé, brut sinon")
+    commande.add_argument('--processus', type=int)
+
+    parametres = analyseur.parse_args(arguments)
+    try:
+        executer_commande(parametres)
+    except ValueError as erreur:
+        analyseur.error(str(erreur))
+
+
+if __name__ == "__main__":
+    main()
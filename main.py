@@ -1,15 +1,17 @@
 import pygame
 import random
-import heapq
 import math
 import time
 from enum import Enum
 from typing import List, Tuple, Optional, Dict
 import sys
 
-# Initialisation de Pygame
-pygame.init()
-pygame.mixer.init()
+from cache_labyrinthes import CacheLabyrinthes
+from foule import NOMBRE_AGENTS_FOULE, Foule
+from labyrinthe import TAILLES_DIFFICULTE, Labyrinthe, TypeCellule
+from heuristiques import HEURISTIQUES, champ_distances
+from hierarchique import TAILLE_CLUSTER
+from solveur import ALGORITHMES, heuristique_manhattan, statistiques_vides
 
 # Constantes
 LARGEUR = 1400
@@ -40,6 +42,30 @@ ARGENT = (192, 192, 192)
 OVERLAY_SOMBRE = (0, 0, 0, 180)
 GLOW_EFFECT = (255, 255, 255, 50)
 
+# Noms affichés des algorithmes de recherche (touche B pour alterner)
+NOMS_ALGORITHMES = {
+    'a_star': "A*",
+    'a_star_seaux': "A* (file à seaux)",
+    'a_star_pondere': "A* pondéré (x2)",
+    'glouton': "Meilleur d'abord glouton",
+    'bidirectionnel': "A* bidirectionnel",
+    'jonctions': "A* sur jonctions",
+    'incremental': "D* Lite (incrémental)",
+    'jps': "Jump Point Search",
+    'hierarchique': "HPA* (clusters)",
+    'ida_star': "IDA* (mémoire bornée)"
+}
+
+# Couleurs RGBA des cellules de la foule, de 1 à 8 agents ou plus par cellule
+COULEURS_FOULE = [bytes((*NEON_ORANGE, 96 + 20 * niveau)) for niveau in range(8)]
+
+# Noms affichés des heuristiques (touche H pour alterner)
+NOMS_HEURISTIQUES = {
+    'manhattan': "Manhattan",
+    'exacte': "distance exacte",
+    'reperes': "repères (ALT)"
+}
+
 class EtatJeu(Enum):
     MENU_PRINCIPAL = 0
     SELECTION_DIFFICULTE = 1
@@ -50,19 +76,10 @@ class EtatJeu(Enum):
     CREDITS = 6
 
 class DifficulteLabyrinthe(Enum):
-    FACILE = (30, 20, "Facile", VERT_EMERAUDE)
-    MOYEN = (50, 35, "Moyen", OR_IMPERIAL)
-    DIFFICILE = (70, 50, "Difficile", NEON_ORANGE)
-    EXTREME = (100, 70, "Extrême", ROUGE_CRIMSON)
-
-class TypeCellule(Enum):
-    VIDE = 0
-    MUR = 1
-    DEPART = 2
-    ARRIVEE = 3
-    LISTE_OUVERTE = 4
-    LISTE_FERMEE = 5
-    CHEMIN_FINAL = 6
+    FACILE = (*TAILLES_DIFFICULTE['FACILE'], "Facile", VERT_EMERAUDE)
+    MOYEN = (*TAILLES_DIFFICULTE['MOYEN'], "Moyen", OR_IMPERIAL)
+    DIFFICILE = (*TAILLES_DIFFICULTE['DIFFICILE'], "Difficile", NEON_ORANGE)
+    EXTREME = (*TAILLES_DIFFICULTE['EXTREME'], "Extrême", ROUGE_CRIMSON)
 
 class ParticuleAvancee:
     def __init__(self, x: float, y: float, couleur: Tuple[int, int, int], 
@@ -352,29 +369,11 @@ class MenuAAA:
         rect_sous_titre = surface_sous_titre.get_rect(center=(self.largeur_ecran // 2, 220))
         ecran.blit(surface_sous_titre, rect_sous_titre)
 
-class Noeud:
-    def __init__(self, position: Tuple[int, int], g: float = 0, h: float = 0, parent=None):
-        self.position = position
-        self.g = g
-        self.h = h
-        self.f = g + h
-        self.parent = parent
-    
-    def __lt__(self, other):
-        return self.f < other.f
-    
-    def __eq__(self, other):
-        return self.position == other.position
-
-class LabyrintheAAA:
-    def __init__(self, largeur: int, hauteur: int, effets: EffetsVisuelsAAA):
-        self.largeur = largeur
-        self.hauteur = hauteur
+class LabyrintheAAA(Labyrinthe):
+    def __init__(self, largeur: int, hauteur: int, effets: EffetsVisuelsAAA, graine: Optional[int] = None,
+                 algorithme: str = 'backtracker', grille: Optional[bytes] = None):
+        super().__init__(largeur, hauteur, graine, algorithme, grille)
         self.effets = effets
-        self.grille = [[TypeCellule.MUR for _ in range(largeur)] for _ in range(hauteur)]
-        self.depart = (1, 1)
-        self.arrivee = (largeur - 2, hauteur - 2)
-        self.generer_labyrinthe()
         
         # Calcul de la taille des cellules pour centrer le labyrinthe
         zone_jeu_largeur = LARGEUR - 400  # Laisser place pour l'interface
@@ -383,176 +382,233 @@ class LabyrintheAAA:
         self.taille_cellule = min(zone_jeu_largeur // largeur, zone_jeu_hauteur // hauteur)
         self.offset_x = 50
         self.offset_y = 50
-        
-    def generer_labyrinthe(self):
-        # Génération avec animation
-        for y in range(self.hauteur):
-            for x in range(self.largeur):
-                self.grille[y][x] = TypeCellule.MUR
-        
-        stack = []
-        start_x, start_y = 1, 1
-        self.grille[start_y][start_x] = TypeCellule.VIDE
-        stack.append((start_x, start_y))
-        
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-        
-        while stack:
-            current_x, current_y = stack[-1]
-            
-            voisins = []
-            for dx, dy in directions:
-                new_x, new_y = current_x + dx, current_y + dy
-                if (0 < new_x < self.largeur - 1 and 
-                    0 < new_y < self.hauteur - 1 and 
-                    self.grille[new_y][new_x] == TypeCellule.MUR):
-                    voisins.append((new_x, new_y))
-            
-            if voisins:
-                next_x, next_y = random.choice(voisins)
-                wall_x = current_x + (next_x - current_x) // 2
-                wall_y = current_y + (next_y - current_y) // 2
-                
-                self.grille[wall_y][wall_x] = TypeCellule.VIDE
-                self.grille[next_y][next_x] = TypeCellule.VIDE
-                stack.append((next_x, next_y))
-            else:
-                stack.pop()
-        
-        self.grille[self.depart[1]][self.depart[0]] = TypeCellule.DEPART
-        self.grille[self.arrivee[1]][self.arrivee[0]] = TypeCellule.ARRIVEE
-    
-    def est_valide(self, x: int, y: int) -> bool:
-        return (0 <= x < self.largeur and 
-                0 <= y < self.hauteur and 
-                self.grille[y][x] != TypeCellule.MUR)
-    
-    def obtenir_voisins(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
-        x, y = position
-        voisins = []
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
-            if self.est_valide(new_x, new_y):
-                voisins.append((new_x, new_y))
-        
-        return voisins
+
+class EnregistrementRecherche:
+    """Déroulé complet d'une recherche, rejoué par AgentIAAAA sans rien recalculer
+
+    Rangé dans `cache_pretraitements` du labyrinthe, qui est vidé à chaque
+    modification de la grille : un enregistrement n'est jamais rejoué sur
+    une grille différente de celle où il a été calculé.
+    """
+    def __init__(self, recherche):
+        # Recherche terminée (reprise telle quelle après le rejeu, pour réparer D* Lite)
+        self.recherche = recherche
+        # Par nœud développé : (indice, frontière, voisins ouverts, valeurs des statistiques)
+        self.pas = []
 
 class AgentIAAAA:
-    def __init__(self, labyrinthe: LabyrintheAAA, effets: EffetsVisuelsAAA):
+    def __init__(self, labyrinthe: LabyrintheAAA, effets: EffetsVisuelsAAA, algorithme: str = 'a_star',
+                 nom_heuristique: str = 'manhattan'):
         self.labyrinthe = labyrinthe
         self.effets = effets
+        self.algorithme = algorithme
+        self.nom_heuristique = nom_heuristique
         self.chemin_final = []
         self.liste_ouverte_positions = set()
         self.liste_fermee_positions = set()
+        # Cellules atteintes par la frontière partie de l'arrivée (mode bidirectionnel)
+        self.positions_frontiere_arriere = set()
         self.algorithme_termine = False
-        self.statistiques = {
-            'noeuds_explores': 0,
-            'noeuds_en_attente': 0,
-            'longueur_chemin': 0,
-            'temps_execution': 0,
-            'efficacite': 0
-        }
+        self.recherche = None
+        # Recherche en cours d'enregistrement, ou enregistrement en cours de rejeu (et son prochain pas)
+        self.enregistrement = None
+        self.rejeu = None
+        self.pas_rejeu = 0
+        self.statistiques = statistiques_vides()
         self.temps_debut = 0
+        # Plus petite distance restante atteinte par chaque frontière (avant, arrière)
+        self.distances_restantes = [0, 0]
+    
+    def distance_restante(self, index: int, cible: Tuple[int, int]) -> int:
+        """Distance de `index` à `cible` : Manhattan avec cette heuristique (sans BFS), exacte sinon (champ en cache)"""
+        if self.nom_heuristique == 'manhattan':
+            return heuristique_manhattan(self.labyrinthe.position(index), cible)
+        return champ_distances(self.labyrinthe, cible)[index]
     
-    def heuristique(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+    def distance_totale(self) -> int:
+        """Distance départ-arrivée, au sens de distance_restante"""
+        return self.distance_restante(self.labyrinthe.index(*self.labyrinthe.depart), self.labyrinthe.arrivee)
+    
+    def progression(self) -> float:
+        """Part (en %) de la distance départ-arrivée déjà couverte par la ou les frontières (au sens de distance_restante)"""
+        if self.algorithme_termine:
+            return 100
+        distance_totale = self.distance_totale()
+        if distance_totale <= 0:
+            return 0
+        couverte = sum(distance_totale - restante for restante in self.distances_restantes)
+        return min(100, 100 * couverte / distance_totale)
     
     def reinitialiser(self):
-        self.chemin_final.clear()
+        self.chemin_final = []
         self.liste_ouverte_positions.clear()
         self.liste_fermee_positions.clear()
+        self.positions_frontiere_arriere.clear()
         self.algorithme_termine = False
+        self.recherche = None
+        self.enregistrement = None
+        self.rejeu = None
+        self.pas_rejeu = 0
         self.temps_debut = time.time()
         
         # Réinitialiser les statistiques
-        self.statistiques = {
-            'noeuds_explores': 0,
-            'noeuds_en_attente': 0,
-            'longueur_chemin': 0,
-            'temps_execution': 0,
-            'efficacite': 0
-        }
+        self.statistiques = statistiques_vides()
+    
+    def cle_enregistrement(self) -> Tuple:
+        return ('enregistrement', self.algorithme, self.nom_heuristique,
+                self.labyrinthe.depart, self.labyrinthe.arrivee)
+    
+    def pas_suivant(self) -> Optional[Tuple[int, int, List[int]]]:
+        """(indice développé, frontière, voisins ouverts) du prochain pas, rejoué ou calculé (None à la fin)
+        
+        Met aussi à jour les statistiques. Une recherche calculée jusqu'au
+        bout est enregistrée pour les prochains lancements sur la même grille.
+        """
+        if self.rejeu is not None:
+            if self.pas_rejeu == len(self.rejeu.pas):
+                return None
+            courant, cote, voisins, valeurs = self.rejeu.pas[self.pas_rejeu]
+            self.pas_rejeu += 1
+            self.statistiques.update(zip(self.statistiques, valeurs))
+            return courant, cote, voisins
+        
+        recherche = self.recherche
+        courant = recherche.etape()
+        if courant == -1:
+            if self.enregistrement is not None:
+                self.labyrinthe.cache_pretraitements[self.cle_enregistrement()] = self.enregistrement
+                self.enregistrement = None
+            return None
+        
+        voisins = [] if recherche.termine else recherche.voisins_ouverts(courant)
+        recherche.remplir_statistiques(self.statistiques)
+        if self.enregistrement is not None:
+            self.enregistrement.pas.append((courant, recherche.dernier_cote, voisins,
+                                            tuple(self.statistiques.values())))
+            if recherche.termine:
+                self.labyrinthe.cache_pretraitements[self.cle_enregistrement()] = self.enregistrement
+                self.enregistrement = None
+        return courant, recherche.dernier_cote, voisins
     
     def a_star_pas_a_pas(self):
-        if hasattr(self, '_liste_ouverte'):
-            if not self._liste_ouverte or self.algorithme_termine:
-                return False
-                
-            noeud_actuel = heapq.heappop(self._liste_ouverte)
-            
-            if noeud_actuel.position in self._liste_fermee:
-                return True
-                
-            self._liste_fermee.add(noeud_actuel.position)
-            self.liste_fermee_positions.add(noeud_actuel.position)
-            
-            # Effet visuel spectaculaire pour l'exploration
-            self.effets.ajouter_explosion(noeud_actuel.position[0], noeud_actuel.position[1], 
-                                        NEON_CYAN, 8, self.labyrinthe.taille_cellule)
-            
-            if noeud_actuel.position == self.labyrinthe.arrivee:
-                # Reconstruction du chemin avec effets
-                chemin = []
-                while noeud_actuel:
-                    chemin.append(noeud_actuel.position)
-                    noeud_actuel = noeud_actuel.parent
-                self.chemin_final = chemin[::-1]
-                
-                # Effets spectaculaires pour la victoire
-                self.effets.shake_ecran(20)
-                self.effets.ajouter_trail_effet(self.chemin_final, NEON_VERT, self.labyrinthe.taille_cellule)
-                
-                # Explosions le long du chemin
-                for pos in self.chemin_final:
-                    self.effets.ajouter_explosion(pos[0], pos[1], NEON_VERT, 12, self.labyrinthe.taille_cellule)
-                
-                self.algorithme_termine = True
-                self.statistiques['temps_execution'] = time.time() - self.temps_debut
-                self.statistiques['longueur_chemin'] = len(self.chemin_final) - 1
-                self.statistiques['efficacite'] = (len(self.chemin_final) / max(1, len(self.liste_fermee_positions))) * 100
-                
-                return False
+        if self.recherche is None:
+            # Initialisation : rejeu si cette recherche a déjà été faite sur cette grille
+            self.rejeu = self.labyrinthe.cache_pretraitements.get(self.cle_enregistrement())
+            self.pas_rejeu = 0
+            if self.rejeu is not None:
+                self.recherche = self.rejeu.recherche
+            else:
+                self.recherche = ALGORITHMES[self.algorithme](self.labyrinthe, heuristique=self.nom_heuristique)
+                self.enregistrement = EnregistrementRecherche(self.recherche)
+            self.distances_restantes = [max(0, self.distance_totale())] * 2
+            if self.algorithme != 'incremental':
+                self.liste_ouverte_positions.add(self.labyrinthe.depart)
+            if self.algorithme in ('bidirectionnel', 'incremental'):
+                self.liste_ouverte_positions.add(self.labyrinthe.arrivee)
             
-            # Explorer les voisins avec effets visuels
-            for voisin_pos in self.labyrinthe.obtenir_voisins(noeud_actuel.position):
-                if voisin_pos in self._liste_fermee:
-                    continue
-                
-                g_nouveau = noeud_actuel.g + 1
-                h_nouveau = self.heuristique(voisin_pos, self.labyrinthe.arrivee)
-                
-                if (voisin_pos not in self._noeuds_ouverts or 
-                    g_nouveau < self._noeuds_ouverts[voisin_pos].g):
-                    
-                    noeud_voisin = Noeud(voisin_pos, g_nouveau, h_nouveau, noeud_actuel)
-                    heapq.heappush(self._liste_ouverte, noeud_voisin)
-                    self._noeuds_ouverts[voisin_pos] = noeud_voisin
-                    self.liste_ouverte_positions.add(voisin_pos)
-                    
-                    # Petit effet pour les nouvelles cellules
-                    self.effets.ajouter_explosion(voisin_pos[0], voisin_pos[1], 
-                                                BLEU_ROYAL, 4, self.labyrinthe.taille_cellule)
+            return True
+        
+        if self.algorithme_termine:
+            return False
+        
+        pas = self.pas_suivant()
+        if pas is None:
+            return False
+        courant, cote, voisins = pas
+        
+        position = self.labyrinthe.position(courant)
+        self.liste_fermee_positions.add(position)
+        
+        # Couleurs distinctes pour la frontière partie de l'arrivée
+        frontiere_arriere = cote == 1
+        if frontiere_arriere:
+            self.positions_frontiere_arriere.add(position)
+        
+        # Progrès : distance restante jusqu'à l'extrémité visée par cette frontière
+        cible = self.labyrinthe.depart if frontiere_arriere else self.labyrinthe.arrivee
+        restante = self.distance_restante(courant, cible)
+        if restante != -1:
+            cote = 1 if frontiere_arriere else 0
+            self.distances_restantes[cote] = min(self.distances_restantes[cote], restante)
+        
+        # Effet visuel spectaculaire pour l'exploration
+        self.effets.ajouter_explosion(position[0], position[1], 
+                                    NEON_VIOLET if frontiere_arriere else NEON_CYAN, 8,
+                                    self.labyrinthe.taille_cellule)
+        
+        if self.recherche.termine and (self.rejeu is None or self.pas_rejeu == len(self.rejeu.pas)):
+            self.chemin_final = list(self.recherche.chemin)
             
-            # Mise à jour statistiques
-            self.statistiques['noeuds_explores'] = len(self.liste_fermee_positions)
-            self.statistiques['noeuds_en_attente'] = len(self._liste_ouverte)
+            # Effets spectaculaires pour la victoire
+            self.effets.shake_ecran(20)
+            self.effets.ajouter_trail_effet(self.chemin_final, NEON_VERT, self.labyrinthe.taille_cellule)
             
-            return True
-        else:
-            # Initialisation
-            depart = self.labyrinthe.depart
-            arrivee = self.labyrinthe.arrivee
+            # Explosions le long du chemin
+            for pos in self.chemin_final:
+                self.effets.ajouter_explosion(pos[0], pos[1], NEON_VERT, 12, self.labyrinthe.taille_cellule)
             
-            self._liste_ouverte = []
-            heapq.heappush(self._liste_ouverte, Noeud(depart, 0, self.heuristique(depart, arrivee)))
-            self._liste_fermee = set()
-            self._noeuds_ouverts = {depart: Noeud(depart, 0, self.heuristique(depart, arrivee))}
+            self.algorithme_termine = True
+            self.statistiques['temps_execution'] = time.time() - self.temps_debut
             
-            self.liste_ouverte_positions.add(depart)
+            return False
+        
+        for voisin in voisins:
+            voisin_pos = self.labyrinthe.position(voisin)
+            self.liste_ouverte_positions.add(voisin_pos)
+            if frontiere_arriere:
+                self.positions_frontiere_arriere.add(voisin_pos)
             
-            return True
+            # Petit effet pour les nouvelles cellules
+            self.effets.ajouter_explosion(voisin_pos[0], voisin_pos[1], 
+                                        NEON_ROSE if frontiere_arriere else BLEU_ROYAL, 4,
+                                        self.labyrinthe.taille_cellule)
+        
+        return True
+    
+    def basculer_mur(self, position: Tuple[int, int]):
+        """Ajoute ou retire un mur : la recherche incrémentale est réparée, les autres repartent de zéro"""
+        graphe = self.labyrinthe.cache_pretraitements.get(('hierarchie', TAILLE_CLUSTER))
+        cellules = self.labyrinthe.basculer_mur(*position)
+        if graphe is not None:
+            # Le graphe HPA* ne reconstruit que les clusters touchés
+            graphe.signaler_modifications(cellules)
+        self.liste_ouverte_positions.discard(position)
+        self.liste_fermee_positions.discard(position)
+        self.positions_frontiere_arriere.discard(position)
+        # Le déroulé en cours ne correspond plus à la grille
+        self.enregistrement = None
+        
+        rejeu_en_cours = self.rejeu is not None and not self.algorithme_termine
+        if self.algorithme != 'incremental' or self.recherche is None or rejeu_en_cours:
+            self.reinitialiser()
+            return
+        self.rejeu = None
+        
+        recherche = self.recherche
+        en_cours = not self.algorithme_termine and recherche.premiere_cle() is not None
+        recherche.signaler_modifications(cellules)
+        self.distances_restantes = [max(0, self.distance_totale())] * 2
+        if en_cours:
+            # Recherche en cours : l'animation continue avec les scores réparés
+            return
+        
+        # Recherche terminée (ou arrivée inaccessible) : réparation immédiate, dont le coût suit l'étendue de la modification
+        temps_debut = time.time()
+        while not recherche.termine:
+            courant = recherche.etape()
+            if courant == -1:
+                break
+            self.liste_fermee_positions.add(self.labyrinthe.position(courant))
+            self.positions_frontiere_arriere.add(self.labyrinthe.position(courant))
+            for voisin in recherche.voisins_ouverts(courant):
+                self.liste_ouverte_positions.add(self.labyrinthe.position(voisin))
+                self.positions_frontiere_arriere.add(self.labyrinthe.position(voisin))
+        
+        self.chemin_final = list(recherche.chemin)
+        self.algorithme_termine = recherche.termine
+        recherche.remplir_statistiques(self.statistiques)
+        self.statistiques['temps_execution'] = time.time() - temps_debut
+        self.effets.ajouter_trail_effet(self.chemin_final, NEON_VERT, self.labyrinthe.taille_cellule)
 
 class InterfaceJeuAAA:
     def __init__(self, largeur_panel: int):
@@ -616,6 +672,8 @@ class InterfaceJeuAAA:
             ("Longueur chemin", stats['longueur_chemin'], 200, NEON_VERT),
             ("Efficacité", f"{stats['efficacite']:.1f}%", 100, OR_IMPERIAL)
         ]
+        if stats['memoire_pic']:
+            stats_affichage.append(("Mémoire (pic)", stats['memoire_pic'], 5000, NEON_ROSE))
         
         for label, valeur, max_val, couleur_barre in stats_affichage:
             # Label
@@ -670,6 +728,7 @@ class InterfaceJeuAAA:
             ("🔴 Arrivée", ROUGE_CRIMSON, "Objectif à atteindre"),
             ("🔵 Liste ouverte", BLEU_ROYAL, "Nœuds à explorer"),
             ("⚫ Liste fermée", ARGENT, "Nœuds explorés"),
+            ("🟣 Frontière arrière", NEON_VIOLET, "Recherche bidirectionnelle"),
             ("🟡 Chemin optimal", NEON_VERT, "Solution trouvée")
         ]
         
@@ -688,6 +747,10 @@ class InterfaceJeuAAA:
 
 class JeuAAA:
     def __init__(self):
+        # Initialisation de Pygame (uniquement pour le jeu, pas à l'import)
+        pygame.init()
+        pygame.mixer.init()
+        
         self.ecran = pygame.display.set_mode((LARGEUR, HAUTEUR))
         pygame.display.set_caption("MAZE AI - Edition AAA")
         self.horloge = pygame.time.Clock()
@@ -712,17 +775,32 @@ class JeuAAA:
         # Musique et sons (simulation)
         self.volume_musique = 0.7
         self.volume_effets = 0.8
+        
+        # Algorithme de recherche (clé de ALGORITHMES) et heuristique (nom de HEURISTIQUES)
+        self.algorithme = 'a_star'
+        self.heuristique = 'manhattan'
+        
+        # Mode foule (touche F) : agents guidés par un champ de flux partagé
+        self.foule = None
+        
+        # Labyrinthes générés, retrouvés par (algorithme, taille, graine)
+        self.cache_labyrinthes = CacheLabyrinthes()
+        self.graine = None
     
     def initialiser_nouveau_jeu(self, difficulte: DifficulteLabyrinthe):
         """Initialise un nouveau jeu avec la difficulté choisie"""
         largeur, hauteur = difficulte.value[0], difficulte.value[1]
+        self.difficulte_selectionnee = difficulte
         
         # Réinitialiser les effets
         self.effets = EffetsVisuelsAAA()
         
-        # Créer le nouveau labyrinthe
-        self.labyrinthe = LabyrintheAAA(largeur, hauteur, self.effets)
-        self.agent = AgentIAAAA(self.labyrinthe, self.effets)
+        # Créer le nouveau labyrinthe (graine affichée pour pouvoir le recréer)
+        self.graine = random.getrandbits(32)
+        self.labyrinthe = self.cache_labyrinthes.labyrinthe(largeur, hauteur, self.graine,
+                                                            classe=LabyrintheAAA, effets=self.effets)
+        self.agent = AgentIAAAA(self.labyrinthe, self.effets, self.algorithme, self.heuristique)
+        self.foule = None
         
         # Effet d'entrée spectaculaire
         self.effets.fade_transition(255)
@@ -731,7 +809,7 @@ class JeuAAA:
         # Transition vers le jeu
         self.etat_actuel = EtatJeu.JEU_ACTIF
         
-        print(f"Nouveau jeu créé - Difficulté: {difficulte.value[2]} ({largeur}x{hauteur})")
+        print(f"Nouveau jeu créé - Difficulté: {difficulte.value[2]} ({largeur}x{hauteur}, graine {self.graine})")
     
     def dessiner_cellule_ultra_detaillee(self, x: int, y: int, couleur_base: Tuple[int, int, int], 
                                         alpha: int = 255, effet_special: bool = False):
@@ -805,9 +883,11 @@ class JeuAAA:
         if not self.labyrinthe:
             return
             
+        largeur = self.labyrinthe.largeur
+        grille = self.labyrinthe.grille
         for y in range(self.labyrinthe.hauteur):
-            for x in range(self.labyrinthe.largeur):
-                type_cellule = self.labyrinthe.grille[y][x]
+            for x in range(largeur):
+                type_cellule = grille[y * largeur + x]
                 
                 # Déterminer la couleur de base
                 if type_cellule == TypeCellule.MUR:
@@ -819,20 +899,34 @@ class JeuAAA:
                 else:
                     self.dessiner_cellule_ultra_detaillee(x, y, BLANC_NEIGE)
                 
-                # Superposition des états A*
+                # Superposition des états A* (la frontière arrière a ses propres couleurs)
+                arriere = (x, y) in self.agent.positions_frontiere_arriere
                 if (x, y) in self.agent.liste_fermee_positions:
                     if (x, y) not in [self.labyrinthe.depart, self.labyrinthe.arrivee]:
-                        self.dessiner_cellule_ultra_detaillee(x, y, ARGENT, 120)
+                        self.dessiner_cellule_ultra_detaillee(x, y, NEON_VIOLET if arriere else ARGENT, 120)
                 
                 if (x, y) in self.agent.liste_ouverte_positions:
                     if (x, y) not in [self.labyrinthe.depart, self.labyrinthe.arrivee]:
-                        self.dessiner_cellule_ultra_detaillee(x, y, BLEU_ROYAL, 150)
+                        self.dessiner_cellule_ultra_detaillee(x, y, NEON_ROSE if arriere else BLEU_ROYAL, 150)
                 
                 # Chemin final avec effet trail
                 if (x, y) in self.agent.chemin_final:
                     if (x, y) not in [self.labyrinthe.depart, self.labyrinthe.arrivee]:
                         self.dessiner_cellule_ultra_detaillee(x, y, NEON_VERT, 200, True)
     
+    def dessiner_foule(self):
+        """Dessine toute la foule en un seul blit : un pixel par cellule, mis à l'échelle de la grille"""
+        largeur, hauteur = self.labyrinthe.largeur, self.labyrinthe.hauteur
+        pixels = bytearray(4 * largeur * hauteur)  # Transparent hors des cellules occupées
+        niveau_max = len(COULEURS_FOULE)
+        for index, nombre in self.foule.occupation().items():
+            pixels[4 * index:4 * index + 4] = COULEURS_FOULE[min(nombre, niveau_max) - 1]
+        
+        taille = self.labyrinthe.taille_cellule
+        calque = pygame.image.frombuffer(pixels, (largeur, hauteur), 'RGBA')
+        calque = pygame.transform.scale(calque, (largeur * taille, hauteur * taille))
+        self.ecran.blit(calque, (self.labyrinthe.offset_x, self.labyrinthe.offset_y))
+    
     def dessiner_particules_avancees(self):
         """Dessine toutes les particules avec effets avancés"""
         for particule in self.effets.particules:
@@ -932,7 +1026,7 @@ class JeuAAA:
                     self.effets.shake_ecran(8)
                     
                 elif nom == 'pas_a_pas':
-                    if not hasattr(self.agent, '_liste_ouverte'):
+                    if self.agent.recherche is None:
                         self.agent.reinitialiser()
                     self.agent.a_star_pas_a_pas()
                     
@@ -949,18 +1043,48 @@ class JeuAAA:
                     self.etat_actuel = EtatJeu.MENU_PRINCIPAL
                     self.mode_automatique = False
         
+        # Clic gauche dans la grille : ajouter ou retirer un mur
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            taille = self.labyrinthe.taille_cellule
+            x = (event.pos[0] - self.labyrinthe.offset_x) // taille
+            y = (event.pos[1] - self.labyrinthe.offset_y) // taille
+            if 0 <= x < self.labyrinthe.largeur and 0 <= y < self.labyrinthe.hauteur:
+                try:
+                    self.agent.basculer_mur((x, y))
+                    if self.foule is not None:
+                        self.foule.actualiser_champ()
+                except ValueError:
+                    pass  # Bordure, départ ou arrivée
+        
         # Raccourcis clavier
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 self.mode_automatique = True
                 self.agent.reinitialiser()
             elif event.key == pygame.K_s:
-                if not hasattr(self.agent, '_liste_ouverte'):
+                if self.agent.recherche is None:
                     self.agent.reinitialiser()
                 self.agent.a_star_pas_a_pas()
             elif event.key == pygame.K_r:
                 self.agent.reinitialiser()
                 self.mode_automatique = False
+            elif event.key == pygame.K_b:
+                # Alterner entre les algorithmes de recherche disponibles
+                noms = list(ALGORITHMES)
+                self.algorithme = noms[(noms.index(self.algorithme) + 1) % len(noms)]
+                if self.algorithme == 'incremental':
+                    self.heuristique = 'manhattan'  # Seule heuristique qui reste valable quand les murs changent
+                self.agent = AgentIAAAA(self.labyrinthe, self.effets, self.algorithme, self.heuristique)
+                self.mode_automatique = False
+            elif event.key == pygame.K_h:
+                # Alterner entre les heuristiques (les champs de distances restent en cache)
+                heuristiques = HEURISTIQUES if self.algorithme != 'incremental' else ('manhattan',)
+                self.heuristique = heuristiques[(heuristiques.index(self.heuristique) + 1) % len(heuristiques)]
+                self.agent = AgentIAAAA(self.labyrinthe, self.effets, self.algorithme, self.heuristique)
+                self.mode_automatique = False
+            elif event.key == pygame.K_f:
+                # Lancer ou arrêter la foule (un seul champ de flux pour tous les agents)
+                self.foule = None if self.foule is not None else Foule(self.labyrinthe, NOMBRE_AGENTS_FOULE)
             elif event.key == pygame.K_ESCAPE:
                 self.etat_actuel = EtatJeu.MENU_PRINCIPAL
         
@@ -1041,6 +1165,10 @@ class JeuAAA:
         # Mise à jour des effets
         self.effets.mettre_a_jour()
         
+        # Foule : tous les agents avancent d'une cellule par image
+        if self.foule is not None and not self.foule.termine:
+            self.foule.avancer()
+        
         # Mode automatique
         if self.mode_automatique and self.agent and not self.agent.algorithme_termine:
             self.compteur_animation += 1
@@ -1291,6 +1419,10 @@ class JeuAAA:
         # Labyrinthe avec effets AAA
         self.dessiner_labyrinthe_complet()
         
+        # Foule en un seul calque
+        if self.foule is not None:
+            self.dessiner_foule()
+        
         # Particules avancées
         self.dessiner_particules_avancees()
         
@@ -1310,10 +1442,9 @@ class JeuAAA:
         shake_y = random.randint(-self.effets.shake_camera, self.effets.shake_camera) if self.effets.shake_camera > 0 else 0
         
         # Barre de progression globale (en haut de l'écran)
-        if hasattr(self.agent, '_liste_ouverte') and not self.agent.algorithme_termine:
-            # Estimer le progrès basé sur la distance heuristique moyenne
-            progres_estime = min(100, (self.agent.statistiques['noeuds_explores'] / 
-                                     max(1, self.labyrinthe.largeur * self.labyrinthe.hauteur * 0.1)) * 100)
+        if self.agent.recherche is not None and not self.agent.algorithme_termine:
+            # Progrès d'après la distance restante (exacte hors heuristique Manhattan)
+            progres_estime = self.agent.progression()
             
             # Barre de progression
             barre_largeur = 400
@@ -1361,10 +1492,18 @@ class JeuAAA:
         
         # Indicateur de mode
         mode_texte = "🤖 MODE AUTO" if self.mode_automatique else "👆 MODE MANUEL"
+        mode_texte += (f" - {NOMS_ALGORITHMES.get(self.algorithme, self.algorithme)}"
+                       f" ({NOMS_HEURISTIQUES.get(self.heuristique, self.heuristique)})")
         couleur_mode = NEON_VERT if self.mode_automatique else NEON_CYAN
         surface_mode = self.interface_jeu.police_stats.render(mode_texte, True, couleur_mode)
         self.ecran.blit(surface_mode, (20 + shake_x, HAUTEUR - 40 + shake_y))
         
+        # Avancement de la foule
+        if self.foule is not None:
+            texte_foule = f"Foule : {self.foule.arrives()}/{len(self.foule)} arrivés en {self.foule.pas} pas"
+            surface_foule = self.interface_jeu.police_stats.render(texte_foule, True, NEON_ORANGE)
+            self.ecran.blit(surface_foule, (20 + shake_x, HAUTEUR - 70 + shake_y))
+        
         # FPS Counter (coin supérieur droit)
         fps_actuel = int(self.horloge.get_fps())
         couleur_fps = NEON_VERT if fps_actuel >= 50 else (NEON_ORANGE if fps_actuel >= 30 else ROUGE_CRIMSON)
@@ -0,0 +1,117 @@
+from typing import Dict, List, Optional, Tuple
+
+from labyrinthe import Labyrinthe
+from recherche import Recherche
+
+# Nombre maximal d'entrées de la table de transposition d'une itération
+TAILLE_TABLE = 65536
+
+
+class RechercheIDAStar(Recherche):
+    """IDA* à mémoire bornée, même interface que solveur.RechercheAStar
+
+    Une suite de parcours en profondeur bornés par un seuil sur f = g + h,
+    relevé à chaque itération au plus petit f qui l'a dépassé. Rien n'est
+    alloué à la taille de la grille : la pile et le chemin courant suivent
+    la profondeur, et la table de transposition (meilleur g vu pendant
+    l'itération, pour couper les doublons des grilles à boucles) ne dépasse
+    jamais `taille_table` entrées ; pleine, elle cesse simplement de grandir.
+    La mémoire est payée en redéveloppements : `noeuds_explores` compte
+    toutes les itérations et `memoire_pic` le plus grand nombre de cellules
+    mémorisées à la fois (pile, chemin et table).
+    """
+    options = ('taille_table',)
+
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan',
+                 taille_table: int = TAILLE_TABLE):
+        super().__init__(labyrinthe, depart, arrivee, heuristique)
+        self.taille_table = taille_table
+        self.masques = labyrinthe.masques
+        self.decalages_par_masque = labyrinthe.decalages_par_masque
+
+        self.i_depart = labyrinthe.index(*self.depart)
+        self.i_arrivee = labyrinthe.index(*self.arrivee)
+        h_depart = self.h(self.i_depart)
+        self.seuil = h_depart
+        self.prochain_seuil = -1  # -1 : aucun f n'a encore dépassé le seuil
+        # Pile de (cellule, g, profondeur) ; -1 : cible inaccessible
+        self.pile = [(self.i_depart, 0, 0)] if h_depart != -1 else []
+        self.chemin_courant = []
+        self.sur_chemin = set()
+        self.table = {}
+        self.derniers_ouverts = []
+
+        self.iterations = 1
+        self.memoire_pic = 1
+
+    def etape(self) -> int:
+        """Développe le prochain nœud du parcours en profondeur et renvoie son indice (-1 si plus de seuil)"""
+        if not self.pile:
+            # Itération épuisée : relever le seuil et repartir du départ
+            if self.prochain_seuil == -1:
+                return -1
+            self.seuil, self.prochain_seuil = self.prochain_seuil, -1
+            self.pile.append((self.i_depart, 0, 0))
+            self.chemin_courant.clear()
+            self.sur_chemin.clear()
+            self.table.clear()
+            self.iterations += 1
+
+        courant, g, profondeur = self.pile.pop()
+        chemin_courant, sur_chemin = self.chemin_courant, self.sur_chemin
+        while len(chemin_courant) > profondeur:
+            sur_chemin.discard(chemin_courant.pop())
+        chemin_courant.append(courant)
+        sur_chemin.add(courant)
+        self.noeuds_explores += 1
+        self.derniers_ouverts = []
+
+        if courant == self.i_arrivee:
+            largeur = self.labyrinthe.largeur
+            self.chemin = [(index % largeur, index // largeur) for index in chemin_courant]
+            self.termine = True
+            return courant
+
+        table = self.table
+        g_nouveau = g + 1
+        enfants = []
+        for decalage in self.decalages_par_masque[self.masques[courant]]:
+            voisin = courant + decalage
+            if voisin in sur_chemin:
+                continue
+            h = self.h(voisin)
+            if h == -1:
+                continue
+            f = g_nouveau + h
+            if f > self.seuil:
+                if self.prochain_seuil == -1 or f < self.prochain_seuil:
+                    self.prochain_seuil = f
+                continue
+            g_connu = table.get(voisin)
+            if g_connu is not None and g_connu <= g_nouveau:
+                continue
+            if g_connu is not None or len(table) < self.taille_table:
+                table[voisin] = g_nouveau
+            enfants.append((f, voisin))
+
+        # Le plus petit f sur le dessus de la pile
+        for _, voisin in sorted(enfants, reverse=True):
+            self.pile.append((voisin, g_nouveau, profondeur + 1))
+            self.derniers_ouverts.append(voisin)
+
+        self.memoire_pic = max(self.memoire_pic, len(self.pile) + 2 * len(chemin_courant) + len(table))
+        return courant
+
+    def voisins_ouverts(self, courant: int) -> List[int]:
+        """Cellules empilées par le développement de `courant`"""
+        return self.derniers_ouverts
+
+    def remplir_statistiques(self, statistiques: Dict):
+        statistiques['noeuds_explores'] = self.noeuds_explores
+        statistiques['noeuds_en_attente'] = len(self.pile)
+        statistiques['longueur_chemin'] = max(0, len(self.chemin) - 1)
+        statistiques['efficacite'] = (len(self.chemin) / max(1, self.noeuds_explores)) * 100
+        statistiques['memoire_pic'] = self.memoire_pic
@@ -0,0 +1,183 @@
+import heapq
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from labyrinthe import BAS, DROITE, GAUCHE, HAUT, Labyrinthe
+from recherche import Recherche
+
+
+class RecherchePointsDeSaut(Recherche):
+    """Jump Point Search (variante 4-connexe), même interface que solveur.RechercheAStar
+
+    Au lieu d'empiler chaque voisin, la recherche avance en ligne droite
+    depuis la cellule développée et n'empile que les points de saut :
+    l'arrivée, les cellules ayant un voisin forcé (un côté qui s'ouvre
+    alors qu'il était fermé à la cellule précédente) et, sur un trajet
+    vertical, les cellules d'où un saut horizontal trouve un point de saut.
+    Les cellules intermédiaires, symétriques, ne sont jamais empilées. Le
+    coût d'un saut est sa longueur ; le chemin renvoyé est optimal (même
+    longueur que A*) et redéroulé cellule par cellule.
+    """
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan'):
+        super().__init__(labyrinthe, depart, arrivee, heuristique)
+
+        largeur = labyrinthe.largeur
+        nombre_cellules = largeur * labyrinthe.hauteur
+        self.scores_g = array('i', [-1]) * nombre_cellules
+        self.parents = array('i', [-1]) * nombre_cellules
+        self.fermes = bytearray(nombre_cellules)
+        self.masques = labyrinthe.masques
+        self.decalages_par_masque = labyrinthe.decalages_par_masque
+        # Bit de masque de chaque direction de saut
+        self.bits = {1: DROITE, -1: GAUCHE, largeur: BAS, -largeur: HAUT}
+
+        self.i_depart = labyrinthe.index(*self.depart)
+        self.i_arrivee = labyrinthe.index(*self.arrivee)
+        self.scores_g[self.i_depart] = 0
+        self.compteur = 0
+        h_depart = self.h(self.i_depart)
+        self.liste_ouverte = [(h_depart, 0, self.i_depart)] if h_depart != -1 else []
+        self.derniers_ouverts = []
+
+        self.points_chemin = 0
+
+    def sauter_horizontalement(self, index: int, decalage: int) -> int:
+        """Premier point de saut en partant de `index` dans la direction ±1 (-1 si aucun)"""
+        masques = self.masques
+        bit = DROITE if decalage == 1 else GAUCHE
+        verticaux = HAUT | BAS
+        i_arrivee = self.i_arrivee
+        while True:
+            if index == i_arrivee:
+                return index
+            masque = masques[index]
+            # Voisin forcé : un côté vertical ouvert ici mais fermé à la cellule précédente
+            if masque & verticaux & ~masques[index - decalage]:
+                return index
+            if not masque & bit:
+                return -1
+            index += decalage
+
+    def sauter_verticalement(self, index: int, decalage: int) -> int:
+        """Premier point de saut en partant de `index` dans la direction ±largeur (-1 si aucun)"""
+        masques = self.masques
+        bit = BAS if decalage > 0 else HAUT
+        horizontaux = GAUCHE | DROITE
+        i_arrivee = self.i_arrivee
+        sauter_horizontalement = self.sauter_horizontalement
+        while True:
+            if index == i_arrivee:
+                return index
+            masque = masques[index]
+            if masque & horizontaux & ~masques[index - decalage]:
+                return index
+            # Un trajet vertical s'arrête là où un saut horizontal aboutit
+            if ((masque & DROITE and sauter_horizontalement(index + 1, 1) != -1) or
+                    (masque & GAUCHE and sauter_horizontalement(index - 1, -1) != -1)):
+                return index
+            if not masque & bit:
+                return -1
+            index += decalage
+
+    def directions(self, courant: int) -> List[int]:
+        """Directions de saut conservées depuis `courant` selon la direction d'arrivée"""
+        masque = self.masques[courant]
+        parent = self.parents[courant]
+        if parent == -1:
+            return list(self.decalages_par_masque[masque])
+
+        largeur = self.labyrinthe.largeur
+        if parent // largeur == courant // largeur:
+            # Arrivée horizontale : tout droit ou sur les côtés verticaux
+            candidates = (1 if courant > parent else -1, largeur, -largeur)
+        else:
+            # Arrivée verticale : tout droit ou sur les côtés horizontaux
+            candidates = (largeur if courant > parent else -largeur, 1, -1)
+        bits = self.bits
+        return [decalage for decalage in candidates if masque & bits[decalage]]
+
+    def etape(self) -> int:
+        """Développe le meilleur point de saut ouvert et renvoie son indice (-1 si la liste ouverte est vide)"""
+        liste_ouverte = self.liste_ouverte
+        fermes = self.fermes
+
+        while liste_ouverte:
+            courant = heapq.heappop(liste_ouverte)[2]
+            if not fermes[courant]:
+                break
+        else:
+            return -1
+
+        fermes[courant] = 1
+        self.noeuds_explores += 1
+        self.derniers_ouverts = []
+
+        if courant == self.i_arrivee:
+            self.chemin = self.reconstruire_chemin(courant)
+            self.termine = True
+            return courant
+
+        largeur = self.labyrinthe.largeur
+        arrivee_x, arrivee_y = self.arrivee
+        heuristique = self.heuristique
+        scores_g = self.scores_g
+        parents = self.parents
+        g_courant = scores_g[courant]
+
+        for decalage in self.directions(courant):
+            if decalage == 1 or decalage == -1:
+                point = self.sauter_horizontalement(courant + decalage, decalage)
+                longueur = abs(point - courant)
+            else:
+                point = self.sauter_verticalement(courant + decalage, decalage)
+                longueur = abs(point - courant) // largeur
+            if point == -1 or fermes[point]:
+                continue
+
+            g_nouveau = g_courant + longueur
+            g_point = scores_g[point]
+            if g_point == -1 or g_nouveau < g_point:
+                if heuristique is None:
+                    point_y, point_x = divmod(point, largeur)
+                    h = abs(point_x - arrivee_x) + abs(point_y - arrivee_y)
+                else:
+                    h = heuristique(point)
+                    if h == -1:
+                        continue
+                scores_g[point] = g_nouveau
+                parents[point] = courant
+                self.compteur += 1
+                heapq.heappush(liste_ouverte, (g_nouveau + h, self.compteur, point))
+                self.derniers_ouverts.append(point)
+
+        return courant
+
+    def voisins_ouverts(self, courant: int) -> List[int]:
+        """Points de saut ouverts (ou améliorés) par le développement de `courant`"""
+        return [point for point in self.derniers_ouverts if self.parents[point] == courant]
+
+    def reconstruire_chemin(self, index: int) -> List[Tuple[int, int]]:
+        """Remonte les points de saut et redéroule les segments droits qui les séparent"""
+        largeur = self.labyrinthe.largeur
+        parents = self.parents
+        cellules = [index]
+        self.points_chemin = 1
+        while parents[index] != -1:
+            parent = parents[index]
+            pas = (1 if index > parent else -1) if parent // largeur == index // largeur else \
+                (largeur if index > parent else -largeur)
+            cellules.extend(range(index - pas, parent - pas, -pas))
+            index = parent
+            self.points_chemin += 1
+        cellules.reverse()
+        return [(cellule % largeur, cellule // largeur) for cellule in cellules]
+
+    def remplir_statistiques(self, statistiques: Dict):
+        statistiques['noeuds_explores'] = self.noeuds_explores
+        statistiques['noeuds_en_attente'] = len(self.liste_ouverte)
+        statistiques['longueur_chemin'] = max(0, len(self.chemin) - 1)
+        # Part des points de saut développés qui appartiennent à la solution
+        statistiques['efficacite'] = (self.points_chemin / max(1, self.noeuds_explores)) * 100
@@ -0,0 +1,46 @@
+from typing import List, Optional, Tuple
+
+from heuristiques import fonction_heuristique
+from labyrinthe import Labyrinthe
+
+
+class Recherche:
+    """Base commune des recherches pas à pas de solveur.ALGORITHMES
+
+    Fixe les extrémités (celles du labyrinthe par défaut) et l'heuristique
+    vers l'arrivée, et déroule la recherche dans `executer`. Chaque
+    recherche définit `etape` (indice développé, -1 quand il n'y a plus rien
+    à explorer), `voisins_ouverts` et `remplir_statistiques`, et met à jour
+    `termine`, `chemin` et `noeuds_explores`.
+    """
+    # Frontière du dernier nœud développé : 0 part du départ, 1 de l'arrivée
+    dernier_cote = 0
+    # Paramètres nommés acceptés en plus par le constructeur (voir solveur.resoudre_a_star)
+    options = ()
+
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan'):
+        self.labyrinthe = labyrinthe
+        self.depart = depart or labyrinthe.depart
+        self.arrivee = arrivee or labyrinthe.arrivee
+        self.heuristique = fonction_heuristique(labyrinthe, heuristique, self.arrivee)
+
+        self.noeuds_explores = 0
+        self.termine = False
+        self.chemin = []
+
+    def h(self, index: int) -> int:
+        """Heuristique de la cellule `index` vers l'arrivée (-1 si l'arrivée en est inaccessible)"""
+        if self.heuristique is None:
+            y, x = divmod(index, self.labyrinthe.largeur)
+            return abs(x - self.arrivee[0]) + abs(y - self.arrivee[1])
+        return self.heuristique(index)
+
+    def executer(self) -> List[Tuple[int, int]]:
+        """Déroule la recherche jusqu'au bout et renvoie le chemin (vide si aucun)"""
+        etape = self.etape
+        while not self.termine and etape() != -1:
+            pass
+        return self.chemin
@@ -0,0 +1,197 @@
+import heapq
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from labyrinthe import Labyrinthe
+from recherche import Recherche
+
+# Score g / rhs d'une cellule dont l'arrivée n'est pas (ou plus) accessible
+INFINI = 0x7FFFFFFF
+
+
+class RechercheIncrementale(Recherche):
+    """D* Lite : recherche incrémentale qui réutilise ses scores quand la grille change
+
+    La recherche part de l'arrivée et remonte vers le départ. Chaque cellule
+    porte son score g et son rhs (plus petit g + 1 parmi ses voisins) ;
+    seules les cellules incohérentes (g != rhs) sont dans la liste ouverte,
+    triée par la clé (min(g, rhs) + h(départ, cellule) + km, min(g, rhs)).
+    Après `signaler_modifications` (murs ajoutés ou retirés, voir
+    Labyrinthe.basculer_mur) ou `deplacer_depart`, la recherche reprend là
+    où elle s'était arrêtée et ne répare que les cellules dont la distance
+    à l'arrivée a changé : `noeuds_explores` compte les développements
+    depuis la dernière modification. Seule l'heuristique 'manhattan' est
+    acceptée, les autres étant précalculées sur une grille qui va changer.
+    """
+    # La frontière part de l'arrivée
+    dernier_cote = 1
+
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan'):
+        if heuristique != 'manhattan':
+            raise ValueError(f"Heuristique non prise en charge par la recherche incrémentale : {heuristique}")
+
+        super().__init__(labyrinthe, depart, arrivee, heuristique)
+
+        nombre_cellules = labyrinthe.largeur * labyrinthe.hauteur
+        self.scores_g = array('i', [INFINI]) * nombre_cellules
+        self.rhs = array('i', [INFINI]) * nombre_cellules
+        # Clé sous laquelle chaque cellule ouverte a été insérée (les autres entrées du tas sont périmées)
+        self.dans_liste = bytearray(nombre_cellules)
+        self.cles_principales = array('i', [0]) * nombre_cellules
+        self.cles_secondaires = array('i', [0]) * nombre_cellules
+        self.masques = labyrinthe.masques
+        self.decalages_par_masque = labyrinthe.decalages_par_masque
+
+        self.i_depart = labyrinthe.index(*self.depart)
+        self.i_arrivee = labyrinthe.index(*self.arrivee)
+        self.km = 0
+        self.compteur = 0
+        self.liste_ouverte = []
+
+        self.rhs[self.i_arrivee] = 0
+        self.mettre_a_jour_cellule(self.i_arrivee)
+
+    def cle(self, index: int) -> Tuple[int, int]:
+        minimum = min(self.scores_g[index], self.rhs[index])
+        if minimum == INFINI:
+            return (INFINI, INFINI)
+        y, x = divmod(index, self.labyrinthe.largeur)
+        return (minimum + abs(x - self.depart[0]) + abs(y - self.depart[1]) + self.km, minimum)
+
+    def calculer_rhs(self, index: int) -> int:
+        scores_g = self.scores_g
+        meilleur = INFINI
+        for decalage in self.decalages_par_masque[self.masques[index]]:
+            g = scores_g[index + decalage]
+            if g < meilleur:
+                meilleur = g
+        return meilleur + 1 if meilleur != INFINI else INFINI
+
+    def mettre_a_jour_cellule(self, index: int):
+        """(Ré)insère la cellule dans la liste ouverte si elle est incohérente, l'en retire sinon"""
+        g, rhs = self.scores_g[index], self.rhs[index]
+        if g == rhs:
+            self.dans_liste[index] = 0
+            return
+
+        secondaire = g if g < rhs else rhs
+        y, x = divmod(index, self.labyrinthe.largeur)
+        principale = secondaire + abs(x - self.depart[0]) + abs(y - self.depart[1]) + self.km
+        if (self.dans_liste[index] and self.cles_principales[index] == principale
+                and self.cles_secondaires[index] == secondaire):
+            return
+        self.dans_liste[index] = 1
+        self.cles_principales[index] = principale
+        self.cles_secondaires[index] = secondaire
+        self.compteur += 1
+        heapq.heappush(self.liste_ouverte, (principale, secondaire, self.compteur, index))
+
+    def premiere_cle(self) -> Optional[Tuple[int, int]]:
+        """Plus petite clé valide de la liste ouverte, après élimination des entrées périmées"""
+        liste_ouverte = self.liste_ouverte
+        while liste_ouverte:
+            principale, secondaire, _, index = liste_ouverte[0]
+            if (self.dans_liste[index] and self.cles_principales[index] == principale
+                    and self.cles_secondaires[index] == secondaire):
+                return (principale, secondaire)
+            heapq.heappop(liste_ouverte)
+        return None
+
+    def verifier_fin(self):
+        """Termine la recherche dès que le score du départ est cohérent et définitif"""
+        g_depart = self.scores_g[self.i_depart]
+        if g_depart == INFINI or g_depart != self.rhs[self.i_depart]:
+            return
+        # h(départ, départ) = 0 : la clé du départ se réduit à (g + km, g)
+        premiere = self.premiere_cle()
+        if premiere is not None and premiere < (g_depart + self.km, g_depart):
+            return
+        self.chemin = self.reconstruire_chemin()
+        self.termine = True
+
+    def etape(self) -> int:
+        """Développe la cellule ouverte de plus petite clé et renvoie son indice (-1 si la liste est vide)"""
+        while True:
+            cle_ancienne = self.premiere_cle()
+            if cle_ancienne is None:
+                return -1
+            courant = heapq.heappop(self.liste_ouverte)[3]
+            self.dans_liste[courant] = 0
+
+            # Clé périmée par un déplacement du départ : réinsérer avec la nouvelle
+            if cle_ancienne < self.cle(courant):
+                self.mettre_a_jour_cellule(courant)
+                continue
+            break
+
+        self.noeuds_explores += 1
+        scores_g, rhs = self.scores_g, self.rhs
+        i_arrivee = self.i_arrivee
+        voisins = [courant + decalage for decalage in self.decalages_par_masque[self.masques[courant]]]
+
+        if scores_g[courant] > rhs[courant]:
+            # Surcohérente : le score diminue, les voisins peuvent en profiter
+            g = scores_g[courant] = rhs[courant]
+            for voisin in voisins:
+                if voisin != i_arrivee and g + 1 < rhs[voisin]:
+                    rhs[voisin] = g + 1
+                    self.mettre_a_jour_cellule(voisin)
+        else:
+            # Sous-cohérente : le score augmente, les voisins qui en dépendaient sont recalculés
+            g_ancien = scores_g[courant]
+            scores_g[courant] = INFINI
+            for voisin in voisins + [courant]:
+                if voisin != i_arrivee and (voisin == courant or rhs[voisin] == g_ancien + 1):
+                    rhs[voisin] = self.calculer_rhs(voisin)
+                self.mettre_a_jour_cellule(voisin)
+
+        self.verifier_fin()
+        return courant
+
+    def signaler_modifications(self, cellules: Iterable[int]):
+        """Prend en compte des cellules dont le masque a changé et relance la recherche"""
+        for index in cellules:
+            if index != self.i_arrivee:
+                self.rhs[index] = self.calculer_rhs(index)
+            self.mettre_a_jour_cellule(index)
+        self.noeuds_explores = 0
+        self.termine = False
+        self.chemin = []
+        self.verifier_fin()
+
+    def deplacer_depart(self, depart: Tuple[int, int]):
+        """Déplace le départ (agent en mouvement) sans réordonner la liste ouverte"""
+        self.km += abs(depart[0] - self.depart[0]) + abs(depart[1] - self.depart[1])
+        self.depart = depart
+        self.i_depart = self.labyrinthe.index(*depart)
+        self.noeuds_explores = 0
+        self.termine = False
+        self.chemin = []
+        self.verifier_fin()
+
+    def voisins_ouverts(self, courant: int) -> List[int]:
+        """Voisins de `courant` actuellement dans la liste ouverte"""
+        dans_liste = self.dans_liste
+        return [voisin for voisin in self.labyrinthe.obtenir_voisins_index(courant) if dans_liste[voisin]]
+
+    def reconstruire_chemin(self) -> List[Tuple[int, int]]:
+        """Descend les scores g du départ jusqu'à l'arrivée"""
+        largeur = self.labyrinthe.largeur
+        scores_g = self.scores_g
+        index = self.i_depart
+        chemin = [(index % largeur, index // largeur)]
+        while index != self.i_arrivee:
+            index = min((index + decalage for decalage in self.decalages_par_masque[self.masques[index]]),
+                        key=scores_g.__getitem__)
+            chemin.append((index % largeur, index // largeur))
+        return chemin
+
+    def remplir_statistiques(self, statistiques: Dict):
+        statistiques['noeuds_explores'] = self.noeuds_explores
+        statistiques['noeuds_en_attente'] = sum(self.dans_liste)
+        statistiques['longueur_chemin'] = max(0, len(self.chemin) - 1)
+        # Une réparation peut développer moins de cellules que le chemin n'en compte
+        statistiques['efficacite'] = min(100, (len(self.chemin) / max(1, self.noeuds_explores)) * 100)
@@ -0,0 +1,68 @@
+"""Résolution de lots de labyrinthes sur une réserve de processus, sans interface
+
+Un travail est soit une spécification (largeur, hauteur, graine), éventuellement
+suivie de l'algorithme de génération, soit le chemin d'un fichier .mzb
+(fichier_labyrinthe). Seul le travail traverse la frontière entre processus :
+chaque processus génère le labyrinthe de sa spécification ou projette le
+fichier en mémoire (mmap), sans que la grille soit jamais sérialisée.
+"""
+import os
+import time
+from functools import partial
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from fichier_labyrinthe import LabyrintheProjete, ouvrir
+from labyrinthe import Labyrinthe
+from solveur import resoudre_a_star
+
+Travail = Union[str, Tuple]
+
+
+def preparer_labyrinthe(travail: Travail) -> Labyrinthe:
+    """Labyrinthe d'un travail : fichier projeté en mémoire, ou généré depuis sa spécification"""
+    if isinstance(travail, str):
+        return ouvrir(travail)
+    if len(travail) not in (3, 4):
+        raise ValueError(f"Spécification de labyrinthe invalide : {travail!r}")
+    return Labyrinthe(*travail)
+
+def resoudre_travail(travail: Travail, algorithme: str = 'a_star', heuristique: str = 'manhattan',
+                     **options) -> Dict:
+    """Prépare puis résout un travail et renvoie ses statistiques, avec le travail et le temps de préparation"""
+    debut = time.perf_counter()
+    labyrinthe = preparer_labyrinthe(travail)
+    temps_preparation = time.perf_counter() - debut
+
+    _, statistiques = resoudre_a_star(labyrinthe, algorithme=algorithme, heuristique=heuristique, **options)
+    if isinstance(labyrinthe, LabyrintheProjete):
+        labyrinthe.fermer()
+    statistiques['travail'] = travail
+    statistiques['largeur'] = labyrinthe.largeur
+    statistiques['hauteur'] = labyrinthe.hauteur
+    statistiques['temps_preparation'] = temps_preparation
+    return statistiques
+
+def resoudre_lot(travaux: Iterable[Travail], algorithme: str = 'a_star', heuristique: str = 'manhattan',
+                 processus: Optional[int] = None, **options) -> Iterator[Dict]:
+    """Résout `travaux` sur `processus` processus (os.cpu_count() par défaut) et produit les résultats au fil de l'eau
+
+    Les résultats arrivent dans l'ordre où les résolutions se terminent ;
+    la clé 'travail' de chacun indique le labyrinthe concerné. Avec
+    `processus` à 1, tout se fait dans le processus courant. `options`
+    est transmis à solveur.resoudre_a_star.
+    """
+    resoudre = partial(resoudre_travail, algorithme=algorithme, heuristique=heuristique, **options)
+    processus = processus or os.cpu_count() or 1
+    if processus == 1:
+        yield from map(resoudre, travaux)
+        return
+    with Pool(processus) as reserve:
+        yield from reserve.imap_unordered(resoudre, travaux)
+
+def mesurer_debit(travaux: Iterable[Travail], processus: int, **arguments) -> Tuple[float, float]:
+    """(labyrinthes par seconde, durée totale) d'un lot résolu sur `processus` processus"""
+    debut = time.perf_counter()
+    nombre = sum(1 for _ in resoudre_lot(travaux, processus=processus, **arguments))
+    duree = time.perf_counter() - debut
+    return nombre / duree, duree
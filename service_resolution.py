@@ -0,0 +1,232 @@
+"""Service local de résolution (asyncio) et client de test de charge
+
+Protocole : une requête JSON par ligne, une réponse JSON par ligne, sur une
+socket Unix ou TCP locale. Une requête désigne un labyrinthe soit par
+référence ('largeur', 'hauteur', 'graine', et 'generation' pour
+l'algorithme de génération), soit par contenu ('labyrinthe' : enregistrement
+JSON de ligne_commande), avec en option 'algorithme', 'heuristique',
+'options' (transmises à solveur.resoudre_a_star) et un 'id' renvoyé tel quel.
+La réponse contient 'chemin', 'statistiques' et 'source' : 'calcul',
+'cache' (solution déjà connue) ou 'partage' (requête identique déjà en
+cours), ou bien 'erreur'.
+
+    python service_resolution.py serveur --socket /tmp/maze_ai.sock
+    python service_resolution.py charge --socket /tmp/maze_ai.sock --requetes 2000
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from labyrinthe import ALGORITHMES_GENERATION, TAILLES_DIFFICULTE, Labyrinthe
+from ligne_commande import labyrinthe_depuis_json
+from solveur import ALGORITHMES, resoudre_a_star
+
+HOTE = '127.0.0.1'
+PORT = 8765
+# Solutions gardées en mémoire (les moins récemment demandées sont oubliées en premier)
+TAILLE_CACHE_SOLUTIONS = 1024
+# Taille maximale d'une ligne de requête ou de réponse (labyrinthes envoyés par contenu)
+LIMITE_LIGNE = 64 * 1024 * 1024
+# Plus petit côté d'un labyrinthe (bordure de murs, départ et arrivée)
+COTE_MIN = 3
+
+
+def verifier_dimensions(largeur: int, hauteur: int):
+    if largeur < COTE_MIN or hauteur < COTE_MIN:
+        raise ValueError(f"Labyrinthe {largeur}x{hauteur} trop petit (côté minimal {COTE_MIN})")
+
+def preparer_requete(requete: Dict) -> Tuple[Tuple, str]:
+    """(travail transmis aux processus, clé de cache) d'une requête, ValueError si elle est invalide
+
+    La clé est une empreinte SHA-256 du contenu du labyrinthe (murs,
+    dimensions, extrémités) ou de sa référence (génération, dimensions,
+    graine, qui le déterminent), et des paramètres de résolution.
+    """
+    if not isinstance(requete, dict):
+        raise ValueError("Une requête est un objet JSON")
+    algorithme = requete.get('algorithme', 'a_star')
+    if algorithme not in ALGORITHMES:
+        raise ValueError(f"Algorithme inconnu : {algorithme}")
+    heuristique = requete.get('heuristique', 'manhattan')
+    options = requete.get('options', {})
+    if not isinstance(options, dict):
+        raise ValueError("'options' est un objet JSON")
+
+    if 'labyrinthe' in requete:
+        labyrinthe = requete['labyrinthe']
+        if not isinstance(labyrinthe, dict):
+            raise ValueError("'labyrinthe' est un objet JSON")
+        try:
+            largeur, hauteur = int(labyrinthe['largeur']), int(labyrinthe['hauteur'])
+            extremites = [tuple(map(int, labyrinthe[nom])) for nom in ('depart', 'arrivee')]
+            murs = labyrinthe['murs']
+        except KeyError as erreur:
+            raise ValueError(f"Labyrinthe incomplet : {erreur.args[0]} manquant")
+        except TypeError:
+            raise ValueError("Dimensions, départ et arrivée du labyrinthe sont des entiers")
+        verifier_dimensions(largeur, hauteur)
+        for x, y in extremites:
+            if not (0 <= x < largeur and 0 <= y < hauteur):
+                raise ValueError(f"Extrémité ({x}, {y}) hors du labyrinthe {largeur}x{hauteur}")
+        source = ('contenu', labyrinthe)
+        identite = ['contenu', largeur, hauteur, *extremites, murs]
+    else:
+        try:
+            reference = (int(requete['largeur']), int(requete['hauteur']), int(requete['graine']),
+                         requete.get('generation', 'backtracker'))
+        except KeyError as erreur:
+            raise ValueError(f"Requête sans labyrinthe ni référence complète : {erreur.args[0]} manquant")
+        except TypeError:
+            raise ValueError("'largeur', 'hauteur' et 'graine' sont des entiers")
+        verifier_dimensions(*reference[:2])
+        if reference[3] not in ALGORITHMES_GENERATION:
+            raise ValueError(f"Algorithme de génération inconnu : {reference[3]}")
+        source = ('reference', reference)
+        identite = ['reference', *reference]
+
+    empreinte = json.dumps([identite, algorithme, heuristique, sorted(options.items())])
+    return (source, algorithme, heuristique, options), hashlib.sha256(empreinte.encode()).hexdigest()
+
+def resoudre_travail(travail: Tuple) -> Dict:
+    """Résout un travail de `preparer_requete` (exécuté dans un processus de la réserve)"""
+    (nature, donnees), algorithme, heuristique, options = travail
+    labyrinthe = labyrinthe_depuis_json(donnees) if nature == 'contenu' else Labyrinthe(*donnees)
+    chemin, statistiques = resoudre_a_star(labyrinthe, algorithme=algorithme, heuristique=heuristique, **options)
+    return {'chemin': [list(position) for position in chemin], 'statistiques': statistiques}
+
+
+class ServiceResolution:
+    """Serveur de résolution : réserve de processus, requêtes en double partagées et cache LRU des solutions"""
+    def __init__(self, processus: Optional[int] = None, taille_cache: int = TAILLE_CACHE_SOLUTIONS):
+        self.executeur = ProcessPoolExecutor(processus)
+        self.taille_cache = taille_cache
+        self.solutions = OrderedDict()
+        self.en_cours = {}
+
+    async def resoudre(self, requete: Dict) -> Dict:
+        travail, cle = preparer_requete(requete)
+        solution = self.solutions.get(cle)
+        if solution is not None:
+            self.solutions.move_to_end(cle)
+            return {**solution, 'source': 'cache'}
+
+        futur = self.en_cours.get(cle)
+        if futur is not None:
+            return {**(await asyncio.shield(futur)), 'source': 'partage'}
+
+        futur = asyncio.get_running_loop().run_in_executor(self.executeur, resoudre_travail, travail)
+        self.en_cours[cle] = futur
+        try:
+            solution = await futur
+        finally:
+            del self.en_cours[cle]
+        self.solutions[cle] = solution
+        if len(self.solutions) > self.taille_cache:
+            self.solutions.popitem(last=False)
+        return {**solution, 'source': 'calcul'}
+
+    async def servir_client(self, lecteur: asyncio.StreamReader, ecrivain: asyncio.StreamWriter):
+        """Répond aux requêtes d'une connexion, une ligne après l'autre"""
+        try:
+            while ligne := await lecteur.readline():
+                if not ligne.strip():
+                    continue
+                requete = {}
+                try:
+                    requete = json.loads(ligne)
+                    reponse = await self.resoudre(requete)
+                except Exception as erreur:
+                    # Requête invalide, ou toute erreur renvoyée par le processus de résolution
+                    reponse = {'erreur': str(erreur) or type(erreur).__name__, 'source': 'erreur'}
+                if isinstance(requete, dict) and 'id' in requete:
+                    reponse['id'] = requete['id']
+                ecrivain.write(json.dumps(reponse).encode() + b'\n')
+                await ecrivain.drain()
+        finally:
+            ecrivain.close()
+
+    async def servir(self, socket: Optional[str] = None, hote: str = HOTE, port: int = PORT):
+        """Écoute sur la socket Unix `socket`, ou sur (hote, port), jusqu'à l'annulation"""
+        if socket:
+            serveur = await asyncio.start_unix_server(self.servir_client, socket, limit=LIMITE_LIGNE)
+        else:
+            serveur = await asyncio.start_server(self.servir_client, hote, port, limit=LIMITE_LIGNE)
+        try:
+            async with serveur:
+                await serveur.serve_forever()
+        finally:
+            self.executeur.shutdown(cancel_futures=True)
+
+
+async def ouvrir_connexion(socket: Optional[str] = None, hote: str = HOTE,
+                           port: int = PORT) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    if socket:
+        return await asyncio.open_unix_connection(socket, limit=LIMITE_LIGNE)
+    return await asyncio.open_connection(hote, port, limit=LIMITE_LIGNE)
+
+def centile(valeurs: List[float], proportion: float) -> float:
+    """Centile `proportion` (entre 0 et 1) de `valeurs` triées, au rang le plus proche"""
+    return valeurs[min(len(valeurs) - 1, round(proportion * (len(valeurs) - 1)))]
+
+async def tester_charge(requetes: List[Dict], concurrence: int = 16, socket: Optional[str] = None,
+                        hote: str = HOTE, port: int = PORT) -> Dict:
+    """Envoie `requetes` sur `concurrence` connexions et résume débit et latences (ms)"""
+    latences = []
+    sources = {}
+    suivantes = iter(requetes)
+
+    async def client():
+        lecteur, ecrivain = await ouvrir_connexion(socket, hote, port)
+        try:
+            for requete in suivantes:
+                debut = time.perf_counter()
+                ecrivain.write(json.dumps(requete).encode() + b'\n')
+                await ecrivain.drain()
+                reponse = json.loads(await lecteur.readline())
+                latences.append((time.perf_counter() - debut) * 1000)
+                sources[reponse['source']] = sources.get(reponse['source'], 0) + 1
+        finally:
+            ecrivain.close()
+
+    debut = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrence)))
+    duree = time.perf_counter() - debut
+    latences.sort()
+    return {'requetes': len(latences), 'duree': duree, 'debit': len(latences) / duree,
+            'p50_ms': centile(latences, 0.5), 'p99_ms': centile(latences, 0.99), 'sources': sources}
+
+def requetes_test(nombre: int, distincts: int, difficulte: str = 'EXTREME') -> List[Dict]:
+    """`nombre` requêtes par référence réparties sur `distincts` labyrinthes (répétitions pour le cache)"""
+    largeur, hauteur = TAILLES_DIFFICULTE[difficulte]
+    return [{'id': rang, 'largeur': largeur, 'hauteur': hauteur, 'graine': rang % distincts}
+            for rang in range(nombre)]
+
+def main(arguments: Optional[List[str]] = None):
+    analyseur = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    analyseur.add_argument('commande', choices=('serveur', 'charge'))
+    analyseur.add_argument('--socket', help="Socket Unix (sinon TCP sur --hote et --port)")
+    analyseur.add_argument('--hote', default=HOTE)
+    analyseur.add_argument('--port', type=int, default=PORT)
+    analyseur.add_argument('--processus', type=int, help="Processus de résolution du serveur")
+    analyseur.add_argument('--requetes', type=int, default=1000, help="Requêtes du test de charge")
+    analyseur.add_argument('--distincts', type=int, default=100, help="Labyrinthes différents du test de charge")
+    analyseur.add_argument('--concurrence', type=int, default=16, help="Connexions simultanées du test de charge")
+    parametres = analyseur.parse_args(arguments)
+
+    if parametres.commande == 'serveur':
+        service = ServiceResolution(parametres.processus)
+        asyncio.run(service.servir(parametres.socket, parametres.hote, parametres.port))
+    else:
+        requetes = requetes_test(parametres.requetes, parametres.distincts)
+        resume = asyncio.run(tester_charge(requetes, parametres.concurrence, parametres.socket,
+                                           parametres.hote, parametres.port))
+        print(json.dumps(resume))
+
+
+if __name__ == "__main__":
+    main()
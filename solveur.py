@@ -0,0 +1,499 @@
+import heapq
+import time
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from heuristiques import fonction_heuristique
+from hierarchique import RechercheHierarchique
+from jonctions import RechercheJonctions
+from labyrinthe import Labyrinthe
+from memoire_bornee import RechercheIDAStar
+from points_de_saut import RecherchePointsDeSaut
+from recherche import Recherche
+from replanification import RechercheIncrementale
+
+
+def statistiques_vides() -> Dict:
+    """Dictionnaire de statistiques partagé par le solveur et l'agent visuel"""
+    return {
+        'noeuds_explores': 0,
+        'noeuds_en_attente': 0,
+        'longueur_chemin': 0,
+        'temps_execution': 0,
+        'efficacite': 0,
+        # Plus grand nombre de cellules mémorisées à la fois (recherches à mémoire bornée seulement)
+        'memoire_pic': 0
+    }
+
+# Départage des nœuds de même f dans la liste ouverte : ordre d'insertion,
+# dernier inséré d'abord, plus grand g ou plus petit h
+DEPARTAGES = ('fifo', 'lifo', 'g_max', 'h_min')
+
+# Poids de l'heuristique des variantes sous-optimales enregistrées dans ALGORITHMES
+POIDS_PONDERE = 2
+GLOUTON = float('inf')
+
+def heuristique_manhattan(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
+    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+class FileTas:
+    """Liste ouverte en tas binaire (heapq) de tuples (f, départage, indice)
+
+    Le départage est choisi une fois pour toutes : `ajouter` désigne
+    directement la variante qui construit la clé secondaire, sans test
+    à chaque insertion.
+    """
+    def __init__(self, departage: str = 'fifo'):
+        if departage not in DEPARTAGES:
+            raise ValueError(f"Départage inconnu : {departage}")
+        self.tas = []
+        self.compteur = 0
+        self.ajouter = getattr(self, 'ajouter_' + departage)
+
+    def __len__(self) -> int:
+        return len(self.tas)
+
+    def ajouter_fifo(self, f: int, g: int, h: int, index: int):
+        self.compteur += 1
+        heapq.heappush(self.tas, (f, self.compteur, index))
+
+    def ajouter_lifo(self, f: int, g: int, h: int, index: int):
+        self.compteur -= 1
+        heapq.heappush(self.tas, (f, self.compteur, index))
+
+    def ajouter_g_max(self, f: int, g: int, h: int, index: int):
+        heapq.heappush(self.tas, (f, -g, index))
+
+    def ajouter_h_min(self, f: int, g: int, h: int, index: int):
+        heapq.heappush(self.tas, (f, h, index))
+
+    def extraire(self) -> int:
+        """Indice de plus petite clé, -1 si la file est vide"""
+        return heapq.heappop(self.tas)[2] if self.tas else -1
+
+class FileSeaux:
+    """File de priorité à seaux (Dial) pour des clés f entières
+
+    seaux[f] associe à chaque rang une pile non vide de cellules : on sort
+    toujours du plus petit f non vide, puis dans ce seau de la pile de plus
+    grand rang, repérée par rangs_max[f] qui ne fait que redescendre
+    jusqu'au prochain ajout de rang supérieur. Le rang vaut g pour 'g_max'
+    (cellule la plus avancée d'abord), -h pour 'h_min' et 0 pour 'fifo' /
+    'lifo', qui ne gardent qu'une pile par seau, lue par le bas ou par le
+    haut. Ajout et extraction sont en O(1) amorti, sans comparaison de
+    tuples ; avec une heuristique cohérente, les f extraits ne décroissent
+    jamais et les seaux ne sont parcourus qu'une fois.
+    """
+    def __init__(self, departage: str = 'g_max'):
+        if departage not in DEPARTAGES:
+            raise ValueError(f"Départage inconnu : {departage}")
+        self.seaux = []
+        self.rangs_max = []
+        self.f_courant = 0
+        self.taille = 0
+        # rang = coef_g * g + coef_h * h
+        self.coef_g = 1 if departage == 'g_max' else 0
+        self.coef_h = -1 if departage == 'h_min' else 0
+        # Piles lues par le bas en FIFO (deque), par le haut sinon
+        self.nouvelle_pile = deque if departage == 'fifo' else list
+        self.retirer = deque.popleft if departage == 'fifo' else list.pop
+
+    def __len__(self) -> int:
+        return self.taille
+
+    def ajouter(self, f: int, g: int, h: int, index: int):
+        seaux = self.seaux
+        while len(seaux) <= f:
+            seaux.append({})
+            self.rangs_max.append(0)
+        piles = seaux[f]
+        rang = self.coef_g * g + self.coef_h * h
+        if not piles or rang > self.rangs_max[f]:
+            self.rangs_max[f] = rang
+        pile = piles.get(rang)
+        if pile is None:
+            piles[rang] = pile = self.nouvelle_pile()
+        pile.append(index)
+        if f < self.f_courant:
+            self.f_courant = f
+        self.taille += 1
+
+    def extraire(self) -> int:
+        """Indice de plus petit f (plus grand rang à égalité), -1 si la file est vide"""
+        if not self.taille:
+            return -1
+        seaux = self.seaux
+        f = self.f_courant
+        while not seaux[f]:
+            f += 1
+        self.f_courant = f
+
+        piles = seaux[f]
+        rang = self.rangs_max[f]
+        while rang not in piles:
+            rang -= 1
+        self.rangs_max[f] = rang
+        pile = piles[rang]
+        index = self.retirer(pile)
+        if not pile:
+            del piles[rang]
+        self.taille -= 1
+        return index
+
+class RechercheAStar(Recherche):
+    """Cœur de recherche A* sur indices à plat, sans objet nœud
+
+    Les scores g et les parents sont stockés dans des tableaux préalloués
+    indexés par cellule ; la liste ouverte est une `classe_file` (FileTas,
+    FileSeaux pour RechercheAStarSeaux) qui départage les f égaux selon
+    `departage`. Une cellule est développée au plus une fois.
+    `heuristique` est un nom de heuristiques.HEURISTIQUES, `departage` un
+    nom de DEPARTAGES.
+
+    Avec `poids` > 1, f = g + poids * h (A* pondéré) : la recherche fonce
+    vers l'arrivée et le chemin renvoyé coûte au plus `poids` fois
+    l'optimum. `poids`=GLOUTON ne garde que h (meilleur d'abord glouton,
+    sans borne). Moins de nœuds développés, c'est une `efficacite` plus
+    haute ; la longueur du chemin dit ce que la borne a coûté.
+    """
+    classe_file = FileTas
+    options = ('departage', 'poids')
+
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan',
+                 departage: str = 'fifo',
+                 poids: float = 1):
+        if poids < 1:
+            raise ValueError(f"Le poids de l'heuristique doit valoir au moins 1 : {poids}")
+
+        super().__init__(labyrinthe, depart, arrivee, heuristique)
+        self.departage = departage
+        self.poids = poids
+        # f = poids_g * g + poids_h * h ; entiers tant que le poids l'est
+        self.poids_g, self.poids_h = (0, 1) if poids == GLOUTON else (1, poids)
+
+        nombre_cellules = labyrinthe.largeur * labyrinthe.hauteur
+        self.scores_g = array('i', [-1]) * nombre_cellules  # -1 : cellule jamais atteinte
+        self.parents = array('i', [-1]) * nombre_cellules
+        self.fermes = bytearray(nombre_cellules)
+        self.masques = labyrinthe.masques
+        self.decalages_par_masque = labyrinthe.decalages_par_masque
+
+        self.i_depart = labyrinthe.index(*self.depart)
+        self.i_arrivee = labyrinthe.index(*self.arrivee)
+        self.scores_g[self.i_depart] = 0
+        self.liste_ouverte = self.classe_file(departage)
+        h_depart = self.h(self.i_depart)
+        if h_depart != -1:
+            self.liste_ouverte.ajouter(self.poids_h * h_depart, 0, h_depart, self.i_depart)
+
+    def etape(self) -> int:
+        """Développe le meilleur nœud ouvert et renvoie son indice (-1 si la liste ouverte est vide)"""
+        liste_ouverte = self.liste_ouverte
+        fermes = self.fermes
+        extraire = liste_ouverte.extraire
+
+        # Ignorer les entrées périmées des cellules déjà développées
+        while True:
+            courant = extraire()
+            if courant == -1:
+                return -1
+            if not fermes[courant]:
+                break
+
+        fermes[courant] = 1
+        self.noeuds_explores += 1
+
+        if courant == self.i_arrivee:
+            self.chemin = self.reconstruire_chemin(courant)
+            self.termine = True
+            return courant
+
+        largeur = self.labyrinthe.largeur
+        arrivee_x, arrivee_y = self.arrivee
+        heuristique = self.heuristique
+        scores_g = self.scores_g
+        parents = self.parents
+        ajouter = liste_ouverte.ajouter
+        poids_h = self.poids_h
+        g_nouveau = scores_g[courant] + 1
+        f_g = self.poids_g * g_nouveau
+
+        for decalage in self.decalages_par_masque[self.masques[courant]]:
+            voisin = courant + decalage
+            if fermes[voisin]:
+                continue
+            g_voisin = scores_g[voisin]
+            if g_voisin == -1 or g_nouveau < g_voisin:
+                if heuristique is None:
+                    voisin_y, voisin_x = divmod(voisin, largeur)
+                    h = abs(voisin_x - arrivee_x) + abs(voisin_y - arrivee_y)
+                else:
+                    h = heuristique(voisin)
+                    if h == -1:
+                        continue
+                scores_g[voisin] = g_nouveau
+                parents[voisin] = courant
+                ajouter(f_g + poids_h * h, g_nouveau, h, voisin)
+
+        return courant
+
+    def voisins_ouverts(self, courant: int) -> List[int]:
+        """Cellules ouvertes (ou améliorées) par le développement de `courant`"""
+        parents = self.parents
+        return [voisin for voisin in self.labyrinthe.obtenir_voisins_index(courant)
+                if parents[voisin] == courant]
+
+    def reconstruire_chemin(self, index: int) -> List[Tuple[int, int]]:
+        largeur = self.labyrinthe.largeur
+        parents = self.parents
+        chemin = []
+        while index != -1:
+            chemin.append((index % largeur, index // largeur))
+            index = parents[index]
+        chemin.reverse()
+        return chemin
+
+    def remplir_statistiques(self, statistiques: Dict):
+        statistiques['noeuds_explores'] = self.noeuds_explores
+        statistiques['noeuds_en_attente'] = len(self.liste_ouverte)
+        statistiques['longueur_chemin'] = max(0, len(self.chemin) - 1)
+        statistiques['efficacite'] = (len(self.chemin) / max(1, self.noeuds_explores)) * 100
+
+class RechercheAStarSeaux(RechercheAStar):
+    """A* identique à RechercheAStar, avec une FileSeaux comme liste ouverte (f entiers seulement)"""
+    classe_file = FileSeaux
+
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan',
+                 departage: str = 'g_max',
+                 poids: float = 1):
+        if poids != GLOUTON and poids != int(poids):
+            raise ValueError(f"La file à seaux demande un poids entier : {poids}")
+        super().__init__(labyrinthe, depart, arrivee, heuristique, departage,
+                         poids if poids == GLOUTON else int(poids))
+
+
+class RechercheAStarPonderee(RechercheAStar):
+    """A* pondéré (POIDS_PONDERE par défaut) : chemin au plus `poids` fois plus long que l'optimum"""
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan',
+                 departage: str = 'g_max',
+                 poids: float = POIDS_PONDERE):
+        super().__init__(labyrinthe, depart, arrivee, heuristique, departage, poids)
+
+
+class RechercheGloutonne(RechercheAStar):
+    """Meilleur d'abord glouton (poids GLOUTON par défaut) : liste ouverte triée par h seul, sans borne"""
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan',
+                 departage: str = 'g_max',
+                 poids: float = GLOUTON):
+        super().__init__(labyrinthe, depart, arrivee, heuristique, departage, poids)
+
+
+class RechercheBidirectionnelle(Recherche):
+    """A* bidirectionnel : une frontière part du départ, l'autre de l'arrivée
+
+    Chaque côté a ses propres tableaux g / parents / fermés et sa propre liste
+    ouverte ; on développe à chaque étape le côté dont la liste ouverte est
+    la plus petite. Les deux côtés utilisent les potentiels moyens
+    p(v) = (h_arrivee(v) - h_depart(v)) / 2 (et -p pour la frontière arrière),
+    cohérents et opposés : la recherche équivaut alors à un Dijkstra
+    bidirectionnel sur coûts réduits, qui s'arrête dès que la somme des deux
+    plus petites clés atteint `meilleur_cout`, le coût du meilleur chemin
+    connu passant par une cellule atteinte des deux côtés. Les clés sont
+    doublées pour rester entières. Avec `heuristique`='exacte', h_arrivee
+    et h_depart sont les champs de distances BFS vers chaque extrémité.
+    """
+    AVANT = 0
+    ARRIERE = 1
+
+    def __init__(self, labyrinthe: Labyrinthe,
+                 depart: Optional[Tuple[int, int]] = None,
+                 arrivee: Optional[Tuple[int, int]] = None,
+                 heuristique: str = 'manhattan'):
+        super().__init__(labyrinthe, depart, arrivee, heuristique)
+        self.heuristique_arrivee = self.heuristique
+        self.heuristique_depart = fonction_heuristique(labyrinthe, heuristique, self.depart)
+
+        nombre_cellules = labyrinthe.largeur * labyrinthe.hauteur
+        self.scores_g = (array('i', [-1]) * nombre_cellules, array('i', [-1]) * nombre_cellules)
+        self.parents = (array('i', [-1]) * nombre_cellules, array('i', [-1]) * nombre_cellules)
+        self.fermes = (bytearray(nombre_cellules), bytearray(nombre_cellules))
+        self.masques = labyrinthe.masques
+        self.decalages_par_masque = labyrinthe.decalages_par_masque
+
+        self.i_depart = labyrinthe.index(*self.depart)
+        self.i_arrivee = labyrinthe.index(*self.arrivee)
+        self.scores_g[self.AVANT][self.i_depart] = 0
+        self.scores_g[self.ARRIERE][self.i_arrivee] = 0
+        self.listes_ouvertes = ([(self.potentiel_double(self.i_depart, self.AVANT), 0, self.i_depart)],
+                                [(self.potentiel_double(self.i_arrivee, self.ARRIERE), 0, self.i_arrivee)])
+        self.compteur = 0
+
+        self.meilleur_cout = -1  # -1 : les deux frontières ne se sont pas encore rejointes
+        self.jonction = -1
+        if self.i_depart == self.i_arrivee:
+            self.meilleur_cout, self.jonction = 0, self.i_depart
+        self.dernier_cote = self.AVANT
+
+    def potentiel_double(self, index: int, cote: int) -> int:
+        """2 * p(v) pour la frontière avant, -2 * p(v) pour la frontière arrière"""
+        if self.heuristique_arrivee is None:
+            position = self.labyrinthe.position(index)
+            potentiel = heuristique_manhattan(position, self.arrivee) - heuristique_manhattan(position, self.depart)
+        else:
+            potentiel = self.heuristique_arrivee(index) - self.heuristique_depart(index)
+        return potentiel if cote == self.AVANT else -potentiel
+
+    def etape(self) -> int:
+        """Développe un nœud d'une des deux frontières et renvoie son indice (-1 si plus rien à explorer)"""
+        ouverte_avant, ouverte_arriere = self.listes_ouvertes
+        if not ouverte_avant or not ouverte_arriere:
+            return -1
+
+        cote = self.AVANT if len(ouverte_avant) <= len(ouverte_arriere) else self.ARRIERE
+        liste_ouverte = self.listes_ouvertes[cote]
+        fermes = self.fermes[cote]
+
+        # Ignorer les entrées périmées des cellules déjà développées de ce côté
+        while liste_ouverte:
+            courant = heapq.heappop(liste_ouverte)[2]
+            if not fermes[courant]:
+                break
+        else:
+            return -1
+
+        fermes[courant] = 1
+        self.noeuds_explores += 1
+        self.dernier_cote = cote
+
+        largeur = self.labyrinthe.largeur
+        arrivee_x, arrivee_y = self.arrivee
+        depart_x, depart_y = self.depart
+        signe = 1 if cote == self.AVANT else -1
+        heuristique_arrivee, heuristique_depart = self.heuristique_arrivee, self.heuristique_depart
+        scores_g = self.scores_g[cote]
+        scores_g_oppose = self.scores_g[1 - cote]
+        parents = self.parents[cote]
+        g_nouveau = scores_g[courant] + 1
+
+        for decalage in self.decalages_par_masque[self.masques[courant]]:
+            voisin = courant + decalage
+            if fermes[voisin]:
+                continue
+            g_voisin = scores_g[voisin]
+            if g_voisin == -1 or g_nouveau < g_voisin:
+                if heuristique_arrivee is None:
+                    voisin_y, voisin_x = divmod(voisin, largeur)
+                    potentiel = signe * (abs(voisin_x - arrivee_x) + abs(voisin_y - arrivee_y)
+                                         - abs(voisin_x - depart_x) - abs(voisin_y - depart_y))
+                else:
+                    h_arrivee, h_depart = heuristique_arrivee(voisin), heuristique_depart(voisin)
+                    if h_arrivee == -1 or h_depart == -1:
+                        continue
+                    potentiel = signe * (h_arrivee - h_depart)
+                scores_g[voisin] = g_nouveau
+                parents[voisin] = courant
+                self.compteur += 1
+                heapq.heappush(liste_ouverte, (2 * g_nouveau + potentiel, self.compteur, voisin))
+
+                # Jonction des deux frontières
+                g_oppose = scores_g_oppose[voisin]
+                if g_oppose != -1 and (self.meilleur_cout == -1 or g_nouveau + g_oppose < self.meilleur_cout):
+                    self.meilleur_cout = g_nouveau + g_oppose
+                    self.jonction = voisin
+
+        if self.meilleur_cout != -1 and (not ouverte_avant or not ouverte_arriere or
+                                         ouverte_avant[0][0] + ouverte_arriere[0][0] >= 2 * self.meilleur_cout):
+            self.chemin = self.reconstruire_chemin(self.jonction)
+            self.termine = True
+
+        return courant
+
+    def voisins_ouverts(self, courant: int) -> List[int]:
+        """Cellules ouvertes (ou améliorées) par le dernier développement de `courant`"""
+        parents = self.parents[self.dernier_cote]
+        return [voisin for voisin in self.labyrinthe.obtenir_voisins_index(courant)
+                if parents[voisin] == courant]
+
+    def reconstruire_chemin(self, jonction: int) -> List[Tuple[int, int]]:
+        largeur = self.labyrinthe.largeur
+        parents_avant, parents_arriere = self.parents
+
+        # Du départ jusqu'à la jonction, puis de la jonction jusqu'à l'arrivée
+        chemin = []
+        index = jonction
+        while index != -1:
+            chemin.append((index % largeur, index // largeur))
+            index = parents_avant[index]
+        chemin.reverse()
+
+        index = parents_arriere[jonction]
+        while index != -1:
+            chemin.append((index % largeur, index // largeur))
+            index = parents_arriere[index]
+        return chemin
+
+    def remplir_statistiques(self, statistiques: Dict):
+        statistiques['noeuds_explores'] = self.noeuds_explores
+        statistiques['noeuds_en_attente'] = sum(len(liste) for liste in self.listes_ouvertes)
+        statistiques['longueur_chemin'] = max(0, len(self.chemin) - 1)
+        # Les frontières se rejoignent pendant la relaxation : le chemin peut compter plus de cellules que de développements
+        statistiques['efficacite'] = min(100, (len(self.chemin) / max(1, self.noeuds_explores)) * 100)
+
+# Algorithmes de recherche sélectionnables par nom
+ALGORITHMES = {
+    'a_star': RechercheAStar,
+    'a_star_seaux': RechercheAStarSeaux,
+    'a_star_pondere': RechercheAStarPonderee,
+    'glouton': RechercheGloutonne,
+    'bidirectionnel': RechercheBidirectionnelle,
+    'jonctions': RechercheJonctions,
+    'incremental': RechercheIncrementale,
+    'jps': RecherchePointsDeSaut,
+    'hierarchique': RechercheHierarchique,
+    'ida_star': RechercheIDAStar
+}
+
+def resoudre_a_star(labyrinthe: Labyrinthe,
+                    depart: Optional[Tuple[int, int]] = None,
+                    arrivee: Optional[Tuple[int, int]] = None,
+                    algorithme: str = 'a_star',
+                    heuristique: str = 'manhattan',
+                    **options) -> Tuple[List[Tuple[int, int]], Dict]:
+    """Exécute A* en un seul appel, sans effet visuel, et renvoie (chemin, statistiques)
+
+    `algorithme` est une clé de ALGORITHMES ('a_star', 'a_star_seaux', 'a_star_pondere',
+    'glouton', 'bidirectionnel', 'jonctions', 'incremental', 'jps', 'hierarchique',
+    'ida_star'), `heuristique` un nom de heuristiques.HEURISTIQUES ('manhattan',
+    'exacte', 'reperes' ; 'manhattan' seulement pour 'incremental'). `options` est
+    transmis au constructeur de la recherche : `departage` et `poids` pour la famille
+    A* ('a_star', 'a_star_seaux', 'a_star_pondere', 'glouton'), `taille_table` pour
+    'ida_star'.
+    """
+    classe = ALGORITHMES[algorithme]
+    inconnues = sorted(set(options) - set(classe.options))
+    if inconnues:
+        raise ValueError(f"Options non prises en charge par '{algorithme}' : {', '.join(inconnues)}")
+
+    statistiques = statistiques_vides()
+    temps_debut = time.perf_counter()
+
+    recherche = classe(labyrinthe, depart, arrivee, heuristique, **options)
+    chemin = recherche.executer()
+
+    statistiques['temps_execution'] = time.perf_counter() - temps_debut
+    recherche.remplir_statistiques(statistiques)
+
+    return chemin, statistiques
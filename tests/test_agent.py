@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip('pygame')
+
+from main import AgentIAAAA, EffetsVisuelsAAA, LabyrintheAAA
+from solveur import ALGORITHMES, resoudre_a_star
+
+
+def derouler(agent: AgentIAAAA) -> list:
+    """Lance la recherche pas à pas jusqu'au bout (comme ESPACE puis AUTO) et renvoie le chemin trouvé"""
+    agent.reinitialiser()
+    while agent.a_star_pas_a_pas():
+        pass
+    return agent.chemin_final
+
+@pytest.mark.parametrize('algorithme', list(ALGORITHMES))
+def test_rejeu_garde_le_chemin(algorithme):
+    """Relancée après RESET, la recherche est rejouée depuis son enregistrement avec le même chemin"""
+    effets = EffetsVisuelsAAA()
+    labyrinthe = LabyrintheAAA(30, 20, effets, graine=3)
+    agent = AgentIAAAA(labyrinthe, effets, algorithme)
+    chemin = list(derouler(agent))
+    assert chemin and len(chemin) == len(resoudre_a_star(labyrinthe)[0])
+    assert agent.rejeu is None
+
+    for _ in range(2):
+        assert derouler(agent) == chemin
+        assert agent.rejeu is not None and agent.algorithme_termine
+    # Nouvel agent (changement d'algorithme puis retour) : même enregistrement, même chemin
+    assert derouler(AgentIAAAA(labyrinthe, effets, algorithme)) == chemin
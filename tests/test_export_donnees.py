@@ -0,0 +1,47 @@
+import json
+import os
+
+import pytest
+
+from export_donnees import MANIFESTE, exporter
+
+
+def lire_manifeste(dossier) -> list:
+    with open(os.path.join(dossier, MANIFESTE)) as manifeste:
+        return [json.loads(ligne) for ligne in manifeste]
+
+def graines(dossier) -> list:
+    """Graines des échantillons de tous les fragments bruts, dans l'ordre du manifeste"""
+    resultat = []
+    for entree in lire_manifeste(dossier):
+        tableau = entree['tableaux']['graines']
+        with open(os.path.join(dossier, entree['fichier']), 'rb') as fichier:
+            fichier.seek(tableau['decalage'])
+            octets = fichier.read(8 * tableau['forme'][0])
+        resultat.extend(int.from_bytes(octets[i:i + 8], 'little', signed=True) for i in range(0, len(octets), 8))
+    return resultat
+
+def contenu_fragments(dossier) -> dict:
+    return {nom: open(os.path.join(dossier, nom), 'rb').read()
+            for nom in sorted(os.listdir(dossier)) if nom != MANIFESTE}
+
+def test_reprise_identique(tmp_path):
+    """Un export repris contient les mêmes échantillons qu'un export d'une traite"""
+    complet, repris = str(tmp_path / 'complet'), str(tmp_path / 'repris')
+    assert exporter(complet, 21, 15, 10, graine=3, taille_fragment=4, format='brut', processus=1) == 10
+    assert exporter(repris, 21, 15, 6, graine=3, taille_fragment=4, format='brut', processus=1) == 6
+    assert exporter(repris, 21, 15, 10, graine=3, taille_fragment=4, format='brut', processus=1) == 10
+    assert graines(repris) == graines(complet) == list(range(3, 13))
+    assert [entree['echantillons'] for entree in lire_manifeste(repris)] == [4, 2, 4]
+    assert all((entree['graine'], entree['algorithme']) == (3, 'backtracker') for entree in lire_manifeste(repris))
+
+@pytest.mark.parametrize('parametres', [{'graine': 4}, {'algorithme': 'eller'}, {'largeur': 23}])
+def test_reprise_refusee(tmp_path, parametres):
+    """Relancé avec d'autres paramètres, l'export refuse de compléter les fragments existants"""
+    dossier = str(tmp_path)
+    arguments = {'largeur': 21, 'hauteur': 15, 'graine': 3, 'algorithme': 'backtracker'}
+    exporter(dossier, nombre=2, taille_fragment=4, format='brut', processus=1, **arguments)
+    avant = contenu_fragments(dossier)
+    with pytest.raises(ValueError):
+        exporter(dossier, nombre=4, taille_fragment=4, format='brut', processus=1, **{**arguments, **parametres})
+    assert contenu_fragments(dossier) == avant
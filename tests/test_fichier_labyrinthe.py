@@ -0,0 +1,59 @@
+import io
+
+import pytest
+
+from fichier_labyrinthe import charger, enregistrer, lire_flux, ouvrir
+from heuristiques import champ_distances
+from labyrinthe import Labyrinthe, TypeCellule
+from solveur import resoudre_a_star
+
+
+@pytest.fixture
+def labyrinthe():
+    """Labyrinthe dont les extrémités ne sont pas celles par défaut"""
+    labyrinthe = Labyrinthe(41, 23, graine=5, algorithme='eller')
+    grille = labyrinthe.grille
+    grille[labyrinthe.index(*labyrinthe.depart)] = grille[labyrinthe.index(*labyrinthe.arrivee)] = TypeCellule.VIDE
+    labyrinthe.depart, labyrinthe.arrivee = (39, 1), (1, 21)
+    grille[labyrinthe.index(*labyrinthe.depart)] = TypeCellule.DEPART
+    grille[labyrinthe.index(*labyrinthe.arrivee)] = TypeCellule.ARRIVEE
+    return labyrinthe
+
+def verifier_copie(copie: Labyrinthe, labyrinthe: Labyrinthe):
+    assert (copie.largeur, copie.hauteur, copie.graine) == (labyrinthe.largeur, labyrinthe.hauteur, labyrinthe.graine)
+    assert (copie.depart, copie.arrivee) == (labyrinthe.depart, labyrinthe.arrivee)
+    assert bytes(copie.grille) == bytes(labyrinthe.grille)
+    assert bytes(copie.masques) == bytes(labyrinthe.masques)
+    assert resoudre_a_star(copie)[0] == resoudre_a_star(labyrinthe)[0]
+
+@pytest.mark.parametrize('masques', [True, False])
+@pytest.mark.parametrize('distances', [True, False])
+def test_aller_retour_fichier(labyrinthe, tmp_path, masques, distances):
+    chemin = tmp_path / 'labyrinthe.mzb'
+    with open(chemin, 'wb') as fichier:
+        taille = enregistrer(labyrinthe, fichier, masques, distances)
+    assert chemin.stat().st_size == taille
+
+    with ouvrir(str(chemin)) as projete:
+        verifier_copie(projete, labyrinthe)
+        assert list(champ_distances(projete, projete.arrivee)) == list(champ_distances(labyrinthe, labyrinthe.arrivee))
+
+    copie = charger(str(chemin))
+    verifier_copie(copie, labyrinthe)
+    # La copie est modifiable, sans toucher au fichier
+    copie.basculer_mur(2, 1)
+    with ouvrir(str(chemin)) as projete:
+        assert bytes(projete.grille) == bytes(labyrinthe.grille)
+        with pytest.raises(ValueError):
+            projete.basculer_mur(2, 1)
+
+def test_aller_retour_flux(labyrinthe):
+    flux = io.BytesIO()
+    autre = Labyrinthe(9, 31, graine=2)
+    enregistrer(labyrinthe, flux, distances=True)
+    enregistrer(autre, flux, masques=False)
+    flux.seek(0)
+    relus = list(lire_flux(flux))
+    assert len(relus) == 2
+    verifier_copie(relus[0], labyrinthe)
+    verifier_copie(relus[1], autre)
@@ -0,0 +1,23 @@
+import pytest
+
+from hierarchique import TAILLE_CLUSTER, GrapheHierarchique
+from labyrinthe import BAS, DROITE, Labyrinthe
+from solveur import resoudre_a_star
+
+
+@pytest.mark.parametrize('largeur, hauteur', [(12, 21), (TAILLE_CLUSTER, 61), (61, TAILLE_CLUSTER), (61, 61)])
+@pytest.mark.parametrize('graine', range(5))
+def test_hierarchique_comme_a_star(largeur, hauteur, graine):
+    """Labyrinthe parfait : HPA* trouve un chemin de même longueur qu'A*, même sur une seule colonne de clusters"""
+    labyrinthe = Labyrinthe(largeur, hauteur, graine)
+    chemin, _ = resoudre_a_star(labyrinthe, algorithme='hierarchique')
+    assert chemin
+    assert len(chemin) == len(resoudre_a_star(labyrinthe)[0])
+
+def test_une_colonne_de_clusters():
+    """Avec une seule colonne, les frontières entre clusters superposés sont horizontales (BAS) et ont des transitions"""
+    graphe = GrapheHierarchique(Labyrinthe(12, 21, graine=7))
+    assert graphe.colonnes == 1
+    assert graphe.frontieres(0) == [(0, 1, BAS)]
+    assert all(direction != DROITE for _, _, direction in graphe.transitions)
+    assert graphe.transitions[(0, 1, BAS)]
@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+import pytest
+
+from labyrinthe import Labyrinthe
+from ligne_commande import labyrinthe_vers_json
+from service_resolution import ServiceResolution, ouvrir_connexion, preparer_requete
+from solveur import resoudre_a_star
+
+
+def requete_contenu(**modifications) -> dict:
+    return {'labyrinthe': {**labyrinthe_vers_json(Labyrinthe(21, 15, graine=1)), **modifications}}
+
+@pytest.mark.parametrize('requete', [
+    requete_contenu(depart=[40, 3]),
+    requete_contenu(arrivee=[-1, 0]),
+    requete_contenu(largeur=0),
+    {'largeur': 0, 'hauteur': 10, 'graine': 1},
+    {'largeur': 21, 'hauteur': None, 'graine': 1},
+    {'largeur': 21, 'hauteur': 15, 'graine': 1, 'generation': 'inconnue'},
+    {'largeur': 21, 'hauteur': 15},
+    {'labyrinthe': []},
+])
+def test_requete_invalide(requete):
+    with pytest.raises(ValueError):
+        preparer_requete(requete)
+
+def test_reponses_erreur(tmp_path):
+    """Toute requête en échec reçoit une réponse 'erreur' et la connexion reste ouverte"""
+    socket = str(tmp_path / 'service.sock')
+    requetes = [
+        requete_contenu(depart=[40, 3]),
+        {'largeur': 0, 'hauteur': 0, 'graine': 1},
+        # Erreur levée dans le processus de résolution (option inconnue)
+        {'largeur': 21, 'hauteur': 15, 'graine': 1, 'options': {'inconnue': 1}},
+        'pas un objet',
+        {'id': 7, 'largeur': 21, 'hauteur': 15, 'graine': 1},
+    ]
+
+    async def scenario():
+        service = ServiceResolution(processus=1)
+        serveur = asyncio.create_task(service.servir(socket))
+        try:
+            for _ in range(100):
+                try:
+                    lecteur, ecrivain = await ouvrir_connexion(socket)
+                    break
+                except (FileNotFoundError, ConnectionRefusedError):
+                    await asyncio.sleep(0.05)
+            reponses = []
+            for requete in requetes:
+                ecrivain.write(json.dumps(requete).encode() + b'\n')
+                await ecrivain.drain()
+                ligne = await asyncio.wait_for(lecteur.readline(), 30)
+                assert ligne, "Connexion fermée par le serveur"
+                reponses.append(json.loads(ligne))
+            ecrivain.close()
+            return reponses
+        finally:
+            serveur.cancel()
+            await asyncio.gather(serveur, return_exceptions=True)
+
+    reponses = asyncio.run(scenario())
+    assert [reponse['source'] for reponse in reponses] == ['erreur'] * 4 + ['calcul']
+    assert all(reponse['erreur'] for reponse in reponses[:4])
+    assert reponses[4]['id'] == 7
+    chemin, _ = resoudre_a_star(Labyrinthe(21, 15, 1))
+    assert reponses[4]['chemin'] == [list(position) for position in chemin]